@@ -0,0 +1,86 @@
+"""
+Compares throughput and output of FastMarkdownConverter with markdownify on saved pages. Corpus is a
+directory with .html files or pages saved by PageCache (.html.gz), by default the page cache.
+
+    python -m benchmarks.converter --corpus ~/.cache/parsera/pages --runs 3
+"""
+
+import argparse
+import difflib
+import gzip
+import time
+from pathlib import Path
+
+from markdownify import MarkdownConverter
+
+from parsera.cache import DEFAULT_CACHE_DIR
+from parsera.engine.converter import FastMarkdownConverter
+
+
+def load_corpus(directory: Path) -> dict[str, str]:
+    pages = {}
+    for path in sorted(directory.glob("*.html")):
+        pages[path.name] = path.read_text(encoding="utf-8", errors="replace")
+    for path in sorted(directory.glob("*.html.gz")):
+        pages[path.name] = gzip.decompress(path.read_bytes()).decode("utf-8")
+    return pages
+
+
+def measure(converter, pages: dict[str, str], runs: int) -> tuple[float, dict]:
+    outputs = {}
+    started = time.perf_counter()
+    for _ in range(runs):
+        for name, html in pages.items():
+            outputs[name] = converter.convert(html)
+    return time.perf_counter() - started, outputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--show-diffs", action="store_true", help="print diffs of mismatching pages"
+    )
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus.expanduser())
+    if not pages:
+        raise SystemExit(f"No pages found in {args.corpus}")
+    size_mb = sum(len(html.encode("utf-8")) for html in pages.values()) / 1e6
+    print(f"Corpus: {len(pages)} pages, {size_mb:.1f} MB, {args.runs} runs")
+
+    reference_time, reference = measure(MarkdownConverter(), pages, args.runs)
+    fast_time, fast = measure(FastMarkdownConverter(), pages, args.runs)
+    for name, elapsed in (("markdownify", reference_time), ("fast", fast_time)):
+        print(f"{name:>12}: {size_mb * args.runs / elapsed:.2f} MB/s")
+    print(f"     speedup: {reference_time / fast_time:.1f}x")
+
+    identical = 0
+    similarities = []
+    for name in pages:
+        if reference[name] == fast[name]:
+            identical += 1
+            similarities.append(1.0)
+            continue
+        matcher = difflib.SequenceMatcher(
+            None, reference[name].splitlines(), fast[name].splitlines(), autojunk=False
+        )
+        similarities.append(matcher.ratio())
+        if args.show_diffs:
+            diff = difflib.unified_diff(
+                reference[name].splitlines(),
+                fast[name].splitlines(),
+                fromfile=f"{name} (markdownify)",
+                tofile=f"{name} (fast)",
+                lineterm="",
+            )
+            print("\n".join(diff))
+    print(
+        f"   identical: {identical}/{len(pages)} pages, "
+        f"mean line similarity {sum(similarities) / len(similarities):.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
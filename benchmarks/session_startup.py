@@ -0,0 +1,77 @@
+"""
+Measures stealth session startup time of PageLoader against the previous implementation, which created
+a context to read the user agent, closed it and created the final context afterwards.
+
+    python -m benchmarks.session_startup --runs 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from playwright_stealth import StealthConfig, stealth_async
+
+from parsera.page import PageLoader
+
+STEALTH_CONFIG = StealthConfig(
+    navigator_user_agent=False,
+    navigator_plugins=False,
+    navigator_vendor=False,
+)
+
+
+async def legacy_create_session(loader: PageLoader) -> None:
+    context = await loader.browser.new_context()
+    await loader.prepare_context(context)
+    page = await context.new_page()
+    user_agent = await page.evaluate("navigator.userAgent")
+    user_agent = user_agent.replace("HeadlessChrome/", "Chrome/")
+    await context.close()
+
+    context = await loader.browser.new_context(user_agent=user_agent)
+    await loader.prepare_context(context)
+    page = await context.new_page()
+    await stealth_async(page, config=STEALTH_CONFIG)
+    await context.close()
+
+
+async def current_create_session(loader: PageLoader) -> None:
+    slot = await loader.new_slot(stealth=True)
+    await slot.context.close()
+
+
+async def measure(create_session, loader: PageLoader, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await create_session(loader)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    print(
+        f"{name:>8}: mean {statistics.mean(timings) * 1000:.1f} ms, "
+        f"median {statistics.median(timings) * 1000:.1f} ms, "
+        f"min {min(timings) * 1000:.1f} ms"
+    )
+
+
+async def main(runs: int) -> None:
+    loader = PageLoader()
+    await loader.new_browser()
+    try:
+        # Warm up the browser process before measuring
+        await current_create_session(loader)
+        report("before", await measure(legacy_create_session, loader, runs))
+        report("after", await measure(current_create_session, loader, runs))
+    finally:
+        await loader.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark stealth session startup")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.runs))
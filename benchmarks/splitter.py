@@ -0,0 +1,84 @@
+"""
+Measures how splitting time scales with the page size for TokenSplitter and RecursiveCharacterTextSplitter counting
+tokens of every piece, on generated markdown listings.
+
+    python -m benchmarks.splitter --sizes 100 250 500 1000 --chunk-size 12000
+"""
+
+import argparse
+import random
+import time
+
+import tiktoken
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from parsera.splitting import TokenSplitter
+
+WORDS = [
+    "Product",
+    "price",
+    "$19.99",
+    "in stock",
+    "[details](/item)",
+    "|",
+    "**new**",
+    "rating 4.5",
+]
+
+
+def generate_markdown(size_kb: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size_kb * 1000:
+        record = "\n".join(
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12)))
+            for _ in range(rng.randint(1, 4))
+        )
+        parts.append(record)
+        length += len(record) + 2
+    return "\n\n".join(parts)
+
+
+def measure(splitter, text: str) -> tuple[float, list[str]]:
+    started = time.perf_counter()
+    chunks = splitter.split_text(text)
+    return time.perf_counter() - started, chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 250, 500, 1000])
+    parser.add_argument("--chunk-size", type=int, default=12000)
+    parser.add_argument("--encoding", default="o200k_base")
+    args = parser.parse_args()
+
+    encoding = tiktoken.get_encoding(args.encoding)
+
+    def count_tokens(text: str) -> int:
+        return len(encoding.encode(text))
+
+    overlap = args.chunk_size // 3
+    recursive = RecursiveCharacterTextSplitter(
+        chunk_size=args.chunk_size, chunk_overlap=overlap, length_function=count_tokens
+    )
+    token = TokenSplitter(
+        chunk_size=args.chunk_size, chunk_overlap=overlap, encoding=encoding
+    )
+    print(
+        f"{'size':>8} {'recursive':>10} {'token':>8} {'speedup':>8} {'chunks':>10} {'max tokens':>12}"
+    )
+    for size_kb in args.sizes:
+        text = generate_markdown(size_kb)
+        recursive_time, recursive_chunks = measure(recursive, text)
+        token_time, token_chunks = measure(token, text)
+        max_tokens = max(count_tokens(chunk) for chunk in token_chunks)
+        print(
+            f"{size_kb:>6}KB {recursive_time:>9.2f}s {token_time:>7.2f}s "
+            f"{recursive_time / token_time:>7.1f}x "
+            f"{len(recursive_chunks):>4} / {len(token_chunks):<4} {max_tokens:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from playwright.async_api import Page
 
 from parsera import Parsera
 from parsera.engine.model import GPT4oMiniModel
+from parsera.sessions import SessionStore
 
 EMAIL = "<YOUR-EMAIL>"
 PASSWORD = "<YOUR-PASSWORD>"
@@ -27,7 +28,17 @@ async def get_parsera_credits():
         await page.wait_for_timeout(1000)  # Wait one second for page to load
         return page
 
-    parsera = Parsera(model=model, initial_script=initial_script)
+    # Check that the saved session is still signed in
+    async def is_signed_in(page: Page) -> bool:
+        await page.goto("https://parsera.org/app")
+        return "sign-in" not in page.url
+
+    # Reuse the signed in session between runs instead of signing in every time
+    session_store = SessionStore("parsera.org", validate=is_signed_in)
+
+    parsera = Parsera(
+        model=model, initial_script=initial_script, session_store=session_store
+    )
     return await parsera.arun(
         url="https://parsera.org/app",
         elements={
@@ -0,0 +1,119 @@
+import json
+import re
+from collections import Counter, defaultdict
+
+from playwright.async_api import Frame, Page
+
+from parsera.scoping import is_xpath
+
+# Pairs of link text and absolute URL of the links inside the element in the document order,
+# used to add URLs to the links of its snapshot
+LINK_TARGETS_SCRIPT = """
+(root) => Array.from(
+    [...(root.matches("a[href]") ? [root] : []), ...root.querySelectorAll("a[href]")],
+    (link) => [
+        (link.getAttribute("aria-label") || link.innerText || link.title || "")
+            .replace(/\\s+/g, " ")
+            .trim(),
+        link.href,
+    ],
+)
+"""
+
+# Nodes without content: unnamed images, separators and presentational elements
+PRUNED_LINE = re.compile(r"^\s*- (img|separator|presentation|none)\s*$")
+LINK_LINE = re.compile(r'^(\s*)- link "((?:[^"\\]|\\.)*)"(\s*\[[^\]]*\])?(:?)\s*$')
+
+
+def prune_snapshot(snapshot: str) -> str:
+    return "\n".join(
+        line for line in snapshot.splitlines() if not PRUNED_LINE.match(line)
+    )
+
+
+def add_link_urls(snapshot: str, links: list[list[str]]) -> str:
+    """Add `/url` children to the links of the snapshot, unless they already have them.
+
+    Links with the same text, like "Details" on listing pages, are paired with the URLs in the
+    document order. When the snapshot has a different number of links with the text than the
+    element, e.g. because some of them are hidden, they get a URL only if all URLs are the same.
+    """
+    urls: dict[str, list[str]] = defaultdict(list)
+    for text, url in links:
+        urls[text].append(url)
+    names = []
+    for line in snapshot.splitlines():
+        match = LINK_LINE.match(line)
+        if match is not None:
+            try:
+                names.append(json.loads(f'"{match.group(2)}"'))
+            except ValueError:
+                names.append(None)
+    counts = Counter(names)
+    positions: Counter[str] = Counter()
+
+    def next_url(name: str | None) -> str | None:
+        candidates = urls.get(name)
+        if not candidates:
+            return None
+        position = positions[name]
+        positions[name] += 1
+        if counts[name] == len(candidates):
+            return candidates[position]
+        # Links can't be paired, so the URL is added only when it's unambiguous
+        return candidates[0] if len(set(candidates)) == 1 else None
+
+    lines = snapshot.splitlines()
+    result = []
+    for idx, line in enumerate(lines):
+        match = LINK_LINE.match(line)
+        if match is None:
+            result.append(line)
+            continue
+        indent, name, attributes, has_children = match.groups()
+        next_line = lines[idx + 1] if idx + 1 < len(lines) else ""
+        try:
+            url = next_url(json.loads(f'"{name}"'))
+        except ValueError:
+            url = None
+        if url is None or (has_children and "- /url:" in next_line):
+            result.append(line)
+            continue
+        result.append(f'{indent}- link "{name}"{attributes or ""}:')
+        result.append(f"{indent}  - /url: {url}")
+    return "\n".join(result)
+
+
+async def accessibility_snapshot(
+    frame: Page | Frame, timeout: float = 30.0, selectors: list[str] | None = None
+) -> str:
+    """Compact YAML-like serialization of the accessibility tree of the frame.
+
+    Args:
+        frame (Page | Frame): Page or frame to serialize.
+        timeout (float, optional): Seconds to wait for the snapshot. Defaults to 30.0.
+        selectors (list[str] | None, optional): CSS or XPath selectors of the elements to
+            serialize instead of the whole body. Defaults to None.
+
+    Returns:
+        str: Roles, names and values of the elements with URLs of the links, empty string when
+            no element matches the selectors.
+    """
+    if selectors:
+        locators = []
+        for selector in selectors:
+            # Playwright detects only XPath selectors starting with "//"
+            if is_xpath(selector) and not selector.startswith("xpath="):
+                selector = f"xpath={selector}"
+            locator = frame.locator(selector)
+            locators.extend(locator.nth(idx) for idx in range(await locator.count()))
+    else:
+        locators = [frame.locator("body")]
+    if not locators:
+        return ""
+    snapshots = []
+    for locator in locators:
+        snapshot = await locator.aria_snapshot(timeout=timeout * 1000)
+        links = await locator.evaluate(LINK_TARGETS_SCRIPT, timeout=timeout * 1000)
+        snapshots.append(add_link_urls(snapshot, links))
+    return prune_snapshot("\n".join(snapshots))
@@ -0,0 +1,112 @@
+import re
+from collections import Counter
+from typing import Iterable
+
+from playwright.async_api import BrowserContext, Route
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"googlesyndication\.com",
+    r"googleadservices\.com",
+    r"doubleclick\.net",
+    r"adservice\.google\.",
+    r"connect\.facebook\.net",
+    r"facebook\.com/tr",
+    r"hotjar\.com",
+    r"clarity\.ms",
+    r"segment\.(io|com)",
+    r"mixpanel\.com",
+    r"amplitude\.com",
+    r"nr-data\.net",
+    r"scorecardresearch\.com",
+    r"quantserve\.com",
+    r"adnxs\.com",
+    r"criteo\.(com|net)",
+    r"taboola\.com",
+    r"outbrain\.com",
+    r"mc\.yandex\.ru",
+)
+
+# Typical transfer sizes per resource type, used to estimate the saved traffic, since aborted
+# requests never report their real size
+ESTIMATED_RESOURCE_SIZES = {
+    "image": 30_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 20_000,
+    "script": 30_000,
+}
+DEFAULT_ESTIMATED_SIZE = 5_000
+
+
+class ResourceBlocker:
+    def __init__(
+        self,
+        resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        url_patterns: Iterable[str] = DEFAULT_BLOCKED_URL_PATTERNS,
+        allowed_url_patterns: Iterable[str] = (),
+    ):
+        """Policy aborting requests which don't contribute to the page content
+
+        Args:
+            resource_types (Iterable[str], optional): Playwright resource types to block, like
+                "image", "media", "font" or "stylesheet". Defaults to images, media and fonts.
+            url_patterns (Iterable[str], optional): Regular expressions, requests with matching URL
+                are blocked regardless of the type. Defaults to common analytics and ad trackers.
+            allowed_url_patterns (Iterable[str], optional): Regular expressions for URLs which are
+                never blocked, takes precedence over other rules. Defaults to ().
+        """
+        self.resource_types = set(resource_types)
+        self.url_patterns = [re.compile(p, re.IGNORECASE) for p in url_patterns]
+        self.allowed_url_patterns = [
+            re.compile(p, re.IGNORECASE) for p in allowed_url_patterns
+        ]
+        self.blocked_requests = 0
+        self.blocked_by_type: Counter[str] = Counter()
+        self.estimated_bytes_saved = 0
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        # Never block the page itself
+        if resource_type == "document":
+            return False
+        if any(pattern.search(url) for pattern in self.allowed_url_patterns):
+            return False
+        if resource_type in self.resource_types:
+            return True
+        return any(pattern.search(url) for pattern in self.url_patterns)
+
+    async def handle_route(self, route: Route) -> None:
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.blocked_requests += 1
+            self.blocked_by_type[request.resource_type] += 1
+            self.estimated_bytes_saved += ESTIMATED_RESOURCE_SIZES.get(
+                request.resource_type, DEFAULT_ESTIMATED_SIZE
+            )
+            await route.abort("blockedbyclient")
+        else:
+            await route.continue_()
+
+    async def attach(self, context: BrowserContext) -> None:
+        await context.route("**/*", self.handle_route)
+
+    def stats(self) -> dict:
+        return {
+            "blocked_requests": self.blocked_requests,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "estimated_bytes_saved": self.estimated_bytes_saved,
+        }
+
+    def add_stats(self, stats: dict) -> None:
+        """Add counters collected by another instance, e.g. in a shard process."""
+        self.blocked_requests += stats["blocked_requests"]
+        self.blocked_by_type.update(stats["blocked_by_type"])
+        self.estimated_bytes_saved += stats["estimated_bytes_saved"]
+
+    def reset_stats(self) -> None:
+        self.blocked_requests = 0
+        self.blocked_by_type = Counter()
+        self.estimated_bytes_saved = 0
@@ -0,0 +1,258 @@
+import asyncio
+import logging
+import re
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Iterable
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup, Comment, Tag
+
+from parsera.conversion import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Elements scored as blocks, smaller elements are kept or removed with their block
+BLOCK_TAGS = {
+    "div",
+    "section",
+    "article",
+    "main",
+    "aside",
+    "nav",
+    "header",
+    "footer",
+    "ul",
+    "ol",
+    "dl",
+    "menu",
+    "table",
+    "form",
+    "dialog",
+}
+NEVER_CONTENT_TAGS = ["script", "style", "noscript", "template", "svg", "iframe"]
+BOILERPLATE_TAGS = {"nav", "aside", "footer", "dialog", "menu"}
+BOILERPLATE_ROLES = {
+    "navigation",
+    "banner",
+    "contentinfo",
+    "complementary",
+    "dialog",
+    "alertdialog",
+    "menu",
+    "menubar",
+}
+BOILERPLATE_HINTS = re.compile(
+    r"cookie|consent|gdpr|banner|navbar|nav-|-nav|menu|breadcrumb|footer|sidebar|widget|"
+    r"related|recommend|share|social|newsletter|subscribe|signup|popup|modal|overlay|"
+    r"advert|sponsor|promo",
+    re.IGNORECASE,
+)
+CONTENT_TAGS = {"main", "article"}
+WHITESPACE = re.compile(r"\s+")
+
+
+class BlockStats:
+    """Text and link statistics of a block."""
+
+    def __init__(self, block: Tag):
+        text = WHITESPACE.sub(" ", block.get_text(" ")).strip()
+        self.text = text
+        self.text_length = len(text)
+        self.link_length = sum(
+            len(WHITESPACE.sub(" ", link.get_text(" ")).strip())
+            for link in block.find_all("a")
+        )
+        self.tags = len(block.find_all(True)) + 1
+
+    @property
+    def link_density(self) -> float:
+        if self.text_length == 0:
+            return 0.0
+        return min(self.link_length / self.text_length, 1.0)
+
+    @property
+    def text_density(self) -> float:
+        """Characters of text per element."""
+        return self.text_length / self.tags
+
+
+class BoilerplateRemover:
+    def __init__(
+        self,
+        max_link_density: float = 0.5,
+        min_text_density: float = 10.0,
+        repeated_pages: int | None = 2,
+        min_repeated_length: int = 20,
+        max_block_share: float = 0.4,
+        keep_selectors: Iterable[str] = (),
+        token_counter: Callable[[str], int] | None = None,
+        max_tracked_blocks: int = 10_000,
+    ):
+        """Stage dropping navigation, banners, footers and other boilerplate blocks of the page
+
+        A block is removed when it's repeated across pages of the same domain, or when it has
+        boilerplate hints (tags, roles, classes and ids) and high link density or low text
+        density.
+
+        Args:
+            max_link_density (float, optional): Share of the block text inside links above which
+                the block looks like navigation. Defaults to 0.5.
+            min_text_density (float, optional): Characters of text per element below which
+                the block looks like a menu or widget. Defaults to 10.0.
+            repeated_pages (int | None, optional): Number of other pages of the domain with the
+                same block, after which it's removed regardless of other signals, None disables
+                the tracking. Defaults to 2.
+            min_repeated_length (int, optional): Shorter blocks are not tracked across pages.
+                Defaults to 20.
+            max_block_share (float, optional): Blocks holding a larger share of the page text are
+                never removed, protecting the main content. Defaults to 0.4.
+            keep_selectors (Iterable[str], optional): CSS selectors of the elements which are
+                always kept together with their ancestors. Defaults to ().
+            token_counter (Callable[[str], int] | None, optional): Function counting removed
+                tokens for the reports. Defaults to None, using the OpenAI tokenizer for gpt-4o
+                models.
+            max_tracked_blocks (int, optional): Number of blocks tracked across pages per domain,
+                least recently seen blocks are forgotten above it. Defaults to 10_000.
+        """
+        self.max_link_density = max_link_density
+        self.min_text_density = min_text_density
+        self.repeated_pages = repeated_pages
+        self.min_repeated_length = min_repeated_length
+        self.max_block_share = max_block_share
+        self.keep_selectors = list(keep_selectors)
+        self.token_counter = token_counter or count_tokens
+        self.max_tracked_blocks = max_tracked_blocks
+        # Domain -> fingerprint of the block text -> URLs of the pages containing it
+        self.seen_blocks: dict[str, OrderedDict[int, set[str]]] = {}
+        self.reports: deque[dict] = deque(maxlen=1000)
+        self.tokens_removed = 0
+        # Pages can be processed in several threads, see `aremove`
+        self._lock = threading.Lock()
+
+    def hinted(self, block: Tag) -> bool:
+        if block.name in BOILERPLATE_TAGS:
+            return True
+        if block.get("role") in BOILERPLATE_ROLES or block.get("aria-modal") == "true":
+            return True
+        names = " ".join(block.get("class", [])) + " " + (block.get("id") or "")
+        return BOILERPLATE_HINTS.search(names) is not None
+
+    def repeated(self, stats: BlockStats, domain: str, url: str) -> bool:
+        if self.repeated_pages is None or stats.text_length < self.min_repeated_length:
+            return False
+        pages = self.seen_blocks.get(domain, {}).get(hash(stats.text), set())
+        return len(pages - {url}) >= self.repeated_pages
+
+    def is_boilerplate(
+        self, block: Tag, stats: BlockStats, domain: str, url: str
+    ) -> bool:
+        if self.repeated(stats, domain, url):
+            return True
+        # Densities alone don't remove blocks, since listings of records can be link-heavy
+        if not self.hinted(block):
+            return False
+        if stats.text_length == 0:
+            return True
+        return (
+            stats.link_density > self.max_link_density
+            or stats.text_density < self.min_text_density
+        )
+
+    def record(self, soup: BeautifulSoup, domain: str, url: str) -> None:
+        if self.repeated_pages is None:
+            return
+        seen = self.seen_blocks.setdefault(domain, OrderedDict())
+        for block in soup.find_all(BLOCK_TAGS):
+            text = WHITESPACE.sub(" ", block.get_text(" ")).strip()
+            if len(text) < self.min_repeated_length:
+                continue
+            fingerprint = hash(text)
+            pages = seen.setdefault(fingerprint, set())
+            seen.move_to_end(fingerprint)
+            # Enough to tell if the block is repeated on other pages than the current one
+            if len(pages) <= self.repeated_pages:
+                pages.add(url)
+        while len(seen) > self.max_tracked_blocks:
+            seen.popitem(last=False)
+
+    def protected(self, soup: BeautifulSoup) -> tuple[set[int], set[int]]:
+        """Ids of the elements matching keep selectors and of their ancestors."""
+        if not self.keep_selectors:
+            return set(), set()
+        matches = soup.select(", ".join(self.keep_selectors))
+        kept = {id(match) for match in matches}
+        ancestors = {id(parent) for match in matches for parent in match.parents}
+        return kept, ancestors
+
+    def remove(self, html: str, url: str = "") -> str:
+        """Remove boilerplate blocks from the page HTML.
+
+        Args:
+            html (str): HTML of the page.
+            url (str, optional): URL of the page, used to find blocks repeated across pages of
+                the same domain. Defaults to "".
+
+        Returns:
+            str: HTML without boilerplate blocks.
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        for element in soup.find_all(NEVER_CONTENT_TAGS):
+            element.decompose()
+        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+            comment.extract()
+
+        domain = urlparse(url).netloc
+        page_text = WHITESPACE.sub(" ", soup.get_text(" ")).strip()
+        page_length = max(len(page_text), 1)
+        kept, ancestors = self.protected(soup)
+        removed = []
+        stack = [soup]
+        with self._lock:
+            while stack:
+                element = stack.pop()
+                for child in element.find_all(True, recursive=False):
+                    if id(child) in kept:
+                        continue
+                    if child.name in BLOCK_TAGS and child.name not in CONTENT_TAGS:
+                        stats = BlockStats(child)
+                        if (
+                            id(child) not in ancestors
+                            and stats.text_length <= page_length * self.max_block_share
+                            and self.is_boilerplate(child, stats, domain, url)
+                        ):
+                            removed.append(child)
+                            continue
+                    stack.append(child)
+            # Record blocks before removal, so repetition doesn't depend on the earlier
+            # decisions
+            self.record(soup, domain, url)
+        for block in removed:
+            block.decompose()
+
+        tokens_before = self.token_counter(page_text)
+        tokens_after = self.token_counter(
+            WHITESPACE.sub(" ", soup.get_text(" ")).strip()
+        )
+        report = {
+            "url": url,
+            "removed_blocks": len(removed),
+            "tokens_before": tokens_before,
+            "tokens_after": tokens_after,
+            "tokens_removed": tokens_before - tokens_after,
+        }
+        with self._lock:
+            self.reports.append(report)
+            self.tokens_removed += report["tokens_removed"]
+        logger.info(
+            "Removed %d boilerplate blocks with %d of %d tokens from %s",
+            len(removed),
+            report["tokens_removed"],
+            tokens_before,
+            url,
+        )
+        return str(soup)
+
+    async def aremove(self, html: str, url: str = "") -> str:
+        """Remove boilerplate blocks in a thread, without blocking the event loop."""
+        return await asyncio.to_thread(self.remove, html, url)
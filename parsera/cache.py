@@ -0,0 +1,200 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "parsera" / "pages"
+
+
+def script_identity(script: Callable[..., Awaitable] | None) -> str | None:
+    """Identify script by its name and code, so changed scripts don't hit stale entries."""
+    if script is None:
+        return None
+    name = f"{getattr(script, '__module__', '')}.{getattr(script, '__qualname__', '')}"
+    code = getattr(script, "__code__", None)
+    if code is None:
+        return name
+    digest = hashlib.sha256(code.co_code + repr(code.co_consts).encode()).hexdigest()
+    return f"{name}:{digest[:16]}"
+
+
+class CacheEntry:
+    def __init__(self, path: Path, meta: dict):
+        self.path = path
+        self.meta = meta
+
+    @property
+    def url(self) -> str:
+        return self.meta["url"]
+
+    @property
+    def etag(self) -> str | None:
+        return self.meta.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.meta.get("last_modified")
+
+    def age(self) -> float:
+        return time.time() - self.meta["fetched_at"]
+
+    def read(self) -> str:
+        return gzip.decompress(self.path.read_bytes()).decode("utf-8")
+
+
+class PageCache:
+    def __init__(
+        self,
+        directory: str | Path = DEFAULT_CACHE_DIR,
+        ttl: float = 3600,
+        max_size: int = 512 * 1024 * 1024,
+        offline: bool = False,
+    ):
+        """On-disk cache of fetched pages
+
+        Args:
+            directory (str | Path, optional): Directory to store pages in.
+                Defaults to ~/.cache/parsera/pages.
+            ttl (float, optional): Number of seconds the page is served without revalidation.
+                Defaults to 3600.
+            max_size (int, optional): Maximum total size of compressed pages in bytes, least
+                recently used pages are evicted above it. Defaults to 512 MB.
+            offline (bool, optional): Serve cached pages regardless of their age and never fetch
+                missing ones. Defaults to False.
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.offline = offline
+
+    def key(
+        self,
+        url: str,
+        scrolls_limit: int = 0,
+        load_state: str | None = None,
+        playwright_script: Callable[..., Awaitable] | None = None,
+        content_format: str = "html",
+        selectors: list[str] | None = None,
+        response_capture: dict | None = None,
+        dom_pruner: dict | None = None,
+        iframe_policy: dict | None = None,
+        initial_script: Callable[..., Awaitable] | None = None,
+        session_name: str | None = None,
+        cookies: list[dict] | None = None,
+        http_fast_path: bool = False,
+    ) -> str:
+        options = {
+            "url": url,
+            "scrolls_limit": scrolls_limit,
+            "load_state": load_state,
+            "playwright_script": script_identity(playwright_script),
+        }
+        # Add new options only when they are set, so keys of existing entries stay valid
+        if content_format != "html":
+            options["content_format"] = content_format
+        if selectors:
+            options["selectors"] = selectors
+        if response_capture is not None:
+            options["response_capture"] = response_capture
+        if dom_pruner is not None:
+            options["dom_pruner"] = dom_pruner
+        if iframe_policy is not None:
+            options["iframe_policy"] = iframe_policy
+        # Pages differ by the identity of the session and by how they were fetched
+        if initial_script is not None:
+            options["initial_script"] = script_identity(initial_script)
+        if session_name is not None:
+            options["session_name"] = session_name
+        if cookies:
+            options["cookies"] = cookies
+        if http_fast_path:
+            options["http_fast_path"] = True
+        return hashlib.sha256(
+            json.dumps(options, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def content_path(self, key: str) -> Path:
+        return self.directory / f"{key}.html.gz"
+
+    def meta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self.content_path(key)
+        try:
+            meta = json.loads(self.meta_path(key).read_text())
+            # Access time is tracked with mtime for the LRU eviction
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(path=path, meta=meta)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return self.offline or entry.age() < self.ttl
+
+    def write_atomic(self, path: Path, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        content: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        headers = headers or {}
+        data = gzip.compress(content.encode("utf-8"))
+        meta = {
+            "url": url,
+            "fetched_at": time.time(),
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "size": len(data),
+        }
+        self.write_atomic(self.content_path(key), data)
+        self.write_atomic(self.meta_path(key), json.dumps(meta).encode("utf-8"))
+        self.evict()
+
+    def touch(self, key: str) -> None:
+        """Mark entry as fresh after successful revalidation."""
+        entry = self.get(key)
+        if entry is not None:
+            entry.meta["fetched_at"] = time.time()
+            self.write_atomic(
+                self.meta_path(key), json.dumps(entry.meta).encode("utf-8")
+            )
+
+    def remove(self, key: str) -> None:
+        for path in (self.content_path(key), self.meta_path(key)):
+            path.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.html.gz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self.remove(path.name.removesuffix(".html.gz"))
+            total_size -= size
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.html.gz"):
+            self.remove(path.name.removesuffix(".html.gz"))
@@ -0,0 +1,141 @@
+import asyncio
+import html
+import json
+import re
+from typing import Iterable, Literal
+
+from playwright.async_api import Page, Response
+
+DEFAULT_CAPTURED_CONTENT_TYPES = ("application/json", "+json")
+
+
+class ResponseCapture:
+    def __init__(
+        self,
+        url_patterns: Iterable[str] = (),
+        content_types: Iterable[str] = DEFAULT_CAPTURED_CONTENT_TYPES,
+        mode: Literal["append", "replace"] = "append",
+        max_response_size: int = 2_000_000,
+        max_responses: int = 50,
+    ):
+        """Policy recording JSON responses of XHR and fetch requests made by the page
+
+        Args:
+            url_patterns (Iterable[str], optional): Regular expressions, if set only responses with
+                matching URL are captured. Defaults to (), capturing all URLs.
+            content_types (Iterable[str], optional): Substrings of the content type of captured
+                responses. Defaults to JSON content types.
+            mode (Literal["append", "replace"], optional): Whether payloads are appended to the
+                page HTML or replace it. Pages without captured responses always return HTML.
+                Defaults to "append".
+            max_response_size (int, optional): Larger responses (in characters) are skipped.
+                Defaults to 2_000_000.
+            max_responses (int, optional): Maximum number of responses captured per page.
+                Defaults to 50.
+        """
+        if mode not in ("append", "replace"):
+            raise ValueError(f"Unknown capture mode: {mode}")
+        self.url_patterns = [re.compile(p, re.IGNORECASE) for p in url_patterns]
+        self.content_types = [content_type.lower() for content_type in content_types]
+        self.mode = mode
+        self.max_response_size = max_response_size
+        self.max_responses = max_responses
+
+    def options(self) -> dict:
+        """Settings changing the content of the page, used in cache keys."""
+        return {
+            "url_patterns": [pattern.pattern for pattern in self.url_patterns],
+            "content_types": self.content_types,
+            "mode": self.mode,
+            "max_response_size": self.max_response_size,
+            "max_responses": self.max_responses,
+        }
+
+    def matches(self, url: str, resource_type: str, content_type: str) -> bool:
+        if resource_type not in ("xhr", "fetch"):
+            return False
+        content_type = content_type.lower()
+        if not any(expected in content_type for expected in self.content_types):
+            return False
+        if not self.url_patterns:
+            return True
+        return any(pattern.search(url) for pattern in self.url_patterns)
+
+    def recorder(self, page: Page) -> "ResponseRecorder":
+        return ResponseRecorder(self, page)
+
+    def format(self, payloads: list[dict]) -> str:
+        """Render payloads as HTML, which survives conversion to markdown as code blocks."""
+        parts = []
+        for payload in payloads:
+            data = json.dumps(
+                payload["data"], ensure_ascii=False, separators=(",", ":")
+            )
+            parts.append(
+                f"<p>Response of {html.escape(payload['url'])}</p>\n"
+                f"<pre>{html.escape(data, quote=False)}</pre>\n"
+            )
+        return "".join(parts)
+
+    def combine(self, content: str, payloads: list[dict]) -> str:
+        if not payloads:
+            return content
+        captured = self.format(payloads)
+        if self.mode == "replace":
+            return captured
+        return content + "\n<!-- Captured responses -->\n" + captured
+
+
+class ResponseRecorder:
+    """Collects payloads of the responses matching the capture policy while the page loads."""
+
+    def __init__(self, capture: ResponseCapture, page: Page):
+        self.capture = capture
+        self.page = page
+        self.tasks: list[asyncio.Task] = []
+
+    def on_response(self, response: Response) -> None:
+        if len(self.tasks) >= self.capture.max_responses:
+            return
+        if self.capture.matches(
+            response.url,
+            resource_type=response.request.resource_type,
+            content_type=response.headers.get("content-type", ""),
+        ):
+            self.tasks.append(asyncio.ensure_future(self.read(response)))
+
+    async def read(self, response: Response) -> dict | None:
+        content_length = response.headers.get("content-length")
+        if (
+            content_length is not None
+            and content_length.isdigit()
+            and int(content_length) > self.capture.max_response_size
+        ):
+            return None
+        try:
+            text = await response.text()
+        except Exception:  # Body is not available, e.g. after navigation
+            return None
+        if len(text) > self.capture.max_response_size:
+            return None
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+        return {"url": response.url, "status": response.status, "data": data}
+
+    def start(self) -> None:
+        self.page.on("response", self.on_response)
+
+    def stop(self) -> None:
+        self.page.remove_listener("response", self.on_response)
+
+    def discard(self) -> None:
+        self.stop()
+        for task in self.tasks:
+            task.cancel()
+
+    async def collect(self) -> list[dict]:
+        self.stop()
+        payloads = await asyncio.gather(*self.tasks)
+        return [payload for payload in payloads if payload is not None]
@@ -0,0 +1,179 @@
+import asyncio
+import copy
+import multiprocessing
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal
+
+import tiktoken
+from langchain_core.documents import Document
+from langchain_text_splitters import TextSplitter
+from markdownify import MarkdownConverter
+
+DEFAULT_ENCODING = "o200k_base"
+HEADING_HANDLER = re.compile(r"convert_h\d+")
+
+# Converter and splitter the process pool workers were started with
+_worker_converter: MarkdownConverter | None = None
+_worker_splitter: TextSplitter | None = None
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens of the OpenAI tokenizer for gpt-4o models.
+
+    Defined at the module level, so splitters using it can be sent to worker processes.
+    """
+    return len(tiktoken.get_encoding(DEFAULT_ENCODING).encode(text))
+
+
+def convert_and_split(
+    content: str,
+    content_format: str = "html",
+    converter: MarkdownConverter | None = None,
+    text_splitter: TextSplitter | None = None,
+    split: bool = True,
+) -> str | list[Document]:
+    """Convert HTML to markdown and split it into chunks, objects which aren't passed are taken
+    from the worker."""
+    converter = converter or _worker_converter
+    text_splitter = text_splitter or _worker_splitter
+    text = converter.convert(content) if content_format == "html" else content
+    if not split or text_splitter is None:
+        return text
+    return text_splitter.create_documents([text])
+
+
+def portable(converter: MarkdownConverter | None) -> MarkdownConverter | None:
+    """Copy of the converter which can be pickled.
+
+    markdownify caches heading handlers, which are local functions, on the converter once it
+    converts a heading, they are created again in the worker.
+    """
+    if converter is None or not isinstance(converter, MarkdownConverter):
+        return converter
+    clone = copy.copy(converter)
+    clone.__dict__ = {
+        name: value
+        for name, value in vars(converter).items()
+        if not HEADING_HANDLER.fullmatch(name)
+    }
+    return clone
+
+
+def init_worker(converter: MarkdownConverter, text_splitter: TextSplitter | None):
+    global _worker_converter, _worker_splitter
+    _worker_converter = converter
+    _worker_splitter = text_splitter
+    # Load the tokenizer and the parser before the first page arrives
+    convert_and_split("<p>warm up</p>")
+
+
+class ConversionPool:
+    def __init__(
+        self,
+        kind: Literal["process", "thread"] = "process",
+        max_workers: int | None = None,
+    ):
+        """Executor running HTML conversion and chunking outside of the event loop
+
+        Args:
+            kind (Literal["process", "thread"], optional): Type of the workers. Processes
+                convert pages on all cores, threads avoid copying pages between processes and
+                help only with converters and tokenizers releasing the GIL. Defaults to "process".
+            max_workers (int | None, optional): Number of workers. Defaults to None, using the
+                number of CPUs.
+        """
+        if kind not in ("process", "thread"):
+            raise ValueError(f"Unknown conversion pool kind: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor: Executor | None = None
+        # Objects held by the process workers, others are sent with each page
+        self.worker_converter: MarkdownConverter | None = None
+        self.worker_splitter: TextSplitter | None = None
+
+    def start(
+        self, converter: MarkdownConverter, text_splitter: TextSplitter | None = None
+    ) -> None:
+        """Start workers holding the converter and splitter, no-op if already started."""
+        if self.executor is not None:
+            return
+        if self.kind == "thread":
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="parsera-conversion"
+            )
+            # Threads share the loaded tokenizer, so warming up one of them is enough
+            self.executor.submit(
+                convert_and_split, "<p>warm up</p>", "html", converter, text_splitter
+            )
+            return
+        self.worker_converter = converter
+        self.worker_splitter = text_splitter
+        # Forking a process running Playwright and runtime threads can deadlock
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(portable(converter), text_splitter),
+        )
+        # Spawn all workers now, so they are initialized before the first page arrives
+        for _ in range(self.max_workers):
+            self.executor.submit(len, "")
+
+    async def run(
+        self,
+        content: str,
+        content_format: str = "html",
+        converter: MarkdownConverter | None = None,
+        text_splitter: TextSplitter | None = None,
+    ) -> str | list[Document]:
+        """Convert content to text and split it into chunks in the pool.
+
+        Args:
+            content (str): Page content.
+            content_format (str, optional): Format of the content, only "html" is converted.
+                Defaults to "html".
+            converter (MarkdownConverter | None, optional): Converter of HTML. Defaults to None,
+                using the converter the workers were started with.
+            text_splitter (TextSplitter | None, optional): Splitter of the text, if None the
+                text is returned without splitting. Defaults to None.
+
+        Returns:
+            str | list[Document]: Text, or its chunks when the splitter is set.
+        """
+        if converter is None:
+            converter = self.worker_converter or MarkdownConverter()
+        self.start(converter, text_splitter)
+        split = text_splitter is not None
+        if self.kind == "process":
+            # Workers already hold their objects, only different ones are pickled with the page
+            if converter is self.worker_converter:
+                converter = None
+            converter = portable(converter)
+            if text_splitter is self.worker_splitter:
+                text_splitter = None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            convert_and_split,
+            content,
+            content_format,
+            converter,
+            text_splitter,
+            split,
+        )
+
+    def close(self) -> None:
+        if self.executor is None:
+            return
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.executor = None
+        self.worker_converter = None
+        self.worker_splitter = None
+
+    def __enter__(self) -> "ConversionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -22,7 +22,9 @@ class APIExtractor(Extractor):
         attributes: dict[str, str] | None = None,
         prompt: str = "",
         mode: str = "standard",
+        content_format: str = "html",
     ) -> list[dict]:
+        # API accepts both HTML and text content, so content_format needs no conversion
         if attributes is None and len(prompt) == 0:
             raise ValueError("At least prompt or attributes has to be provided")
         data = {
@@ -1,16 +1,21 @@
+import asyncio
 import json
 import math
-from typing import Callable
+from typing import AsyncIterator, Callable, Literal
 
-import tiktoken
+from langchain_core.documents import Document
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from markdownify import MarkdownConverter
 
+from parsera.conversion import ConversionPool, count_tokens
 from parsera.engine.simple_extractor import TabularExtractor
 from parsera.exceptions import PageContentError
+from parsera.merge import ChunkMerger, merge_chunks
+from parsera.records import RecordMarkingConverter, RecordTextSplitter
+from parsera.splitting import TokenSplitter
 
 SYSTEM_MERGE_PROMPT_TEMPLATE = """
 Your goal is to merge data extracted from different parts of the page into one json.
@@ -194,6 +199,11 @@ class ChunksTabularExtractor(TabularExtractor):
         chunk_size: int = 100000,
         token_counter: Callable[[str], int] | None = None,
         converter: MarkdownConverter | None = None,
+        conversion_pool: ConversionPool | None = None,
+        record_chunking: bool = False,
+        chunk_concurrency: int | None = None,
+        merge_strategy: Literal["llm", "local"] = "llm",
+        merge_fallback: bool = True,
     ):
         """Initialize ChunksTabularExtractor
 
@@ -207,30 +217,75 @@ class ChunksTabularExtractor(TabularExtractor):
                 Defaults to None.
             converter (MarkdownConverter | None, optional): converter of HTML, before it goes to
                 the model. Defaults to None.
+            conversion_pool (ConversionPool | None, optional): Pool converting and chunking
+                pages outside of the event loop, process pools require picklable converter and
+                token_counter. Defaults to None, converting in the event loop.
+            record_chunking (bool, optional): Whether to detect repeating records of the page
+                and split chunks between them without overlap, pages without records are split
+                as usual. Defaults to False.
+            chunk_concurrency (int | None, optional): Number of chunks extracted concurrently,
+                if set chunks are extracted independently and merged afterwards, instead of
+                passing data of the previous chunk to the next one. Defaults to None,
+                extracting chunks sequentially.
+            merge_strategy (Literal["llm", "local"], optional): How data of the chunks is
+                merged, "local" aligns overlapping rows without calling the model.
+                Defaults to "llm".
+            merge_fallback (bool, optional): Whether to merge with the model data which can't
+                be merged locally, like outputs which are not lists of rows. Defaults to True.
         """
+        if chunk_concurrency is not None and chunk_concurrency < 1:
+            raise ValueError("chunk_concurrency should be at least 1")
+        if merge_strategy not in ("llm", "local"):
+            raise ValueError(f"Unknown merge strategy: {merge_strategy}")
+        if record_chunking:
+            converter = RecordMarkingConverter(converter)
         super().__init__(
             model=model,
             converter=converter,
+            conversion_pool=conversion_pool,
         )
         if token_counter is None:
-
-            def count_tokens(text):
-                # Initialize the tokenizer for GPT-4o-mini
-                encoding = tiktoken.get_encoding("o200k_base")
-
-                # Count tokens
-                tokens = encoding.encode(text)
-                return len(tokens)
-
+            # Encodes the page once instead of counting tokens of every piece
+            text_splitter = TokenSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_size // self.overlap_factor,
+            )
             token_counter = count_tokens
+        else:
+            text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_size // self.overlap_factor,
+                length_function=token_counter,
+            )
 
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_size // self.overlap_factor,
-            length_function=token_counter,
-        )
+        if record_chunking:
+            self.text_splitter = RecordTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=0,
+                length_function=token_counter,
+                fallback=text_splitter,
+            )
+        else:
+            self.text_splitter = text_splitter
+        self.chunk_concurrency = chunk_concurrency
+        self.merge_strategy = merge_strategy
+        self.merge_fallback = merge_fallback
         self.chunks_data = None
 
+    async def split_content(
+        self, content: str, content_format: str = "html"
+    ) -> list[Document]:
+        """Convert content to text and split it into chunks, in the conversion pool if set."""
+        if self.conversion_pool is None:
+            markdown = self.to_text(content, content_format=content_format)
+            return self.text_splitter.create_documents([markdown])
+        return await self.conversion_pool.run(
+            content,
+            content_format=content_format,
+            converter=self.converter,
+            text_splitter=self.text_splitter,
+        )
+
     def elements_to_string(self, elements: dict[str, str] | None) -> str:
         if not elements:
             return ""
@@ -291,34 +346,170 @@ class ChunksTabularExtractor(TabularExtractor):
         output_dict = parser.parse(output.content)
         return output_dict
 
-    async def run(
-        self,
-        content: str,
-        attributes: dict[str, str] | None = None,
-        prompt: str = "",
+    async def merge_chunks_data(
+        self, all_data: list[list[dict]], attributes: dict[str, str] | None, prompt: str
     ) -> dict:
-        if self.system_prompt is None:
-            raise ValueError("system_prompt is not defined for this extractor")
-        if self.prompt_template is None:
-            raise ValueError("prompt_template is not defined for this extractor")
-        if not attributes and len(prompt) == 0:
-            raise ValueError("At least prompt or attributes has to be provided")
+        if self.merge_strategy == "local":
+            try:
+                # Fuzzy matching of the overlaps is CPU-bound, so it runs off the event loop
+                return await asyncio.to_thread(merge_chunks, all_data)
+            except ValueError:
+                if not self.merge_fallback:
+                    raise
+        return await self.merge_all_data(
+            all_data=all_data, attributes=attributes, prompt=prompt
+        )
 
-        markdown = self.converter.convert(content)
-        chunks = self.text_splitter.create_documents([markdown])
-        if len(chunks) > 1:
-            self.chunks_data = []
+    async def iter_chunks_data(
+        self, chunks: list[Document], attributes: dict[str, str] | None, prompt: str
+    ) -> AsyncIterator[list[dict]]:
+        """Data of the chunks in the page order, each one as soon as it's extracted."""
+        if self.chunk_concurrency is None:
             chunk_data = None
-            for _, element in enumerate(chunks):
+            for element in chunks:
                 chunk_data = await self.extract(
                     markdown=element,
                     previous_data=chunk_data,
                     attributes=attributes,
                     prompt=prompt,
                 )
-                self.chunks_data.append(chunk_data)
+                yield chunk_data
+            return
 
-            output_dict = await self.merge_all_data(
+        semaphore = asyncio.Semaphore(self.chunk_concurrency)
+
+        async def extract_chunk(element: Document) -> list[dict]:
+            async with semaphore:
+                return await self.extract(
+                    markdown=element, attributes=attributes, prompt=prompt
+                )
+
+        tasks = [asyncio.ensure_future(extract_chunk(chunk)) for chunk in chunks]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            # Consumer stopped early or extraction failed
+            for task in tasks:
+                task.cancel()
+
+    def check_request(self, attributes: dict | None, prompt: str) -> None:
+        if self.system_prompt is None:
+            raise ValueError("system_prompt is not defined for this extractor")
+        if self.prompt_template is None:
+            raise ValueError("prompt_template is not defined for this extractor")
+        if not attributes and len(prompt) == 0:
+            raise ValueError("At least prompt or attributes has to be provided")
+
+    async def stream(
+        self,
+        content: str,
+        attributes: dict[str, str] | None = None,
+        prompt: str = "",
+        content_format: str = "html",
+    ) -> AsyncIterator[dict]:
+        """Extract rows chunk by chunk, yielding them as soon as they are final.
+
+        With `merge_strategy="local"` rows of the chunks are merged locally and yielded once
+        they are outside of the overlap with the next chunk. Events are dicts, one for each
+        chunk: `{"type": "rows", "rows": [...], "chunk": 0, "chunks": 10, "extracted": 25}`,
+        where `extracted` is the number of rows extracted from the chunk, and the end of the page:
+        `{"type": "end", "chunks": 10, "rows": 230}`. With `merge_strategy="llm"` chunks are
+        merged by the model once all of them are extracted, so all rows come in one event.
+
+        Local merge needs a list of rows from each chunk. When a chunk returns other data before
+        any rows were yielded and `merge_fallback` is set, the page is merged by the model like in
+        `run`. Otherwise the stream ends with an error event instead of the end event:
+        `{"type": "error", "error": "...", "chunk": 3, "chunks": 10}`.
+
+        Args:
+            content (str): Page content.
+            attributes (dict[str, str] | None, optional): Elements to extract. Defaults to None.
+            prompt (str, optional): Prompt for the extraction. Defaults to "".
+            content_format (str, optional): Format of the content. Defaults to "html".
+
+        Raises:
+            PageContentError: Page content is empty.
+
+        Returns:
+            AsyncIterator[dict]: Events with final rows and the end of the page.
+        """
+        self.check_request(attributes, prompt)
+        chunks = await self.split_content(content, content_format=content_format)
+        if not chunks:
+            raise PageContentError("Page content is empty")
+
+        merger = ChunkMerger() if self.merge_strategy == "local" else None
+        all_data = []
+        total = 0
+        async for chunk_data in self.iter_chunks_data(
+            chunks, attributes=attributes, prompt=prompt
+        ):
+            chunk_idx = len(all_data)
+            all_data.append(chunk_data)
+            if merger is None:
+                continue
+            try:
+                rows = await asyncio.to_thread(merger.add, chunk_data)
+            except ValueError as exc:
+                if total or not self.merge_fallback:
+                    # Yielded rows can't be taken back, so the page can't be merged again
+                    yield {
+                        "type": "error",
+                        "error": str(exc),
+                        "chunk": chunk_idx,
+                        "chunks": len(chunks),
+                    }
+                    return
+                merger = None
+                continue
+            if chunk_idx == len(chunks) - 1:
+                rows.extend(merger.finish())
+            total += len(rows)
+            yield {
+                "type": "rows",
+                "rows": rows,
+                "chunk": chunk_idx,
+                "chunks": len(chunks),
+                "extracted": len(chunk_data),
+            }
+
+        if merger is None:
+            self.chunks_data = all_data
+            if len(all_data) > 1:
+                rows = await self.merge_all_data(
+                    all_data=all_data, attributes=attributes, prompt=prompt
+                )
+            else:
+                rows = all_data[0]
+            total = len(rows)
+            yield {
+                "type": "rows",
+                "rows": rows,
+                "chunk": len(chunks) - 1,
+                "chunks": len(chunks),
+                "extracted": len(all_data[-1]),
+            }
+        yield {"type": "end", "chunks": len(chunks), "rows": total}
+
+    async def run(
+        self,
+        content: str,
+        attributes: dict[str, str] | None = None,
+        prompt: str = "",
+        content_format: str = "html",
+    ) -> dict:
+        self.check_request(attributes, prompt)
+
+        chunks = await self.split_content(content, content_format=content_format)
+        if len(chunks) > 1:
+            self.chunks_data = [
+                chunk_data
+                async for chunk_data in self.iter_chunks_data(
+                    chunks, attributes=attributes, prompt=prompt
+                )
+            ]
+            output_dict = await self.merge_chunks_data(
                 all_data=self.chunks_data, attributes=attributes, prompt=prompt
             )
         elif len(chunks) == 1:
@@ -0,0 +1,193 @@
+from markdownify import MarkdownConverter, html_heading_re, whitespace_re
+
+# Elements in which whitespace-only text nodes are dropped by markdownify
+NESTED_TAGS = {"ol", "ul", "li", "table", "thead", "tbody", "tfoot", "tr", "td", "th"}
+CODE_TAGS = {"pre", "code", "kbd", "samp"}
+# Whitespace BeautifulSoup collapses in whitespace-only strings outside of preformatted tags
+ASCII_SPACES = " \n\t\x0c\r"
+
+
+class TextNode(str):
+    """Text child of an element, with the attributes of NavigableString used by markdownify."""
+
+    name = None
+
+
+class CommentNode(TextNode):
+    pass
+
+
+class LxmlElement:
+    """lxml element with the subset of BeautifulSoup Tag interface used by markdownify."""
+
+    __slots__ = (
+        "element",
+        "name",
+        "parent",
+        "contents",
+        "position",
+        "in_pre",
+        "in_code",
+    )
+
+    def __init__(self, element, parent: "LxmlElement | None" = None):
+        self.element = element
+        self.name = element.tag
+        self.parent = parent
+        self.contents: list = []
+        self.position = 0
+        self.in_pre = self.name == "pre" or (parent is not None and parent.in_pre)
+        self.in_code = self.name in CODE_TAGS or (parent is not None and parent.in_code)
+
+    @property
+    def attrs(self):
+        return self.element.attrib
+
+    def get(self, key: str, default=None):
+        return self.element.get(key, default)
+
+    def __getitem__(self, key: str) -> str:
+        return self.element.attrib[key]
+
+    def __bool__(self) -> bool:
+        return True
+
+    @property
+    def previous_sibling(self):
+        if self.parent is None or self.position == 0:
+            return None
+        return self.parent.contents[self.position - 1]
+
+    @property
+    def next_sibling(self):
+        if self.parent is None or self.position + 1 >= len(self.parent.contents):
+            return None
+        return self.parent.contents[self.position + 1]
+
+    def index(self, child: "LxmlElement") -> int:
+        return child.position
+
+    def find_parent(self, names: str | list[str]):
+        names = [names] if isinstance(names, str) else names
+        parent = self.parent
+        while parent is not None:
+            if parent.name in names:
+                return parent
+            parent = parent.parent
+        return None
+
+    def find_all(self, names: str | list[str]) -> list["LxmlElement"]:
+        names = [names] if isinstance(names, str) else names
+        return [LxmlElement(el) for el in self.element.iterdescendants(*names)]
+
+
+class FastMarkdownConverter(MarkdownConverter):
+    """markdownify converter parsing HTML with lxml instead of BeautifulSoup
+
+    Accepts the same options and produces the same markdown as MarkdownConverter for HTML parsed
+    into the same tree, whitespace-only strings are collapsed like in BeautifulSoup. Output can
+    differ where the parsers fix malformed HTML differently, e.g. unclosed tags or tables without
+    rows. Requires lxml: `pip install lxml`.
+    """
+
+    def convert(self, html: str) -> str:
+        try:
+            from lxml import etree
+        except ImportError as exc:
+            raise ImportError(
+                "FastMarkdownConverter requires lxml, install it with `pip install lxml`"
+            ) from exc
+
+        parser = etree.HTMLParser(encoding="utf-8", huge_tree=True)
+        try:
+            root = etree.fromstring(html.encode("utf-8"), parser)
+        except etree.XMLSyntaxError:  # Empty document
+            return ""
+        if root is None:
+            return ""
+        return self.process_element(LxmlElement(root), convert_as_inline=False)
+
+    def children(self, node: LxmlElement) -> list:
+        element = node.element
+        children = []
+        if element.text:
+            children.append(self.text_node(element.text, node))
+        for child in element:
+            if isinstance(child.tag, str):
+                children.append(LxmlElement(child, parent=node))
+            else:  # Comments and processing instructions
+                children.append(CommentNode(child.text or ""))
+            if child.tail:
+                children.append(self.text_node(child.tail, node))
+        return children
+
+    def text_node(self, text: str, parent: LxmlElement) -> TextNode:
+        """Text node with whitespace-only strings collapsed to one character like BeautifulSoup
+        does, e.g. blank lines between paragraphs become a single newline."""
+        if (
+            not text.strip(ASCII_SPACES)
+            and not parent.in_pre
+            and parent.name != "textarea"
+        ):
+            text = "\n" if "\n" in text else " "
+        return TextNode(text)
+
+    def process_element(self, node: LxmlElement, convert_as_inline: bool) -> str:
+        # markdown headings or cells can't include block elements
+        convert_children_as_inline = convert_as_inline
+        if html_heading_re.match(node.name) is not None or node.name in ("td", "th"):
+            convert_children_as_inline = True
+
+        children = self.children(node)
+        if node.name in NESTED_TAGS:
+            # Remove whitespace-only text nodes at the edges and next to nested nodes, skipping
+            # the node after each removed one exactly like markdownify does
+            idx = 0
+            while idx < len(children):
+                child = children[idx]
+                previous_child = children[idx - 1] if idx > 0 else None
+                next_child = children[idx + 1] if idx + 1 < len(children) else None
+                can_extract = (
+                    previous_child is None
+                    or next_child is None
+                    or previous_child.name in NESTED_TAGS
+                    or next_child.name in NESTED_TAGS
+                )
+                if isinstance(child, TextNode) and not child.strip() and can_extract:
+                    del children[idx]
+                idx += 1
+        node.contents = children
+
+        parts = []
+        for idx, child in enumerate(children):
+            if isinstance(child, LxmlElement):
+                child.position = idx
+                parts.append(self.process_element(child, convert_children_as_inline))
+            elif not isinstance(child, CommentNode):
+                parts.append(self.process_text_node(child, node, idx))
+        text = "".join(parts)
+
+        convert_fn = getattr(self, "convert_%s" % node.name, None)
+        if convert_fn and self.should_convert_tag(node.name):
+            text = convert_fn(node, text, convert_as_inline)
+        return text
+
+    def process_text_node(self, text: str, parent: LxmlElement, idx: int) -> str:
+        # normalize whitespace if we're not inside a preformatted element
+        if not parent.in_pre:
+            text = whitespace_re.sub(" ", text)
+
+        # escape special characters if we're not inside a preformatted or code element
+        if not parent.in_code:
+            text = self.escape(text)
+
+        # remove trailing whitespaces if the text is the last node in li or is followed by
+        # an embedded list
+        if parent.name == "li":
+            next_child = (
+                parent.contents[idx + 1] if idx + 1 < len(parent.contents) else None
+            )
+            if next_child is None or next_child.name in ("ul", "ol"):
+                text = text.rstrip()
+
+        return text
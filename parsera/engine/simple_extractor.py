@@ -5,6 +5,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.output_parsers import JsonOutputParser
 from markdownify import MarkdownConverter
 
+from parsera.conversion import ConversionPool
 from parsera.engine.api_extractor import Extractor
 
 SIMPLE_EXTRACTOR_PROMPT_ONLY_TEMPLATE = """
@@ -45,18 +46,35 @@ class LocalExtractor(Extractor):
         self,
         model: BaseChatModel,
         converter: MarkdownConverter | None = None,
+        conversion_pool: ConversionPool | None = None,
     ):
         self.model = model
         if converter is None:
             self.converter = MarkdownConverter()
         else:
             self.converter = converter
+        self.conversion_pool = conversion_pool
+
+    def to_text(self, content: str, content_format: str = "html") -> str:
+        """Convert HTML to markdown, other formats are already text."""
+        if content_format == "html":
+            return self.converter.convert(content)
+        return content
+
+    async def ato_text(self, content: str, content_format: str = "html") -> str:
+        """Convert HTML to markdown in the conversion pool, when it's set."""
+        if self.conversion_pool is None:
+            return self.to_text(content, content_format=content_format)
+        return await self.conversion_pool.run(
+            content, content_format=content_format, converter=self.converter
+        )
 
     async def run(
         self,
         content: str,
         attributes: dict[str, str] | None = None,
         prompt: str = "",
+        content_format: str = "html",
     ) -> list[dict]:
         if self.system_prompt is None:
             raise ValueError("system_prompt is not defined for this extractor")
@@ -65,7 +83,7 @@ class LocalExtractor(Extractor):
         if not attributes and len(prompt) == 0:
             raise ValueError("At least prompt or attributes has to be provided")
 
-        markdown = self.converter.convert(content)
+        markdown = await self.ato_text(content, content_format=content_format)
         if not attributes:
             human_msg = self.prompt_only_template.format(
                 markdown=markdown, prompt=prompt
@@ -1,10 +1,11 @@
 import json
 import math
-from typing import Any, Callable, List, Literal, Optional, Type
+from typing import Any, AsyncIterator, Callable, List, Literal, Optional, Type
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
 from markdownify import MarkdownConverter
+from parsera.conversion import ConversionPool
 from parsera.engine.chunks_extractor import ChunksTabularExtractor
 from parsera.utils import has_any_non_none_values
 from pydantic import BaseModel, Field, create_model
@@ -35,12 +36,22 @@ class StructuredExtractor(ChunksTabularExtractor):
         chunk_size: int = 100000,
         token_counter: Callable[[str], int] | None = None,
         converter: MarkdownConverter | None = None,
+        conversion_pool: ConversionPool | None = None,
+        record_chunking: bool = False,
+        chunk_concurrency: int | None = None,
+        merge_strategy: Literal["llm", "local"] = "llm",
+        merge_fallback: bool = True,
     ):
         super().__init__(
             model=model,
             chunk_size=chunk_size,
             token_counter=token_counter,
             converter=converter,
+            conversion_pool=conversion_pool,
+            record_chunking=record_chunking,
+            chunk_concurrency=chunk_concurrency,
+            merge_strategy=merge_strategy,
+            merge_fallback=merge_fallback,
         )
         self.structured_model: BaseChatModel | None = None
 
@@ -130,17 +141,40 @@ class StructuredExtractor(ChunksTabularExtractor):
 
         return ListSchemaModel
 
+    def prepare_structured_model(self, attributes: dict[str, dict[str, Any]]) -> None:
+        for value in attributes.values():
+            AttributeData.model_validate(value)
+        OutputSchema = self.create_schema(attributes)
+        self.structured_model = self.model.with_structured_output(schema=OutputSchema)
+
+    async def stream(
+        self,
+        content: str,
+        attributes: dict[str, dict[str, Any]],
+        prompt: str = "",
+        content_format: str = "html",
+    ) -> AsyncIterator[dict]:
+        self.prepare_structured_model(attributes)
+        async for event in super().stream(
+            content=content,
+            attributes=attributes,
+            prompt=prompt,
+            content_format=content_format,
+        ):
+            yield event
+
     async def run(
         self,
         content: str,
         attributes: dict[str, dict[str, Any]],
         prompt: str = "",
+        content_format: str = "html",
     ) -> dict:
-        for value in attributes.values():
-            AttributeData.model_validate(value)
-        OutputSchema = self.create_schema(attributes)
-        self.structured_model = self.model.with_structured_output(schema=OutputSchema)
+        self.prepare_structured_model(attributes)
         output = await super().run(
-            content=content, attributes=attributes, prompt=prompt
+            content=content,
+            attributes=attributes,
+            prompt=prompt,
+            content_format=content_format,
         )
         return output
@@ -8,3 +8,7 @@ class CookiesValidationException(Exception):
 
 class PageContentError(ValueError):
     pass
+
+
+class ShardCrashedError(PageGotoError):
+    pass
@@ -0,0 +1,223 @@
+import re
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+
+import httpx
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64; rv:131.0) Gecko/20100101 Firefox/131.0"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+NOSCRIPT_MARKERS = re.compile(
+    r"(enable|turn on|requires?)\s+javascript|javascript\s+(is\s+)?(required|disabled)",
+    re.IGNORECASE,
+)
+
+# Mount points of client-side rendered applications, which are empty before rendering
+EMPTY_APP_ROOT = re.compile(
+    r"<div[^>]+id=[\"'](root|app|__next|__nuxt|svelte)[\"'][^>]*>\s*</div>",
+    re.IGNORECASE,
+)
+
+
+class TextStats(HTMLParser):
+    """Counts visible text of the document, ignoring scripts and styles."""
+
+    skipped_tags = {"script", "style", "template", "noscript", "head"}
+
+    def __init__(self):
+        super().__init__()
+        self.skipped_depth = 0
+        self.text_nodes = 0
+        self.text_length = 0
+        self.noscript_text = []
+        self.in_noscript = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "noscript":
+            self.in_noscript = True
+        if tag in self.skipped_tags:
+            self.skipped_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag == "noscript":
+            self.in_noscript = False
+        if tag in self.skipped_tags and self.skipped_depth > 0:
+            self.skipped_depth -= 1
+
+    def handle_data(self, data):
+        if self.in_noscript:
+            self.noscript_text.append(data)
+        if self.skipped_depth:
+            return
+        text = data.strip()
+        if text:
+            self.text_nodes += 1
+            self.text_length += len(text)
+
+
+def rendering_reason(
+    html: str, min_text_nodes: int = 10, min_text_length: int = 200
+) -> str | None:
+    """Check if the page has to be rendered with JavaScript.
+
+    Returns:
+        str | None: Reason why the browser is needed or None if HTML has enough content.
+    """
+    stats = TextStats()
+    stats.feed(html)
+    stats.close()
+    if EMPTY_APP_ROOT.search(html):
+        return "empty app root"
+    if stats.text_length == 0:
+        reason = "empty body"
+    elif stats.text_nodes < min_text_nodes:
+        reason = "too few text nodes"
+    elif stats.text_length < min_text_length:
+        reason = "too little text"
+    else:
+        # Server-rendered pages often keep "enable JavaScript" notices of comments or analytics
+        return None
+    if NOSCRIPT_MARKERS.search(" ".join(stats.noscript_text)):
+        return "noscript marker"
+    return reason
+
+
+def proxy_url(proxy_settings: dict) -> str:
+    server = proxy_settings["server"]
+    if "://" not in server:
+        server = f"http://{server}"
+    username = proxy_settings.get("username")
+    if not username:
+        return server
+    parsed = urlparse(server)
+    credentials = username
+    if proxy_settings.get("password"):
+        credentials += f":{proxy_settings['password']}"
+    return parsed._replace(netloc=f"{credentials}@{parsed.netloc}").geturl()
+
+
+def bypass_mounts(bypass: str | None) -> dict[str, httpx.AsyncHTTPTransport]:
+    mounts = {}
+    for domain in (bypass or "").split(","):
+        domain = domain.strip()
+        if not domain:
+            continue
+        if domain.startswith("."):
+            domain = f"*{domain}"
+        mounts[f"all://{domain}"] = httpx.AsyncHTTPTransport()
+    return mounts
+
+
+class HttpFetcher:
+    def __init__(
+        self,
+        proxy_settings: dict | None = None,
+        cookies: list[dict] | None = None,
+        timeout: float = 15.0,
+        max_connections: int = 100,
+        min_text_nodes: int = 10,
+        min_text_length: int = 200,
+    ):
+        """Lightweight fetcher for server-rendered pages
+
+        Args:
+            proxy_settings (dict | None, optional): Proxy in the same format as for PageLoader.
+                Defaults to None.
+            cookies (list[dict] | None, optional): Cookies in Playwright format. Defaults to None.
+            timeout (float, optional): Request timeout in seconds. Defaults to 15.0.
+            max_connections (int, optional): Size of the connection pool. Defaults to 100.
+            min_text_nodes (int, optional): Pages with fewer text nodes are rendered in the
+                browser. Defaults to 10.
+            min_text_length (int, optional): Pages with shorter visible text are rendered in the
+                browser. Defaults to 200.
+        """
+        self.proxy_settings = proxy_settings
+        self.cookies = cookies
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.min_text_nodes = min_text_nodes
+        self.min_text_length = min_text_length
+        self.client: httpx.AsyncClient | None = None
+
+    def create_client(self) -> httpx.AsyncClient:
+        jar = httpx.Cookies()
+        for cookie in self.cookies or []:
+            domain = cookie.get("domain") or urlparse(cookie.get("url", "")).hostname
+            jar.set(
+                cookie["name"],
+                cookie["value"],
+                domain=domain or "",
+                path=cookie.get("path", "/"),
+            )
+        proxy = None
+        mounts = None
+        if self.proxy_settings:
+            proxy = proxy_url(self.proxy_settings)
+            mounts = bypass_mounts(self.proxy_settings.get("bypass"))
+        return httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            cookies=jar,
+            proxy=proxy,
+            mounts=mounts,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.max_connections),
+        )
+
+    async def get(self, url: str, headers: dict | None = None) -> httpx.Response:
+        if self.client is None:
+            self.client = self.create_client()
+        return await self.client.get(url, headers=headers)
+
+    async def fetch(self, url: str) -> tuple[httpx.Response | None, str | None]:
+        """Fetch the page over plain HTTP.
+
+        Returns:
+            tuple[httpx.Response | None, str | None]: Response with HTML of the page, or None
+                with the reason why it has to be rendered in the browser.
+        """
+        try:
+            response = await self.get(url)
+        except httpx.HTTPError as exc:
+            return None, f"request failed: {exc.__class__.__name__}"
+        if response.status_code != 200:
+            return None, f"status {response.status_code}"
+        content_type = response.headers.get("content-type", "")
+        if "html" not in content_type:
+            return None, f"content type {content_type or 'unknown'}"
+
+        reason = rendering_reason(
+            response.text,
+            min_text_nodes=self.min_text_nodes,
+            min_text_length=self.min_text_length,
+        )
+        if reason is not None:
+            return None, reason
+        return response, None
+
+    async def is_not_modified(
+        self, url: str, etag: str | None, last_modified: str | None
+    ) -> bool:
+        """Revalidate cached page with a conditional request."""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        if not headers:
+            return False
+        try:
+            response = await self.get(url, headers=headers)
+        except httpx.HTTPError:
+            return False
+        return response.status_code == 304
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
@@ -0,0 +1,75 @@
+import re
+from typing import Iterable
+
+from parsera.blocking import DEFAULT_BLOCKED_URL_PATTERNS
+
+DEFAULT_DENIED_FRAME_PATTERNS = DEFAULT_BLOCKED_URL_PATTERNS + (
+    r"amazon-adsystem\.com",
+    r"adsrvr\.org",
+    r"rubiconproject\.com",
+    r"pubmatic\.com",
+    r"casalemedia\.com",
+    r"moatads\.com",
+    r"recaptcha",
+    r"hcaptcha\.com",
+    r"challenges\.cloudflare\.com",
+)
+
+
+class IframePolicy:
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        max_frame_size: int = 1_000_000,
+        max_total_size: int = 3_000_000,
+        allowed_url_patterns: Iterable[str] | None = None,
+        denied_url_patterns: Iterable[str] = DEFAULT_DENIED_FRAME_PATTERNS,
+    ):
+        """Limits for harvesting HTML of iframes
+
+        Args:
+            timeout (float, optional): Seconds to wait for HTML of a single frame.
+                Defaults to 5.0.
+            max_frame_size (int, optional): Frames with larger HTML (in characters) are skipped.
+                Defaults to 1_000_000.
+            max_total_size (int, optional): Budget for HTML of all iframes together, frames are
+                taken in the document order until it's exhausted. Defaults to 3_000_000.
+            allowed_url_patterns (Iterable[str] | None, optional): Regular expressions, if set
+                only frames with matching URL are harvested. Defaults to None.
+            denied_url_patterns (Iterable[str], optional): Regular expressions for frames to
+                skip. Defaults to common ad, tracking and captcha frames.
+        """
+        self.timeout = timeout
+        self.max_frame_size = max_frame_size
+        self.max_total_size = max_total_size
+        self.allowed_url_patterns = (
+            None
+            if allowed_url_patterns is None
+            else [re.compile(p, re.IGNORECASE) for p in allowed_url_patterns]
+        )
+        self.denied_url_patterns = [
+            re.compile(p, re.IGNORECASE) for p in denied_url_patterns
+        ]
+
+    def options(self) -> dict:
+        """Settings changing the content of the page, used in cache keys."""
+        return {
+            "timeout": self.timeout,
+            "max_frame_size": self.max_frame_size,
+            "max_total_size": self.max_total_size,
+            "allowed_url_patterns": (
+                None
+                if self.allowed_url_patterns is None
+                else [pattern.pattern for pattern in self.allowed_url_patterns]
+            ),
+            "denied_url_patterns": [
+                pattern.pattern for pattern in self.denied_url_patterns
+            ],
+        }
+
+    def accepts(self, url: str) -> bool:
+        if any(pattern.search(url) for pattern in self.denied_url_patterns):
+            return False
+        if self.allowed_url_patterns is None:
+            return True
+        return any(pattern.search(url) for pattern in self.allowed_url_patterns)
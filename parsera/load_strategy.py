@@ -0,0 +1,182 @@
+import asyncio
+import json
+import os
+import re
+import statistics
+import tempfile
+from pathlib import Path
+from urllib.parse import urlparse
+
+LOAD_STATES = ("domcontentloaded", "load", "networkidle")
+DEFAULT_STATS_PATH = Path.home() / ".cache" / "parsera" / "load_states.json"
+NUMBER = re.compile(r"\d+")
+
+
+def path_pattern(url: str) -> str:
+    """Path of the URL with numbers replaced, so pages of the same template share statistics."""
+    return NUMBER.sub("0", urlparse(url).path) or "/"
+
+
+class LoadStateStrategy:
+    def __init__(
+        self,
+        path: str | Path | None = DEFAULT_STATS_PATH,
+        min_samples: int = 3,
+        completeness: float = 0.95,
+        success_rate: float = 0.9,
+        history_size: int = 20,
+        explore_every: int = 25,
+        max_patterns: int = 200,
+    ):
+        """Picks the cheapest load state which historically produced complete content per domain
+
+        Args:
+            path (str | Path | None, optional): JSON file to persist statistics between runs, if
+                None statistics are kept in memory. Defaults to ~/.cache/parsera/load_states.json.
+            min_samples (int, optional): Number of observations of a load state required before
+                it can be picked. Defaults to 3.
+            completeness (float, optional): Share of the final text size the content should have
+                to be considered complete. Defaults to 0.95.
+            success_rate (float, optional): Minimum share of complete observations for the load
+                state to be picked. Defaults to 0.9.
+            history_size (int, optional): Number of recent observations kept per load state.
+                Defaults to 20.
+            explore_every (int, optional): Every n-th fetch of the domain measures all load
+                states to refresh statistics. Defaults to 25.
+            max_patterns (int, optional): Number of path patterns per domain with known final
+                text sizes, least recently fetched ones are forgotten above it. Defaults to 200.
+        """
+        self.path = Path(path).expanduser() if path is not None else None
+        self.min_samples = min_samples
+        self.completeness = completeness
+        self.success_rate = success_rate
+        self.history_size = history_size
+        self.explore_every = explore_every
+        self.max_patterns = max_patterns
+        self.stats: dict[str, dict] = self.load()
+
+    def load(self) -> dict[str, dict]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def write(self, data: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            file.write(data)
+        os.replace(tmp_path, self.path)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.write(json.dumps(self.stats))
+
+    async def asave(self) -> None:
+        """Save statistics without blocking the event loop, the snapshot is taken on the loop."""
+        if self.path is None:
+            return
+        await asyncio.to_thread(self.write, json.dumps(self.stats))
+
+    def domain_stats(self, url: str) -> dict:
+        domain = urlparse(url).hostname or ""
+        return self.stats.setdefault(
+            domain,
+            {
+                "fetches": 0,
+                "stable_durations": [],
+                "states": {
+                    state: {"complete": [], "durations": []} for state in LOAD_STATES
+                },
+            },
+        )
+
+    def needs_exploration(self, url: str) -> bool:
+        stats = self.domain_stats(url)
+        if stats["fetches"] % self.explore_every == 0:
+            return True
+        return any(
+            len(state["complete"]) < self.min_samples
+            for state in stats["states"].values()
+        )
+
+    def choose(self, url: str) -> str:
+        """Cheapest load state with reliable history, networkidle when unsure."""
+        states = self.domain_stats(url)["states"]
+        for state in LOAD_STATES:
+            outcomes = states[state]["complete"]
+            if (
+                len(outcomes) >= self.min_samples
+                and sum(outcomes) / len(outcomes) >= self.success_rate
+            ):
+                return state
+        return LOAD_STATES[-1]
+
+    def final_sizes(self, url: str) -> list[int]:
+        """Text sizes at networkidle of the recent pages with the same path pattern."""
+        patterns = self.domain_stats(url).setdefault("patterns", {})
+        return patterns.get(path_pattern(url), [])
+
+    def looks_complete(
+        self, url: str, size: int, previous_size: int | None = None
+    ) -> bool:
+        """Whether the content is as large as on the pages with the same path pattern, or stopped
+        growing since the previous load state when there are no such pages yet.
+
+        Args:
+            url (str): Fetched URL.
+            size (int): Visible text size at the current load state.
+            previous_size (int | None, optional): Visible text size at the previous load state.
+                Defaults to None.
+        """
+        final_sizes = self.final_sizes(url)
+        if final_sizes:
+            return size >= self.completeness * statistics.median(final_sizes)
+        if previous_size is not None:
+            return previous_size >= self.completeness * size
+        return True
+
+    def append(self, values: list, value) -> None:
+        values.append(value)
+        del values[: -self.history_size]
+
+    def record(
+        self, url: str, timings: dict[str, float], sizes: dict[str, int]
+    ) -> None:
+        """Record load states waited during one fetch.
+
+        Args:
+            url (str): Fetched URL.
+            timings (dict[str, float]): Seconds from navigation start to each load state.
+            sizes (dict[str, int]): Visible text size at each load state.
+        """
+        stats = self.domain_stats(url)
+        stats["fetches"] += 1
+        measured = [state for state in LOAD_STATES if state in sizes]
+        final_state = measured[-1]
+        final_size = sizes[final_state]
+        for state in measured:
+            # States below the target of the fetch count as complete when their content was
+            # already full, so they aren't locked out until the next exploration
+            complete = sizes[state] >= self.completeness * final_size
+            self.append(stats["states"][state]["complete"], complete)
+            self.append(stats["states"][state]["durations"], timings[state])
+        stable_state = next(
+            state
+            for state in measured
+            if sizes[state] >= self.completeness * final_size
+        )
+        self.append(stats["stable_durations"], timings[stable_state])
+        # Fetches stopped at a cheaper state can be incomplete, so they don't set the baseline
+        if final_state == LOAD_STATES[-1]:
+            patterns = stats.setdefault("patterns", {})
+            pattern = path_pattern(url)
+            sizes_of_pattern = patterns.pop(pattern, [])
+            self.append(sizes_of_pattern, final_size)
+            # Patterns are kept in the order of the last fetch
+            patterns[pattern] = sizes_of_pattern
+            for stale in list(patterns)[: -self.max_patterns]:
+                del patterns[stale]
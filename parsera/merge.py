@@ -0,0 +1,268 @@
+import json
+import math
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Any
+
+WHITESPACE = re.compile(r"\s+")
+NUMBER = re.compile(r"\d+")
+
+
+def is_missing(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return WHITESPACE.sub(" ", value).strip().lower()
+    return value
+
+
+class NormalizedValue:
+    """Normalized value with the numbers and characters it contains, used to compare values."""
+
+    __slots__ = ("value", "numbers", "_chars")
+
+    def __init__(self, value: Any):
+        self.value = normalize(value)
+        self.numbers = (
+            NUMBER.findall(self.value) if isinstance(self.value, str) else None
+        )
+        self._chars: Counter[str] | None = None
+
+    @property
+    def chars(self) -> Counter[str]:
+        if self._chars is None:
+            self._chars = Counter(self.value)
+        return self._chars
+
+
+def normalize_row(row: dict) -> dict[str, NormalizedValue]:
+    """Normalized values of the row, without missing values."""
+    return {
+        key: NormalizedValue(value)
+        for key, value in row.items()
+        if not is_missing(value)
+    }
+
+
+def is_prefix(shorter: Any, longer: Any) -> bool:
+    if not isinstance(shorter, str) or not isinstance(longer, str):
+        return False
+    if not shorter or len(shorter) >= len(longer) or not longer.startswith(shorter):
+        return False
+    # "item 1" is not a truncated "item 10"
+    return not (shorter[-1].isdigit() and longer[len(shorter)].isdigit())
+
+
+def is_truncation(shorter: Any, longer: Any) -> bool:
+    """Whether the first value is the start of the second one, cut by the chunk border."""
+    return is_prefix(normalize(shorter), normalize(longer))
+
+
+def values_match(
+    first: NormalizedValue, second: NormalizedValue, min_similarity: float = 0.85
+) -> bool:
+    """Whether normalized values are equal, truncated or similar."""
+    value, other = first.value, second.value
+    if value == other or is_prefix(value, other) or is_prefix(other, value):
+        return True
+    # Similar values with different numbers are usually different records
+    if first.numbers is None or first.numbers != second.numbers:
+        return False
+    # Upper bounds of the ratio from the lengths and the shared characters, which are cheaper
+    # than building the matcher
+    total = len(value) + len(other)
+    if 2 * min(len(value), len(other)) < min_similarity * total:
+        return False
+    if 2 * sum((first.chars & second.chars).values()) < min_similarity * total:
+        return False
+    return SequenceMatcher(None, value, other).ratio() >= min_similarity
+
+
+def is_distinctive(value: Any) -> bool:
+    """Whether the value can identify a record, unlike prices or counters."""
+    return (
+        isinstance(value, str) and len(value) >= 3 and any(c.isalpha() for c in value)
+    )
+
+
+def rows_match(first: dict, second: dict, min_share: float = 0.5) -> bool:
+    """Whether normalized rows describe the same record: all values present in both rows
+    match, or most of them including a distinctive one.
+    """
+    shared = [key for key in first if key in second]
+    if not shared:
+        return False
+    allowed_mismatches = len(shared) * (1 - min_share)
+    mismatched = 0
+    distinctive = False
+    for key in shared:
+        if values_match(first[key], second[key]):
+            distinctive = distinctive or is_distinctive(first[key].value)
+            continue
+        mismatched += 1
+        if mismatched > allowed_mismatches:
+            return False
+    return mismatched == 0 or distinctive
+
+
+def merge_rows(first: dict, second: dict, first_distance: int, second_distance: int):
+    """Merge two versions of the same row, following the rules of the LLM merge prompt.
+
+    Missing values are taken from the other row, truncated values are replaced by the full
+    ones and conflicting values are taken from the row further from the chunk border.
+    """
+    merged = {}
+    for key in [*first, *(key for key in second if key not in first)]:
+        value, other = first.get(key), second.get(key)
+        if is_missing(value):
+            merged[key] = other if key in second else value
+        elif is_missing(other) or normalize(value) == normalize(other):
+            merged[key] = value
+        elif is_truncation(value, other):
+            merged[key] = other
+        elif is_truncation(other, value):
+            merged[key] = value
+        else:
+            merged[key] = value if first_distance >= second_distance else other
+    return merged
+
+
+def row_key(row: dict[str, NormalizedValue]) -> str:
+    """Hashable fingerprint of the normalized row."""
+    return json.dumps(
+        {key: value.value for key, value in row.items()}, sort_keys=True, default=str
+    )
+
+
+def align(previous: list[dict], current: list[dict]) -> list[tuple[int, int]]:
+    """Pairs of indices of matching rows, the longest sequence of matches keeping the order of
+    both lists.
+
+    Rows with identical normalized values are matched by their fingerprints, only rows without
+    an identical counterpart are compared with each other.
+    """
+    previous_rows = [normalize_row(row) for row in previous]
+    current_rows = [normalize_row(row) for row in current]
+    previous_keys = [row_key(row) for row in previous_rows]
+    current_keys = [row_key(row) for row in current_rows]
+    shared = set(previous_keys) & set(current_keys)
+    matches = [
+        [
+            (
+                key == other_key
+                if key in shared or other_key in shared
+                else rows_match(row, other)
+            )
+            for other, other_key in zip(current_rows, current_keys)
+        ]
+        for row, key in zip(previous_rows, previous_keys)
+    ]
+    lengths = [[0] * (len(current) + 1) for _ in range(len(previous) + 1)]
+    for i in range(len(previous) - 1, -1, -1):
+        for j in range(len(current) - 1, -1, -1):
+            if matches[i][j]:
+                lengths[i][j] = lengths[i + 1][j + 1] + 1
+            else:
+                lengths[i][j] = max(lengths[i + 1][j], lengths[i][j + 1])
+    pairs = []
+    i = j = 0
+    while i < len(previous) and j < len(current):
+        if matches[i][j] and lengths[i][j] == lengths[i + 1][j + 1] + 1:
+            pairs.append((i, j))
+            i += 1
+            j += 1
+        elif lengths[i + 1][j] >= lengths[i][j + 1]:
+            i += 1
+        else:
+            j += 1
+    return pairs
+
+
+def merge_overlap(
+    previous: list[dict], current: list[dict], overlap_share: float = 0.5
+) -> tuple[list[dict], int]:
+    """Merge rows of adjacent chunks, returns merged rows and index of the first row that
+    includes data of the current chunk.
+
+    Only the tail of the previous rows and the head of the current ones can overlap, at most
+    `overlap_share` of the rows of the longer list, since the last chunk can be short.
+    """
+    overlap = math.ceil(max(len(previous), len(current)) * overlap_share)
+    tail_start = max(len(previous) - overlap, 0)
+    head_end = overlap
+    tail, head = previous[tail_start:], current[:head_end]
+    merged = previous[:tail_start]
+    from_current = [False] * tail_start
+    i = j = 0
+    for pair_i, pair_j in align(tail, head):
+        merged.extend(tail[i:pair_i])
+        from_current.extend([False] * (pair_i - i))
+        merged.extend(head[j:pair_j])
+        from_current.extend([True] * (pair_j - j))
+        merged.append(
+            merge_rows(
+                tail[pair_i],
+                head[pair_j],
+                first_distance=len(tail) - 1 - pair_i,
+                second_distance=pair_j,
+            )
+        )
+        from_current.append(True)
+        i, j = pair_i + 1, pair_j + 1
+    merged.extend(tail[i:])
+    from_current.extend([False] * (len(tail) - i))
+    merged.extend(current[j:])
+    from_current.extend([True] * (len(current) - j))
+    if True not in from_current:
+        return merged, len(merged)
+    return merged, from_current.index(True)
+
+
+class ChunkMerger:
+    """Incremental merge of rows extracted from consecutive chunks of the page.
+
+    Rows are final once they are merged with the next chunk and aren't part of its overlap,
+    rows of the last chunk are final when the page ends.
+    """
+
+    def __init__(self):
+        # Rows of the previous chunk, which can overlap with the next one
+        self.window: list[dict] = []
+
+    def add(self, data: list[dict]) -> list[dict]:
+        """Merge rows of the next chunk, returns rows which became final."""
+        if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+            raise ValueError("Only lists of rows can be merged locally")
+        if not data:
+            return []
+        merged, first_current = merge_overlap(self.window, data)
+        self.window = merged[first_current:]
+        return merged[:first_current]
+
+    def finish(self) -> list[dict]:
+        """Rows of the last chunk."""
+        rows, self.window = self.window, []
+        return rows
+
+
+def merge_chunks(all_data: list[list[dict]]) -> list[dict]:
+    """Merge rows extracted from overlapping chunks of the page without calling the model.
+
+    Args:
+        all_data (list[list[dict]]): Rows extracted from each chunk, in the page order.
+
+    Raises:
+        ValueError: Data of some chunk is not a list of rows.
+
+    Returns:
+        list[dict]: Rows of the page without duplicates from the chunk overlaps.
+    """
+    merger = ChunkMerger()
+    result: list[dict] = []
+    for data in all_data:
+        result.extend(merger.add(data))
+    result.extend(merger.finish())
+    return result
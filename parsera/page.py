@@ -1,12 +1,132 @@
 import asyncio
+import logging
+from collections import deque
 from typing import Awaitable, Callable, Literal, TypedDict
 
-from playwright.async_api import Browser, BrowserContext, Page, Playwright
+import httpx
+from playwright.async_api import Browser, BrowserContext, Frame, Page, Playwright
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
 from playwright_stealth import StealthConfig, stealth_async
 
+from parsera.accessibility import accessibility_snapshot
+from parsera.blocking import ResourceBlocker
+from parsera.cache import CacheEntry, PageCache
+from parsera.capture import ResponseCapture
 from parsera.exceptions import CookiesValidationException, PageGotoError
+from parsera.fetcher import HttpFetcher
+from parsera.frames import IframePolicy
+from parsera.load_strategy import LOAD_STATES, LoadStateStrategy
+from parsera.pool import PagePool, PageSlot
+from parsera.pruning import DomPruner
+from parsera.recycling import JS_HEAP_SIZE_SCRIPT, RecyclePolicy
+from parsera.scoping import (
+    FIND_ROOTS_FUNCTION,
+    SELECTED_HTML_SCRIPT,
+    is_xpath,
+    normalize_selectors,
+    select_html,
+)
+from parsera.sessions import SessionStore
+
+logger = logging.getLogger(__name__)
+
+
+# Resolves once the DOM stays unchanged for `quiet` ms after a mutation or when `timeout` expires
+WAIT_FOR_MUTATIONS_SCRIPT = """
+({ timeout, quiet }) => new Promise((resolve) => {
+    let quietTimer = null;
+    const finish = (reason) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve(reason);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish("mutation"), quiet);
+    });
+    observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+    const deadline = setTimeout(() => finish("timeout"), timeout);
+})
+"""
+
+# Tracks element nodes added to the page after the initial snapshot. HTML of the added nodes is
+# frozen when they are removed from the page, e.g. by virtualized lists. With root selectors only
+# nodes inside of the matching elements are tracked.
+TRACK_ADDED_NODES_SCRIPT = (
+    """
+(selectors) => {
+"""
+    + FIND_ROOTS_FUNCTION
+    + """
+    const tracked = [];
+    const index = new WeakMap();
+    const frozen = new Map();
+    // Pruning function is defined by DomPruner when it's used
+    const serialize = window.parseraPrune || ((node) => node.outerHTML);
+    const freeze = (node) => {
+        const idx = index.get(node);
+        if (!frozen.has(idx)) frozen.set(idx, serialize(node));
+    };
+    const inScope = (node, roots) =>
+        roots === null || roots.some((root) => root.contains(node) || node.contains(root));
+    const observer = new MutationObserver((mutations) => {
+        const roots = selectors ? findRoots(selectors) : null;
+        mutations.forEach((mutation) => {
+            mutation.addedNodes.forEach((node) => {
+                if (node.nodeType !== 1) return; // Only track element nodes
+                if (index.has(node)) {
+                    frozen.delete(index.get(node)); // Node was moved, keep the live version
+                } else if (inScope(node, roots)) {
+                    index.set(node, tracked.length);
+                    tracked.push(node);
+                }
+            });
+            mutation.removedNodes.forEach((node) => {
+                if (node.nodeType !== 1) return;
+                if (index.has(node)) {
+                    freeze(node);
+                } else {
+                    // Node from the initial snapshot, keep the new content rendered inside of it
+                    tracked.forEach((added) => { if (node.contains(added)) freeze(added); });
+                }
+            });
+        });
+    });
+    observer.observe(document.body, { childList: true, subtree: true });
+    window.parseraAddedContent = { tracked, index, frozen, observer };
+}
+"""
+)
+
+# Returns HTML of the outermost added nodes in the order of their appearance
+COLLECT_ADDED_NODES_SCRIPT = """
+() => {
+    const { tracked, index, frozen, observer } = window.parseraAddedContent;
+    observer.disconnect();
+    const serialize = window.parseraPrune || ((node) => node.outerHTML);
+    const isNested = (node) => {
+        for (let parent = node.parentNode; parent; parent = parent.parentNode) {
+            if (index.has(parent)) return true;
+        }
+        return false;
+    };
+    return tracked.flatMap((node, idx) => {
+        if (isNested(node)) return [];
+        if (frozen.has(idx)) return [frozen.get(idx)];
+        return node.isConnected ? [serialize(node)] : [];
+    });
+}
+"""
+
+# Returns null for documents over the size limit to avoid transferring them
+BOUNDED_OUTER_HTML_SCRIPT = """
+(limit) => {
+    const html = document.documentElement.outerHTML;
+    return html.length > limit ? null : html;
+}
+"""
 
 
 class ProxySettings(TypedDict, total=False):
@@ -16,15 +136,138 @@ class ProxySettings(TypedDict, total=False):
     password: str | None = None
 
 
+class NetworkTracker:
+    """Counts in-flight requests of the page to detect when the network settles."""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.inflight = 0
+        self.idle = asyncio.Event()
+        self.idle.set()
+
+    def on_request(self, _) -> None:
+        self.inflight += 1
+        self.idle.clear()
+
+    def on_request_done(self, _) -> None:
+        self.inflight = max(self.inflight - 1, 0)
+        if self.inflight == 0:
+            self.idle.set()
+
+    def start(self) -> None:
+        self.page.on("request", self.on_request)
+        self.page.on("requestfinished", self.on_request_done)
+        self.page.on("requestfailed", self.on_request_done)
+
+    def stop(self) -> None:
+        self.page.remove_listener("request", self.on_request)
+        self.page.remove_listener("requestfinished", self.on_request_done)
+        self.page.remove_listener("requestfailed", self.on_request_done)
+
+
 class PageLoader:
     def __init__(
-        self, browser: Browser | None = None, custom_cookies: list[dict] | None = None
+        self,
+        browser: Browser | None = None,
+        custom_cookies: list[dict] | None = None,
+        max_concurrency: int = 1,
+        resource_blocker: ResourceBlocker | None = None,
+        scroll_timeout: float = 2.0,
+        scroll_settle: float = 0.25,
+        http_fast_path: bool = False,
+        cache: PageCache | None = None,
+        iframe_policy: IframePolicy | None = None,
+        load_strategy: LoadStateStrategy | None = None,
+        recycle_policy: RecyclePolicy | None = None,
+        dom_pruner: DomPruner | None = None,
+        session_store: SessionStore | None = None,
+        response_capture: ResponseCapture | None = None,
+        content_format: Literal["html", "accessibility"] = "html",
     ):
+        """Initialize PageLoader
+
+        Args:
+            browser (Browser | None, optional): Playwright browser to use, if None Firefox is
+                launched on session creation. Defaults to None.
+            custom_cookies (list[dict] | None, optional): List of custom cookies to be added to
+                every browser context. Defaults to None.
+            max_concurrency (int, optional): Maximum number of pages fetched concurrently, each
+                concurrent fetch gets its own browser context from the pool. Defaults to 1.
+            resource_blocker (ResourceBlocker | None, optional): Policy to abort requests for
+                images, fonts, media, trackers, etc. during page loading. If None all resources
+                are loaded. Defaults to None.
+            scroll_timeout (float, optional): Maximum number of seconds to wait for new content
+                after each scroll. Defaults to 2.0.
+            scroll_settle (float, optional): Number of seconds without DOM changes after which
+                the new content is considered loaded. Defaults to 0.25.
+            http_fast_path (bool, optional): Whether to fetch pages with plain HTTP first and
+                render them in the browser only when the content requires JavaScript. The
+                browser is launched only when needed. Defaults to False.
+            cache (PageCache | None, optional): On-disk cache of fetched pages, if None pages
+                are always fetched. Defaults to None.
+            iframe_policy (IframePolicy | None, optional): Timeouts, size budgets and URL filters
+                for harvesting iframes. Defaults to IframePolicy with default limits.
+            load_strategy (LoadStateStrategy | None, optional): Per-domain statistics used to
+                pick the load state to wait for, when it's not passed to `fetch_page`. If None
+                pages wait for networkidle. Defaults to None.
+            recycle_policy (RecyclePolicy | None, optional): Rules for replacing browser
+                contexts after a number of navigations, memory growth or errors, if None
+                contexts live until the session is closed. Defaults to None.
+            dom_pruner (DomPruner | None, optional): Pass removing scripts, styles, hidden
+                elements and unused attributes in the page before its HTML is serialized, if
+                None the full HTML is returned. Defaults to None.
+            session_store (SessionStore | None, optional): Saved storage state reused instead
+                of executing the initial script while it's valid. Defaults to None.
+            response_capture (ResponseCapture | None, optional): Policy recording JSON responses
+                of the page, which are added to its content or replace it. Pages are always
+                rendered in the browser when it's set. Defaults to None.
+            content_format (Literal["html", "accessibility"], optional): Representation of the
+                page, "html" or "accessibility" for a compact text snapshot of the accessibility
+                tree with roles, names, values and links. Defaults to "html".
+        """
         self.playwright: Playwright | None = None
         self.browser: Browser | None = browser
         self.custom_cookies: list[dict] | None = custom_cookies
-        self.context: BrowserContext | None = None
-        self.page: Page | None = None
+        self.max_concurrency = max_concurrency
+        self.resource_blocker = resource_blocker
+        self.scroll_timeout = scroll_timeout
+        self.scroll_settle = scroll_settle
+        # Timings of the recent scrolls, useful for tuning scroll_timeout and scroll_settle
+        self.scroll_stats: deque[dict] = deque(maxlen=1000)
+        self.http_fast_path = http_fast_path
+        self.http_fetcher: HttpFetcher | None = None
+        self.cache = cache
+        self.iframe_policy = iframe_policy or IframePolicy()
+        self.load_strategy = load_strategy
+        self.recycle_policy = recycle_policy
+        self.dom_pruner = dom_pruner
+        self.session_store = session_store
+        self.response_capture = response_capture
+        if content_format not in ("html", "accessibility"):
+            raise ValueError(f"Unknown content format: {content_format}")
+        self.content_format = content_format
+        # Records of the recent context replacements with their reasons
+        self.recycle_log: deque[dict] = deque(maxlen=1000)
+        # Records of the recent fetches with the path used for each URL, "http" or "browser"
+        self.fetch_log: deque[dict] = deque(maxlen=1000)
+        self.primary: PageSlot | None = None
+        self.pool: PagePool | None = None
+        self.session_options: dict = {}
+        self._user_agent: str | None = None
+        self._user_agent_browser: Browser | None = None
+        self._session_lock = asyncio.Lock()
+
+    @property
+    def context(self) -> BrowserContext | None:
+        return self.primary.context if self.primary else None
+
+    @property
+    def page(self) -> Page | None:
+        return self.primary.page if self.primary else None
+
+    @page.setter
+    def page(self, page: Page) -> None:
+        self.primary.page = page
 
     async def new_browser(self) -> None:
         if not self.playwright:
@@ -36,24 +279,35 @@ class PageLoader:
         # slow_mo mode is just only to deal with js rendering
         self.browser = await self.playwright.firefox.launch(headless=True)
 
-    async def stealth(
-        self,
-        page: Page,
-        proxy_settings: ProxySettings | None,
-    ) -> Page:
-        user_agent = await page.evaluate("navigator.userAgent")
-        user_agent = user_agent.replace("HeadlessChrome/", "Chrome/")
-        await self.context.close()
-
-        self.context = await self.browser.new_context(
-            user_agent=user_agent, proxy=proxy_settings
-        )
-        if self.custom_cookies is not None:
+    async def prepare_context(
+        self, context: BrowserContext, storage_state: dict | None = None
+    ) -> None:
+        if self.custom_cookies is not None and storage_state is None:
             try:
-                await self.context.add_cookies(self.custom_cookies)
+                await context.add_cookies(self.custom_cookies)
             except Exception as exc:
                 raise CookiesValidationException(str(exc)) from exc
-        page = await self.context.new_page()
+        if self.resource_blocker is not None:
+            await self.resource_blocker.attach(context)
+
+    async def user_agent(self) -> str | None:
+        """User agent without headless marker, computed once per browser."""
+        if self._user_agent_browser is not self.browser:
+            user_agent = None
+            # Only Chromium reveals headless mode in the user agent
+            if self.browser.browser_type.name == "chromium":
+                context = await self.browser.new_context()
+                try:
+                    page = await context.new_page()
+                    user_agent = await page.evaluate("navigator.userAgent")
+                finally:
+                    await context.close()
+                user_agent = user_agent.replace("HeadlessChrome/", "Chrome/")
+            self._user_agent = user_agent
+            self._user_agent_browser = self.browser
+        return self._user_agent
+
+    async def stealth(self, page: Page) -> Page:
         await stealth_async(
             page,
             config=StealthConfig(
@@ -65,143 +319,664 @@ class PageLoader:
 
         return page
 
+    async def new_slot(
+        self,
+        proxy_settings: ProxySettings | None = None,
+        stealth: bool = True,
+        storage_state: dict | None = None,
+    ) -> PageSlot:
+        user_agent = await self.user_agent() if stealth else None
+        context = await self.browser.new_context(
+            user_agent=user_agent, proxy=proxy_settings, storage_state=storage_state
+        )
+        await self.prepare_context(context, storage_state=storage_state)
+        page = await context.new_page()
+        if stealth:
+            page = await self.stealth(page)
+        return PageSlot(context=context, page=page)
+
+    async def new_pool_slot(self) -> PageSlot:
+        # Additional contexts inherit cookies and local storage of the primary one, so the
+        # state produced by the initial script is shared without running it again
+        storage_state = await self.primary.context.storage_state()
+        return await self.new_slot(
+            proxy_settings=self.session_options.get("proxy_settings"),
+            stealth=self.session_options.get("stealth", True),
+            storage_state=storage_state,
+        )
+
     async def create_session(
         self,
         proxy_settings: ProxySettings | None = None,
         playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
         stealth: bool = True,
+        resource_blocker: ResourceBlocker | None = None,
     ) -> None:
+        if resource_blocker is not None:
+            self.resource_blocker = resource_blocker
         if not self.browser:
             await self.new_browser()
-        self.context = await self.browser.new_context(proxy=proxy_settings)
-
-        if self.custom_cookies is not None:
-            try:
-                await self.context.add_cookies(self.custom_cookies)
-            except Exception as exc:
-                raise CookiesValidationException(str(exc)) from exc
-        self.page = await self.context.new_page()
-        if stealth:
-            self.page = await self.stealth(
-                page=self.page, proxy_settings=proxy_settings
+        self.session_options = {
+            "proxy_settings": proxy_settings,
+            "playwright_script": playwright_script,
+            "stealth": stealth,
+        }
+        if self.session_store is not None:
+            self.primary = await self.restore_slot(
+                proxy_settings=proxy_settings,
+                playwright_script=playwright_script,
+                stealth=stealth,
+            )
+        else:
+            self.primary = await self.new_slot(
+                proxy_settings=proxy_settings, stealth=stealth
             )
+            if playwright_script:
+                self.primary.page = await playwright_script(self.primary.page)
 
-        if playwright_script:
-            self.page = await playwright_script(self.page)
-
-    async def scroll_page(self, scrolls_limit: int = 0):
-        # Start tracking removed content with MutationObserver
-        await self.page.evaluate(
-            """
-            window.removedContent = [];
-            const observer = new MutationObserver((mutations) => {
-                mutations.forEach(mutation => {
-                    if (mutation.removedNodes.length > 0) {
-                        mutation.removedNodes.forEach(node => {
-                            if (node.nodeType === 1) { // Only store element nodes
-                                window.removedContent.push(node.outerHTML);
-                            }
-                        });
-                    }
-                });
-            });
-            observer.observe(document.body, { childList: true, subtree: true });
-        """
-        )
+        self.pool = PagePool(factory=self.new_pool_slot, max_size=self.max_concurrency)
+        self.pool.add(self.primary)
 
-        # Function to perform the scrolling
-        scrolls = 0
-        last_height = 0
-        captured_content = []
+    async def restore_slot(
+        self,
+        proxy_settings: ProxySettings | None = None,
+        playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        stealth: bool = True,
+    ) -> PageSlot:
+        """Slot with the saved storage state, executing the script only if it's rejected."""
+        store = self.session_store
+        state = await asyncio.to_thread(store.load)
+        slot = await self.saved_state_slot(state, proxy_settings, stealth)
+        if slot is not None:
+            return slot
+
+        async with store.lock():
+            # Another worker could log in while we were waiting for the lock
+            fresh_state = await asyncio.to_thread(store.load)
+            if fresh_state != state:
+                slot = await self.saved_state_slot(fresh_state, proxy_settings, stealth)
+                if slot is not None:
+                    return slot
+
+            slot = await self.new_slot(proxy_settings=proxy_settings, stealth=stealth)
+            if playwright_script:
+                slot.page = await playwright_script(slot.page)
+            storage_state = await slot.context.storage_state()
+            await asyncio.to_thread(store.save, storage_state)
+        return slot
+
+    async def saved_state_slot(
+        self,
+        state: dict | None,
+        proxy_settings: ProxySettings | None = None,
+        stealth: bool = True,
+    ) -> PageSlot | None:
+        if state is None:
+            return None
+        slot = await self.new_slot(
+            proxy_settings=proxy_settings, stealth=stealth, storage_state=state
+        )
+        if await self.session_store.is_valid(slot.page):
+            return slot
+        await slot.context.close()
+        return None
 
-        while scrolls < scrolls_limit:
-            # Scroll down to the bottom of the page
-            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
+    async def ensure_session(
+        self,
+        proxy_settings: ProxySettings | None = None,
+        playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        stealth: bool = True,
+    ) -> None:
+        """Create session unless it already exists, safe to call from concurrent tasks.
 
-            # Wait for page to load
-            await asyncio.sleep(2)
+        With `http_fast_path` the browser is launched on the first page that needs rendering.
+        """
+        if not self.session_options:
+            self.session_options = {
+                "proxy_settings": proxy_settings,
+                "playwright_script": playwright_script,
+                "stealth": stealth,
+            }
+        if not self.http_fast_path:
+            await self.start_session()
+
+    async def start_session(self) -> None:
+        async with self._session_lock:
+            if self.pool is None:
+                await self.create_session(**self.session_options)
+
+    async def wait_for_scroll_update(
+        self, page: Page, last_height: int, network: NetworkTracker
+    ) -> str:
+        """Wait until scroll height changes and the DOM and network settle.
+
+        Returns reason of the return: "height" when new content appeared or "timeout".
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.scroll_timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return "timeout"
+            reason = await page.evaluate(
+                WAIT_FOR_MUTATIONS_SCRIPT,
+                {"timeout": remaining * 1000, "quiet": self.scroll_settle * 1000},
+            )
+            if await page.evaluate("document.body.scrollHeight") != last_height:
+                break
+            if reason == "timeout":
+                return "timeout"
 
-            # Capture current visible content and append to the list
-            current_content = await self.page.content()
-            captured_content.append(current_content)
+        # Let pending requests of the new content finish within the same time budget
+        remaining = deadline - loop.time()
+        if remaining > 0:
+            try:
+                await asyncio.wait_for(network.idle.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+        return "height"
 
-            # Check current scroll height
-            new_height = await self.page.evaluate("document.body.scrollHeight")
+    async def scroll(self, scrolls_limit: int, page: Page) -> None:
+        """Scroll to the bottom of the page until no new content is loaded."""
+        # Function to perform the scrolling
+        scrolls = 0
+        last_height = await page.evaluate("document.body.scrollHeight")
+        network = NetworkTracker(page)
+        network.start()
+        loop = asyncio.get_running_loop()
 
-            # Break if no new content is loaded (based on scroll height)
-            if new_height == last_height:
-                break
+        try:
+            while scrolls < scrolls_limit:
+                # Scroll down to the bottom of the page
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
+
+                # Wait for page to load
+                started = loop.time()
+                reason = await self.wait_for_scroll_update(
+                    page=page, last_height=last_height, network=network
+                )
+
+                # Check current scroll height
+                new_height = await page.evaluate("document.body.scrollHeight")
+                self.scroll_stats.append(
+                    {
+                        "url": page.url,
+                        "scroll": scrolls,
+                        "wait": loop.time() - started,
+                        "reason": reason,
+                        "height": new_height,
+                    }
+                )
 
-            last_height = new_height
-            scrolls += 1
+                # Break if no new content is loaded (based on scroll height)
+                if new_height == last_height:
+                    break
 
-        # Fetch removed content if any
-        removed_content = await self.page.evaluate("window.removedContent.join('')")
+                last_height = new_height
+                scrolls += 1
+        finally:
+            network.stop()
 
-        # Combine all the captured content, including removed elements
-        final_content = "".join(captured_content) + removed_content
+    async def scroll_page(
+        self,
+        scrolls_limit: int = 0,
+        page: Page | None = None,
+        selectors: list[str] | None = None,
+    ):
+        page = page or self.page
+        # Take the snapshot of the page once and track only new content with MutationObserver
+        initial_content = None
+        if selectors:
+            initial_content = await self.get_selected_html(page, selectors)
+        if initial_content is None:
+            # Nothing matches the selectors, track the whole page
+            selectors = None
+            initial_content = await self.get_full_html(page=page)
+        await page.evaluate(TRACK_ADDED_NODES_SCRIPT, selectors)
+        await self.scroll(scrolls_limit, page=page)
+
+        # Fetch content added while scrolling, including already removed elements
+        added_content = await page.evaluate(COLLECT_ADDED_NODES_SCRIPT)
+
+        # Combine initial snapshot with the new content, deduplicating re-rendered elements
+        final_content = (
+            initial_content
+            + "\n<!-- Scrolled content -->\n"
+            + "".join(dict.fromkeys(added_content))
+        )
 
         return final_content
 
-    async def get_iframe_html(self, frame):
+    async def get_frame_html(
+        self,
+        frame: Page | Frame,
+        selectors: list[str] | None = None,
+        limit: int | None = None,
+    ) -> str | None:
+        """HTML of the document or of the elements matching selectors, None over the limit."""
+        if selectors:
+            if self.dom_pruner is not None:
+                await self.dom_pruner.install(frame)
+            return await frame.evaluate(
+                SELECTED_HTML_SCRIPT, {"selectors": selectors, "limit": limit}
+            )
+        if self.dom_pruner is not None:
+            return await self.dom_pruner.outer_html(frame, limit=limit)
+        if limit is None:
+            return await frame.evaluate("document.documentElement.outerHTML")
+        return await frame.evaluate(BOUNDED_OUTER_HTML_SCRIPT, limit)
+
+    async def get_iframe_html(
+        self, frame: Frame, selectors: list[str] | None = None
+    ) -> str | None:
+        policy = self.iframe_policy
         try:
             if frame.is_detached():  # Skip detached frames
                 return None
-            return await frame.evaluate("document.documentElement.outerHTML")
+            if not policy.accepts(frame.url):
+                return None
+            return await asyncio.wait_for(
+                self.get_frame_html(
+                    frame, selectors=selectors, limit=policy.max_frame_size
+                ),
+                timeout=policy.timeout,
+            )
         except Exception as e:
-            print(f"Could not access iframe: {e}")
+            print(f"Could not access iframe: {e!r}")
             return None
 
-    async def get_full_html(self):
+    def combine_frames(
+        self,
+        main_content: str,
+        frames_content: list[str | None],
+        header: Callable[[str], str],
+    ) -> str:
+        """Combine content of the main page and iframes, while iframes fit into the budget."""
+        parts = [header("Main Page"), main_content, "\n"]
+        budget = self.iframe_policy.max_total_size
+        idx = 0
+        for frame_content in frames_content:
+            # Filter out failed, skipped and empty iframes
+            if not frame_content or len(frame_content) > budget:
+                continue
+            budget -= len(frame_content)
+            idx += 1
+            parts.extend(("\n" + header(f"Iframe {idx}"), frame_content, "\n"))
+
+        return "".join(parts)
+
+    async def get_full_html(
+        self, page: Page | None = None, selectors: list[str] | None = None
+    ) -> str:
+        """HTML of the page and its iframes.
+
+        With root selectors only HTML of the matching elements is returned, or the whole page
+        when nothing matches.
+        """
+        page = page or self.page
+        if selectors:
+            selected_html = await self.get_selected_html(page, selectors)
+            if selected_html is not None:
+                return selected_html
+
         # Get main document HTML
-        main_html = await self.page.evaluate("document.documentElement.outerHTML")
+        main_html = await self.get_frame_html(page)
 
         # Fetch all iframe HTMLs in parallel
-        iframe_html_tasks = [
-            self.get_iframe_html(frame) for frame in self.page.frames[1:]
-        ]
+        iframe_html_tasks = [self.get_iframe_html(frame) for frame in page.frames[1:]]
         iframes_html = await asyncio.gather(*iframe_html_tasks)
 
-        # Filter out None values (failed iframe retrievals)
-        iframes_html = [html for html in iframes_html if html is not None]
+        return self.combine_frames(
+            main_html, iframes_html, header=lambda name: f"<!-- {name} HTML -->\n"
+        )
+
+    async def get_selected_html(self, page: Page, selectors: list[str]) -> str | None:
+        """HTML of the elements matching selectors in the page and its iframes.
+
+        Returns None when no element matches.
+        """
+        main_html = await self.get_frame_html(page, selectors=selectors)
+        iframes_html = await asyncio.gather(
+            *(self.get_iframe_html(frame, selectors) for frame in page.frames[1:])
+        )
+        if not main_html and not any(iframes_html):
+            return None
+        return self.combine_frames(
+            main_html, iframes_html, header=lambda name: f"<!-- {name} HTML -->\n"
+        )
 
-        # Combine main HTML and iframe HTML into one variable
-        combined_html = f"<!-- Main Page HTML -->\n{main_html}\n"
-        for idx, iframe_html in enumerate(iframes_html):
-            combined_html += f"\n<!-- Iframe {idx + 1} HTML -->\n{iframe_html}\n"
+    async def get_frame_snapshot(
+        self, frame: Frame, selectors: list[str] | None = None
+    ) -> str | None:
+        policy = self.iframe_policy
+        try:
+            if frame.is_detached() or not policy.accepts(frame.url):
+                return None
+            snapshot = await accessibility_snapshot(
+                frame, timeout=policy.timeout, selectors=selectors
+            )
+        except Exception as e:
+            logger.warning("Could not access iframe: %r", e)
+            return None
+        return snapshot if len(snapshot) <= policy.max_frame_size else None
+
+    async def get_accessibility_snapshot(
+        self, page: Page | None = None, selectors: list[str] | None = None
+    ) -> str:
+        page = page or self.page
+        main_snapshot = await accessibility_snapshot(page, selectors=selectors)
+        frame_snapshots = await asyncio.gather(
+            *(self.get_frame_snapshot(frame, selectors) for frame in page.frames[1:])
+        )
+        if selectors and not main_snapshot and not any(frame_snapshots):
+            # Nothing matches, fall back to the whole page
+            return await self.get_accessibility_snapshot(page)
 
-        return combined_html
+        return self.combine_frames(
+            main_snapshot, frame_snapshots, header=lambda name: f"# {name}\n"
+        )
 
     async def fetch_page(
         self,
         url: str,
         scrolls_limit: int = 0,
-        load_state: Literal["domcontentloaded", "load", "networkidle"] = "networkidle",
+        load_state: Literal["domcontentloaded", "load", "networkidle"] | None = None,
+        playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        selectors: str | list[str] | None = None,
+    ) -> str:
+        """Fetch content of the page, from the cache when it's used.
+
+        Args:
+            url (str): URL of the page.
+            scrolls_limit (int, optional): Maximum number of scrolls to load more content.
+                Defaults to 0.
+            load_state (Literal["domcontentloaded", "load", "networkidle"] | None, optional):
+                Load state to wait for, if None it's picked by the load strategy or networkidle
+                is used. Defaults to None.
+            playwright_script (Callable[[Page], Awaitable[Page]] | None, optional): Script
+                executed after the page is loaded. Defaults to None.
+            selectors (str | list[str] | None, optional): CSS or XPath selectors of the root
+                elements, only their content is returned. When nothing matches the whole page
+                is returned. Defaults to None.
+        """
+        selectors = normalize_selectors(selectors)
+        if self.cache is None:
+            content, _ = await self.load_page(
+                url=url,
+                scrolls_limit=scrolls_limit,
+                load_state=load_state,
+                playwright_script=playwright_script,
+                selectors=selectors,
+            )
+            return content
+
+        key = self.cache.key(
+            url=url,
+            scrolls_limit=scrolls_limit,
+            load_state=load_state,
+            playwright_script=playwright_script,
+            content_format=self.content_format,
+            selectors=selectors,
+            response_capture=(
+                self.response_capture.options() if self.response_capture else None
+            ),
+            dom_pruner=self.dom_pruner.options() if self.dom_pruner else None,
+            iframe_policy=self.iframe_options(),
+            initial_script=self.session_options.get("playwright_script"),
+            session_name=self.session_store.name if self.session_store else None,
+            cookies=self.custom_cookies,
+            http_fast_path=self.http_fast_path,
+        )
+        entry = await asyncio.to_thread(self.cache.get, key)
+        if entry is not None and (
+            self.cache.is_fresh(entry) or await self.revalidate(entry)
+        ):
+            if not self.cache.is_fresh(entry):
+                await asyncio.to_thread(self.cache.touch, key)
+            self.fetch_log.append({"url": url, "path": "cache", "reason": None})
+            return await asyncio.to_thread(entry.read)
+        if self.cache.offline:
+            raise PageGotoError(f"Page {url} is not cached and cache is offline")
+
+        content, headers = await self.load_page(
+            url=url,
+            scrolls_limit=scrolls_limit,
+            load_state=load_state,
+            playwright_script=playwright_script,
+            selectors=selectors,
+        )
+        await asyncio.to_thread(self.cache.put, key, url, content, headers)
+        return content
+
+    def iframe_options(self) -> dict | None:
+        """Settings of the iframe policy for cache keys, None for the default policy."""
+        options = self.iframe_policy.options()
+        return None if options == IframePolicy().options() else options
+
+    async def revalidate(self, entry: CacheEntry) -> bool:
+        if not entry.etag and not entry.last_modified:
+            return False
+        if self.http_fetcher is None:
+            self.http_fetcher = self.new_http_fetcher()
+        return await self.http_fetcher.is_not_modified(
+            entry.url, etag=entry.etag, last_modified=entry.last_modified
+        )
+
+    async def load_page(
+        self,
+        url: str,
+        scrolls_limit: int = 0,
+        load_state: Literal["domcontentloaded", "load", "networkidle"] | None = None,
+        playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        selectors: list[str] | None = None,
+    ) -> tuple[str, dict[str, str]]:
+        """Fetch the page content bypassing cache.
+
+        Returns:
+            tuple[str, dict[str, str]]: Content of the page and headers of the main response.
+        """
+        # Initial script usually signs in, so its state is available only in the browser
+        if (
+            self.http_fast_path
+            and scrolls_limit == 0
+            and playwright_script is None
+            and not self.session_options.get("playwright_script")
+            and self.response_capture is None
+            and self.content_format == "html"
+            # XPath selectors are evaluated only in the browser
+            and not any(is_xpath(selector) for selector in selectors or [])
+        ):
+            response, reason = await self.fetch_http(url)
+            if response is not None:
+                self.fetch_log.append({"url": url, "path": "http", "reason": None})
+                content = response.text
+                if selectors:
+                    content = select_html(content, selectors) or content
+                return content, dict(response.headers)
+        else:
+            reason = "browser required"
+        self.fetch_log.append({"url": url, "path": "browser", "reason": reason})
+
+        if self.pool is None:
+            await self.start_session()
+
+        async with self.pool.page() as slot:
+            try:
+                result, headers = await self.render_page(
+                    slot,
+                    url=url,
+                    scrolls_limit=scrolls_limit,
+                    load_state=load_state,
+                    playwright_script=playwright_script,
+                    selectors=selectors,
+                )
+            except Exception as exc:
+                try:
+                    await self.recycle_slot(slot, error=exc)
+                except Exception as recycle_exc:
+                    logger.warning("Could not recycle browser context: %r", recycle_exc)
+                raise
+            await self.recycle_slot(slot)
+        return result, headers
+
+    async def render_page(
+        self,
+        slot: PageSlot,
+        url: str,
+        scrolls_limit: int = 0,
+        load_state: Literal["domcontentloaded", "load", "networkidle"] | None = None,
         playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        selectors: list[str] | None = None,
+    ) -> tuple[str, dict[str, str]]:
+        adaptive = load_state is None and self.load_strategy is not None
+        recorder = None
+        if self.response_capture is not None:
+            recorder = self.response_capture.recorder(slot.page)
+            recorder.start()
+        try:
+            # Navigate to the URL
+            started = asyncio.get_running_loop().time()
+            slot.navigations += 1
+            try:
+                response = await slot.page.goto(
+                    url, wait_until="commit" if adaptive else "load"
+                )
+            except Exception as exc:
+                raise PageGotoError(str(exc)) from exc
+            if adaptive:
+                await self.wait_for_adaptive_load_state(slot.page, url, started)
+            else:
+                try:
+                    await slot.page.wait_for_load_state(load_state or "networkidle")
+                except PlaywrightTimeoutError:
+                    pass
+
+            if playwright_script:
+                slot.page = await playwright_script(slot.page)
+
+            if self.content_format == "accessibility":
+                if scrolls_limit > 0:
+                    # Snapshot is taken after scrolling, so elements removed by virtualized
+                    # lists are lost
+                    await self.scroll(scrolls_limit, page=slot.page)
+                result = await self.get_accessibility_snapshot(
+                    page=slot.page, selectors=selectors
+                )
+            # peform scrolling
+            elif scrolls_limit > 0:
+                result = await self.scroll_page(
+                    scrolls_limit, page=slot.page, selectors=selectors
+                )
+            else:
+                result = await self.get_full_html(page=slot.page, selectors=selectors)
+        except BaseException:
+            if recorder is not None:
+                recorder.discard()
+            raise
+        if recorder is not None:
+            result = self.response_capture.combine(result, await recorder.collect())
+
+        headers = response.headers if response is not None else {}
+        return result, headers
+
+    async def recycle_slot(
+        self, slot: PageSlot, error: Exception | None = None
     ) -> None:
-        # Navigate to the URL
+        """Replace context of the slot in place if the recycle policy requires it."""
+        policy = self.recycle_policy
+        if policy is None:
+            return
+        memory = None
+        if policy.max_memory is not None and error is None:
+            try:
+                memory = await slot.page.evaluate(JS_HEAP_SIZE_SCRIPT)
+            except Exception:
+                pass
+        reason = policy.reason(slot.navigations, memory=memory, error=error)
+        if reason is None:
+            return
+
         try:
-            await self.page.goto(url)
-        except Exception as exc:
-            raise PageGotoError(str(exc)) from exc
+            storage_state = await slot.context.storage_state()
+        except Exception:
+            # Context is broken, start over with the custom cookies only
+            storage_state = None
+        replacement = await self.new_slot(
+            proxy_settings=self.session_options.get("proxy_settings"),
+            stealth=self.session_options.get("stealth", True),
+            storage_state=storage_state,
+        )
+        old_context, navigations = slot.context, slot.navigations
+        slot.context, slot.page = replacement.context, replacement.page
+        slot.navigations = 0
         try:
-            await self.page.wait_for_load_state(load_state)
-        except PlaywrightTimeoutError:
-            pass
+            await old_context.close()
+        except Exception as exc:
+            logger.warning("Could not close recycled context: %r", exc)
 
-        if playwright_script:
-            self.page = await playwright_script(self.page)
+        self.recycle_log.append(
+            {"navigations": navigations, "memory": memory, "reason": reason}
+        )
+        logger.info(
+            "Recycled browser context after %d navigations, reason: %s",
+            navigations,
+            reason,
+        )
 
-        # peform scrolling
-        if scrolls_limit > 0:
-            result = await self.scroll_page(scrolls_limit)
-        else:
-            result = await self.get_full_html()
+    async def wait_for_adaptive_load_state(
+        self, page: Page, url: str, started: float
+    ) -> None:
+        """Wait for the load state picked by the strategy, upgrading it if content looks incomplete.
+
+        When the strategy needs more statistics all load states are awaited and measured.
+        """
+        strategy = self.load_strategy
+        loop = asyncio.get_running_loop()
+        explore = strategy.needs_exploration(url)
+        target = LOAD_STATES.index(strategy.choose(url))
+        timings, sizes = {}, {}
+        for idx, state in enumerate(LOAD_STATES):
+            try:
+                await page.wait_for_load_state(state)
+            except PlaywrightTimeoutError:
+                pass
+            timings[state] = loop.time() - started
+            sizes[state] = await page.evaluate(
+                "document.body ? document.body.innerText.length : 0"
+            )
+            previous_size = sizes[LOAD_STATES[idx - 1]] if idx > 0 else None
+            if (
+                not explore
+                and idx >= target
+                and strategy.looks_complete(url, sizes[state], previous_size)
+            ):
+                break
+        strategy.record(url, timings=timings, sizes=sizes)
+        await strategy.asave()
+
+    def new_http_fetcher(self) -> HttpFetcher:
+        return HttpFetcher(
+            proxy_settings=self.session_options.get("proxy_settings"),
+            cookies=self.custom_cookies,
+        )
 
-        return result
+    async def fetch_http(self, url: str) -> tuple[httpx.Response | None, str | None]:
+        if self.http_fetcher is None:
+            self.http_fetcher = self.new_http_fetcher()
+        return await self.http_fetcher.fetch(url)
 
     async def close(self) -> None:
+        if self.http_fetcher:
+            await self.http_fetcher.close()
+            self.http_fetcher = None
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+            self.primary = None
+        # Loader can be used again after closing, launching a new browser
+        self.session_options = {}
         if self.playwright:
-            await self.context.close()
             await self.browser.close()
             await self.playwright.stop()
+            self.browser = None
+            self.playwright = None
@@ -1,13 +1,22 @@
-import asyncio
-from typing import Awaitable, Callable
+from typing import AsyncIterator, Awaitable, Callable, Literal
 
 from langchain_core.language_models import BaseChatModel
 from playwright.async_api import Page
 
+from parsera.blocking import ResourceBlocker
+from parsera.boilerplate import BoilerplateRemover
+from parsera.cache import PageCache
+from parsera.capture import ResponseCapture
 from parsera.engine.api_extractor import APIExtractor, Extractor
 from parsera.engine.chunks_extractor import ChunksTabularExtractor
 from parsera.engine.structured_extractor import StructuredExtractor
+from parsera.load_strategy import LoadStateStrategy
 from parsera.page import PageLoader
+from parsera.pruning import DomPruner
+from parsera.recycling import RecyclePolicy
+from parsera.runtime import SyncRuntime
+from parsera.sessions import SessionStore
+from parsera.sharding import ShardedPageLoader
 
 
 class Parsera:
@@ -19,6 +28,18 @@ class Parsera:
         stealth: bool = True,
         custom_cookies: list[dict] | None = None,
         typed: bool = False,
+        max_concurrency: int = 1,
+        resource_blocker: ResourceBlocker | None = None,
+        http_fast_path: bool = False,
+        cache: PageCache | None = None,
+        load_strategy: LoadStateStrategy | None = None,
+        recycle_policy: RecyclePolicy | None = None,
+        dom_pruner: DomPruner | None = None,
+        session_store: SessionStore | None = None,
+        response_capture: ResponseCapture | None = None,
+        content_format: Literal["html", "accessibility"] = "html",
+        boilerplate_remover: BoilerplateRemover | None = None,
+        loader: PageLoader | ShardedPageLoader | None = None,
     ):
         """Initialize Parsera
 
@@ -32,6 +53,39 @@ class Parsera:
             stealth (bool, optional): Whether to use stealth mode. Defaults to True.
             custom_cookies (list[dict] | None, optional): List of custom cookies to be added to the
                 browser context. Defaults to None.
+            typed (bool, optional): Whether to use StructuredExtractor with typed output, when
+                model is provided. Defaults to False.
+            max_concurrency (int, optional): Maximum number of pages fetched concurrently by
+                `arun` calls sharing this instance, all of them use the same browser.
+                Defaults to 1.
+            resource_blocker (ResourceBlocker | None, optional): Policy to block images, fonts,
+                media and trackers during page loading. Defaults to None, loading everything.
+            http_fast_path (bool, optional): Whether to try fetching pages with plain HTTP and
+                fall back to the browser only when JavaScript rendering is needed.
+                Defaults to False.
+            cache (PageCache | None, optional): On-disk cache of fetched pages, useful when
+                re-running extraction on the same pages. Defaults to None.
+            load_strategy (LoadStateStrategy | None, optional): Per-domain statistics to pick
+                the cheapest load state producing complete content, if None pages wait for
+                networkidle. Defaults to None.
+            recycle_policy (RecyclePolicy | None, optional): Rules for replacing browser
+                contexts in long-running sessions to bound memory usage. Defaults to None.
+            dom_pruner (DomPruner | None, optional): Pass stripping scripts, styles, hidden
+                elements and unused attributes in the page before serializing its HTML.
+                Defaults to None.
+            session_store (SessionStore | None, optional): Saved storage state, which is reused
+                instead of executing `initial_script` while it's valid. Defaults to None.
+            response_capture (ResponseCapture | None, optional): Policy recording JSON responses
+                loaded by the page, which are extracted next to or instead of its HTML.
+                Defaults to None.
+            content_format (Literal["html", "accessibility"], optional): Page representation
+                passed to the extractor, "accessibility" uses a compact snapshot of the
+                accessibility tree instead of HTML converted to markdown. Defaults to "html".
+            boilerplate_remover (BoilerplateRemover | None, optional): Stage removing navigation,
+                banners, footers and other boilerplate from HTML before the extraction.
+                Defaults to None.
+            loader (PageLoader | ShardedPageLoader | None, optional): Custom page loader, when
+                provided other loader options are ignored. Defaults to None.
         """
         if model is None and extractor is None:
             self.extractor = APIExtractor()
@@ -49,7 +103,56 @@ class Parsera:
             )
         self.initial_script = initial_script
         self.stealth = stealth
-        self.loader = PageLoader(custom_cookies=custom_cookies)
+        if loader is not None:
+            self.loader = loader
+        else:
+            self.loader = PageLoader(
+                custom_cookies=custom_cookies,
+                max_concurrency=max_concurrency,
+                resource_blocker=resource_blocker,
+                http_fast_path=http_fast_path,
+                cache=cache,
+                load_strategy=load_strategy,
+                recycle_policy=recycle_policy,
+                dom_pruner=dom_pruner,
+                session_store=session_store,
+                response_capture=response_capture,
+                content_format=content_format,
+            )
+        self.content_format = getattr(self.loader, "content_format", "html")
+        self.boilerplate_remover = boilerplate_remover
+        self.runtime: SyncRuntime | None = None
+
+    async def _fetch(
+        self,
+        url: str,
+        proxy_settings: dict | None,
+        scrolls_limit: int = 0,
+        playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        selectors: str | list[str] | None = None,
+    ) -> str:
+        await self.loader.ensure_session(
+            proxy_settings=proxy_settings,
+            playwright_script=self.initial_script,
+            stealth=self.stealth,
+        )
+
+        content = await self.loader.fetch_page(
+            url=url,
+            scrolls_limit=scrolls_limit,
+            playwright_script=playwright_script,
+            selectors=selectors,
+        )
+        if self.boilerplate_remover is not None and self.content_format == "html":
+            content = await self.boilerplate_remover.aremove(content, url=url)
+        return content
+
+    def _extractor_options(self) -> dict:
+        # Custom extractors may not accept content_format, so it's passed only when needed
+        options = {}
+        if self.content_format != "html":
+            options["content_format"] = self.content_format
+        return options
 
     async def _run(
         self,
@@ -59,20 +162,20 @@ class Parsera:
         proxy_settings: dict | None,
         scrolls_limit: int = 0,
         playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        selectors: str | list[str] | None = None,
     ) -> dict:
-        if self.loader.context is None:
-            await self.loader.create_session(
-                proxy_settings=proxy_settings,
-                playwright_script=self.initial_script,
-                stealth=self.stealth,
-            )
-
-        content = await self.loader.fetch_page(
-            url=url, scrolls_limit=scrolls_limit, playwright_script=playwright_script
+        content = await self._fetch(
+            url=url,
+            proxy_settings=proxy_settings,
+            scrolls_limit=scrolls_limit,
+            playwright_script=playwright_script,
+            selectors=selectors,
         )
-
         result = await self.extractor.run(
-            content=content, prompt=prompt, attributes=elements
+            content=content,
+            prompt=prompt,
+            attributes=elements,
+            **self._extractor_options(),
         )
         return result
 
@@ -84,8 +187,12 @@ class Parsera:
         proxy_settings: dict | None = None,
         scrolls_limit: int = 0,
         playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        selectors: str | list[str] | None = None,
     ) -> dict:
-        return asyncio.run(
+        # Keep one event loop for all sync calls, so the browser session is reused
+        if self.runtime is None:
+            self.runtime = SyncRuntime()
+        return self.runtime.run(
             self._run(
                 url=url,
                 elements=elements,
@@ -93,6 +200,7 @@ class Parsera:
                 scrolls_limit=scrolls_limit,
                 proxy_settings=proxy_settings,
                 playwright_script=playwright_script,
+                selectors=selectors,
             )
         )
 
@@ -104,6 +212,7 @@ class Parsera:
         proxy_settings: dict | None = None,
         scrolls_limit: int = 0,
         playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        selectors: str | list[str] | None = None,
     ) -> dict:
         return await self._run(
             url=url,
@@ -112,4 +221,69 @@ class Parsera:
             scrolls_limit=scrolls_limit,
             proxy_settings=proxy_settings,
             playwright_script=playwright_script,
+            selectors=selectors,
         )
+
+    async def astream(
+        self,
+        url: str,
+        elements: dict | None = None,
+        prompt: str = "",
+        proxy_settings: dict | None = None,
+        scrolls_limit: int = 0,
+        playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        selectors: str | list[str] | None = None,
+    ) -> AsyncIterator[dict]:
+        """Extract data from the page, yielding rows as soon as chunks of the page are done.
+
+        Extractors with `stream` method, like `ChunksTabularExtractor`, yield a "rows" event
+        for each chunk with rows which are final, other extractors yield one event with the
+        whole result. The last event marks the end of the page:
+        `{"type": "end", "chunks": 10, "rows": 230}`.
+        """
+        content = await self._fetch(
+            url=url,
+            proxy_settings=proxy_settings,
+            scrolls_limit=scrolls_limit,
+            playwright_script=playwright_script,
+            selectors=selectors,
+        )
+        options = self._extractor_options()
+        stream = getattr(self.extractor, "stream", None)
+        if stream is None:
+            result = await self.extractor.run(
+                content=content, prompt=prompt, attributes=elements, **options
+            )
+            yield {"type": "rows", "rows": result, "chunk": 0, "chunks": 1}
+            yield {"type": "end", "chunks": 1, "rows": len(result)}
+            return
+        async for event in stream(
+            content=content, prompt=prompt, attributes=elements, **options
+        ):
+            yield event
+
+    async def aclose(self) -> None:
+        await self.loader.close()
+
+    def close(self) -> None:
+        """Close browser session and stop the event loop used by `run`.
+
+        Sessions created by `arun` are bound to the caller's loop, close them with `aclose`.
+        """
+        if self.runtime is None:
+            return
+        self.runtime.run(self.aclose())
+        self.runtime.close()
+        self.runtime = None
+
+    def __enter__(self) -> "Parsera":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Parsera":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
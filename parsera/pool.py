@@ -0,0 +1,73 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+from playwright.async_api import BrowserContext, Page
+
+
+class PageSlot:
+    """Browser context together with its page, used by a single fetch at a time."""
+
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        # Number of navigations since the context was created, used for recycling
+        self.navigations = 0
+
+
+class PagePool:
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[PageSlot]],
+        max_size: int = 1,
+    ):
+        """Bounded pool of browser contexts with checkout/checkin semantics
+
+        Args:
+            factory (Callable[[], Awaitable[PageSlot]]): Coroutine function creating a new slot,
+                called lazily when all existing slots are checked out.
+            max_size (int, optional): Maximum number of slots, which is also the maximum number of
+                pages used concurrently. Defaults to 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size should be at least 1")
+        self.factory = factory
+        self.max_size = max_size
+        self.slots: list[PageSlot] = []
+        self._idle: asyncio.Queue[PageSlot] = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(max_size)
+
+    def add(self, slot: PageSlot) -> None:
+        self.slots.append(slot)
+        self._idle.put_nowait(slot)
+
+    async def checkout(self) -> PageSlot:
+        await self._semaphore.acquire()
+        try:
+            if not self._idle.empty():
+                return self._idle.get_nowait()
+            # Holding the semaphore guarantees that the pool is not full yet
+            slot = await self.factory()
+            self.slots.append(slot)
+            return slot
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def checkin(self, slot: PageSlot) -> None:
+        self._idle.put_nowait(slot)
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[PageSlot]:
+        slot = await self.checkout()
+        try:
+            yield slot
+        finally:
+            self.checkin(slot)
+
+    async def close(self) -> None:
+        for slot in self.slots:
+            await slot.context.close()
+        self.slots = []
+        self._idle = asyncio.Queue()
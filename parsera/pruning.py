@@ -0,0 +1,145 @@
+from typing import Iterable
+
+from playwright.async_api import Frame, Page
+
+DEFAULT_PRUNED_TAGS = (
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "svg",
+    "canvas",
+    "link",
+    "meta",
+    "object",
+    "embed",
+)
+
+DEFAULT_KEPT_ATTRIBUTES = (
+    "href",
+    "src",
+    "alt",
+    "title",
+    "colspan",
+    "rowspan",
+    "datetime",
+    # Hints of boilerplate blocks and of repeating records used after the page is fetched
+    "class",
+    "id",
+    "role",
+    "aria-modal",
+)
+
+# Defines window.parseraPrune(node) returning HTML of the pruned copy of the node. The copy is
+# made in an inert document, so images are not loaded again and the page itself is never modified.
+INSTALL_PRUNE_SCRIPT = """
+(options) => {
+    const removeTags = new Set(options.removeTags);
+    const keepAttributes = new Set(options.keepAttributes);
+    const inert = document.implementation.createHTMLDocument("");
+    window.parseraPrune = (root) => {
+        const live = [root, ...root.querySelectorAll("*")];
+        const copy = inert.importNode(root, true);
+        const copies = [copy, ...copy.querySelectorAll("*")];
+        const removed = new Set();
+        const head = new Set();  // Elements of the head are never displayed
+        live.forEach((node, idx) => {
+            const parent = node.parentElement;
+            if (removed.has(parent)) {
+                removed.add(node);
+                return;
+            }
+            if (node.localName === "head" || head.has(parent)) head.add(node);
+            if (
+                removeTags.has(node.localName)
+                || (options.removeHidden && !head.has(node) && node.isConnected
+                    && getComputedStyle(node).display === "none")
+            ) {
+                removed.add(node);
+                copies[idx].remove();
+                return;
+            }
+            const target = copies[idx];
+            for (const attr of [...target.attributes]) {
+                if (
+                    !keepAttributes.has(attr.name)
+                    || attr.value.length > options.maxAttributeLength
+                ) {
+                    target.removeAttribute(attr.name);
+                }
+            }
+        });
+        if (removed.has(root)) return "";
+        if (options.removeComments) {
+            const walker = inert.createTreeWalker(copy, NodeFilter.SHOW_COMMENT);
+            const comments = [];
+            while (walker.nextNode()) comments.push(walker.currentNode);
+            comments.forEach((comment) => comment.remove());
+        }
+        return copy.outerHTML;
+    };
+}
+"""
+
+# Returns pruned HTML of the document or null when it's over the size limit
+PRUNED_OUTER_HTML_SCRIPT = (
+    """
+({ options, limit }) => {
+    ("""
+    + INSTALL_PRUNE_SCRIPT.strip()
+    + """)(options);
+    const html = window.parseraPrune(document.documentElement);
+    return limit === null || html.length <= limit ? html : null;
+}
+"""
+)
+
+
+class DomPruner:
+    def __init__(
+        self,
+        remove_tags: Iterable[str] = DEFAULT_PRUNED_TAGS,
+        keep_attributes: Iterable[str] = DEFAULT_KEPT_ATTRIBUTES,
+        remove_hidden: bool = True,
+        remove_comments: bool = True,
+        max_attribute_length: int = 1000,
+    ):
+        """Strips nodes and attributes without content in the page before serializing its HTML
+
+        Args:
+            remove_tags (Iterable[str], optional): Tags removed with their content.
+                Defaults to scripts, styles, inline SVG, canvas and other non-text elements.
+            keep_attributes (Iterable[str], optional): Attributes to keep, all others are
+                removed. Defaults to links, image sources and alts, titles and table spans.
+            remove_hidden (bool, optional): Whether to remove elements which are not displayed.
+                Defaults to True.
+            remove_comments (bool, optional): Whether to remove HTML comments. Defaults to True.
+            max_attribute_length (int, optional): Longer attribute values, like inline data
+                URIs, are removed. Defaults to 1000.
+        """
+        self.remove_tags = [tag.lower() for tag in remove_tags]
+        self.keep_attributes = [attribute.lower() for attribute in keep_attributes]
+        self.remove_hidden = remove_hidden
+        self.remove_comments = remove_comments
+        self.max_attribute_length = max_attribute_length
+
+    def options(self) -> dict:
+        return {
+            "removeTags": self.remove_tags,
+            "keepAttributes": self.keep_attributes,
+            "removeHidden": self.remove_hidden,
+            "removeComments": self.remove_comments,
+            "maxAttributeLength": self.max_attribute_length,
+        }
+
+    async def install(self, frame: Page | Frame) -> None:
+        """Define pruning function used to serialize parts of the page."""
+        await frame.evaluate(INSTALL_PRUNE_SCRIPT, self.options())
+
+    async def outer_html(
+        self, frame: Page | Frame, limit: int | None = None
+    ) -> str | None:
+        """Pruned HTML of the document, or None when it's longer than `limit` characters."""
+        return await frame.evaluate(
+            PRUNED_OUTER_HTML_SCRIPT, {"options": self.options(), "limit": limit}
+        )
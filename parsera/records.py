@@ -0,0 +1,146 @@
+import re
+from collections import defaultdict
+from typing import Any, Callable
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+from langchain_text_splitters import RecursiveCharacterTextSplitter, TextSplitter
+from markdownify import MarkdownConverter
+
+# Inserted between records in HTML, survives conversion to markdown as plain text
+RECORD_SEPARATOR = "␞"
+RECORD_TAGS = {
+    "div",
+    "li",
+    "tr",
+    "tbody",
+    "article",
+    "section",
+    "dl",
+    "ul",
+    "table",
+    "a",
+}
+WHITESPACE = re.compile(r"\s+")
+
+
+def signature(element: Tag) -> tuple[str, tuple[str, ...]]:
+    return element.name, tuple(sorted(element.get("class", [])))
+
+
+def find_records(
+    soup: BeautifulSoup, min_records: int = 3, min_record_length: int = 10
+) -> list[Tag]:
+    """Elements of the repeating record template covering most of the page text.
+
+    Siblings are grouped by their tag and classes together with the tag and classes of their
+    parent, so records split between several containers form one group.
+
+    Args:
+        soup (BeautifulSoup): Parsed page.
+        min_records (int, optional): Minimum number of records in a group. Defaults to 3.
+        min_record_length (int, optional): Minimum average length of the record text.
+            Defaults to 10.
+
+    Returns:
+        list[Tag]: Records in the document order, empty list if the page has no repeating
+            records.
+    """
+    groups: dict[tuple, list[Tag]] = defaultdict(list)
+    for parent in soup.find_all(True):
+        for child in parent.find_all(RECORD_TAGS, recursive=False):
+            groups[(signature(parent), signature(child))].append(child)
+
+    best: list[Tag] = []
+    best_score = 0.0
+    for members in groups.values():
+        if len(members) < min_records:
+            continue
+        text_length = sum(
+            len(WHITESPACE.sub(" ", member.get_text(" ")).strip()) for member in members
+        )
+        if text_length < min_record_length * len(members):
+            continue
+        # Prefer groups covering more text, with a penalty for groups of a few large blocks
+        score = text_length * (len(members) - 1) / len(members)
+        if score > best_score:
+            best, best_score = members, score
+    return best
+
+
+def mark_records(soup: BeautifulSoup, min_records: int = 3) -> int:
+    """Insert RECORD_SEPARATOR between the records of the page, returns number of records."""
+    records = find_records(soup, min_records=min_records)
+    for record in records[1:]:
+        record.insert_before(NavigableString(RECORD_SEPARATOR))
+    return len(records)
+
+
+class RecordMarkingConverter:
+    """Converter marking boundaries of the repeating records before converting HTML to markdown."""
+
+    def __init__(
+        self, converter: MarkdownConverter | None = None, min_records: int = 3
+    ):
+        self.converter = converter or MarkdownConverter()
+        self.min_records = min_records
+
+    def convert(self, html: str) -> str:
+        soup = BeautifulSoup(html, "html.parser")
+        mark_records(soup, min_records=self.min_records)
+        # markdownify converts the parsed page directly, other converters parse it again
+        if type(self.converter).convert is MarkdownConverter.convert:
+            return self.converter.convert_soup(soup)
+        return self.converter.convert(str(soup))
+
+
+class RecordTextSplitter(TextSplitter):
+    def __init__(
+        self,
+        chunk_size: int,
+        chunk_overlap: int = 0,
+        length_function: Callable[[str], int] = len,
+        fallback: TextSplitter | None = None,
+        **kwargs: Any,
+    ):
+        """Splitter packing whole records into chunks, with boundaries marked by
+        RecordMarkingConverter
+
+        Text without records and records larger than the chunk size are split by
+        RecursiveCharacterTextSplitter.
+
+        Args:
+            chunk_size (int): Maximum size of the chunk.
+            chunk_overlap (int, optional): Overlap of the chunks, records aren't cut, so it
+                can be small. Defaults to 0.
+            length_function (Callable[[str], int], optional): Function measuring the size.
+                Defaults to len.
+            fallback (TextSplitter | None, optional): Splitter of text without records and of
+                large records. Defaults to None, using RecursiveCharacterTextSplitter with a
+                third of the chunk size as overlap.
+        """
+        super().__init__(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_function=length_function,
+            **kwargs,
+        )
+        if fallback is None:
+            fallback = RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_size // 3,
+                length_function=length_function,
+            )
+        self.fallback = fallback
+
+    def split_text(self, text: str) -> list[str]:
+        if RECORD_SEPARATOR not in text:
+            return self.fallback.split_text(text)
+        splits = []
+        for piece in text.split(RECORD_SEPARATOR):
+            if not piece.strip():
+                continue
+            if self._length_function(piece) > self._chunk_size:
+                splits.extend(self.fallback.split_text(piece))
+            else:
+                splits.append(piece.strip("\n"))
+        return self._merge_splits(splits, separator="\n")
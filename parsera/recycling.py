@@ -0,0 +1,47 @@
+# Used JS heap of the page, available only in Chromium
+JS_HEAP_SIZE_SCRIPT = """
+() => (performance.memory ? performance.memory.usedJSHeapSize : null)
+"""
+
+
+class RecyclePolicy:
+    def __init__(
+        self,
+        max_navigations: int | None = 500,
+        max_memory: int | None = None,
+        recycle_on_error: bool = True,
+    ):
+        """Rules for replacing browser contexts to bound memory of long-running sessions
+
+        Recycled context inherits cookies and local storage of the replaced one.
+
+        Args:
+            max_navigations (int | None, optional): Number of navigations after which the
+                context is replaced, None disables the limit. Defaults to 500.
+            max_memory (int | None, optional): Used JS heap size of the page in bytes above which
+                the context is replaced, None disables the limit. The heap size is reported only
+                by Chromium, the limit is ignored for other browsers. Defaults to None.
+            recycle_on_error (bool, optional): Whether to replace the context after a failed
+                fetch. Defaults to True.
+        """
+        if max_navigations is not None and max_navigations < 1:
+            raise ValueError("max_navigations should be at least 1")
+        self.max_navigations = max_navigations
+        self.max_memory = max_memory
+        self.recycle_on_error = recycle_on_error
+
+    def reason(
+        self,
+        navigations: int,
+        memory: int | None = None,
+        error: Exception | None = None,
+    ) -> str | None:
+        """Reason to recycle the context or None if it can be reused."""
+        if error is not None and self.recycle_on_error:
+            return f"error: {error.__class__.__name__}"
+        if self.max_navigations is not None and navigations >= self.max_navigations:
+            return f"navigations: {navigations}"
+        if self.max_memory is not None and memory is not None:
+            if memory >= self.max_memory:
+                return f"memory: {memory}"
+        return None
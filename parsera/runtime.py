@@ -0,0 +1,53 @@
+import asyncio
+import threading
+from typing import Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+class SyncRuntime:
+    """Long-lived event loop on a background thread for running coroutines from sync code.
+
+    Unlike `asyncio.run`, the loop survives between calls, so browser and pages created
+    in one call stay usable in the next one.
+    """
+
+    def __init__(self):
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.loop is not None:
+                return
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(
+                target=self._run_forever, name="parsera-runtime", daemon=True
+            )
+            self.thread.start()
+
+    def _run_forever(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Coroutine[None, None, T]) -> T:
+        self.start()
+        if threading.current_thread() is self.thread:
+            coro.close()
+            raise RuntimeError("SyncRuntime.run can't be called from its own loop")
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result()
+
+    def close(self) -> None:
+        with self._lock:
+            if self.loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(
+                self.loop.shutdown_asyncgens(), self.loop
+            ).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+            self.loop = None
+            self.thread = None
@@ -0,0 +1,80 @@
+from typing import Iterable
+
+from bs4 import BeautifulSoup
+
+# Defines findRoots(selectors) returning elements matching CSS or XPath selectors in the document
+# order, without elements nested in other matches
+FIND_ROOTS_FUNCTION = """
+const findRoots = (selectors) => {
+    const matches = new Set();
+    for (const selector of selectors) {
+        if (selector.startsWith("xpath=") || /^[/(]/.test(selector)) {
+            const result = document.evaluate(
+                selector.replace(/^xpath=/, ""),
+                document,
+                null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,
+                null,
+            );
+            for (let idx = 0; idx < result.snapshotLength; idx++) {
+                const node = result.snapshotItem(idx);
+                if (node.nodeType === Node.ELEMENT_NODE) matches.add(node);
+            }
+        } else {
+            const css = selector.replace(/^css=/, "");
+            document.querySelectorAll(css).forEach((node) => matches.add(node));
+        }
+    }
+    const ordered = [...matches].sort((a, b) =>
+        a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1
+    );
+    // Descendants follow their ancestor in the document order
+    const roots = [];
+    for (const node of ordered) {
+        if (!roots.length || !roots[roots.length - 1].contains(node)) roots.push(node);
+    }
+    return roots;
+};
+"""
+
+# Returns HTML of the matching elements, empty string when nothing matches or null when it's over
+# the size limit
+SELECTED_HTML_SCRIPT = (
+    """
+({ selectors, limit }) => {
+"""
+    + FIND_ROOTS_FUNCTION
+    + """
+    // Pruning function is defined by DomPruner when it's used
+    const serialize = window.parseraPrune || ((node) => node.outerHTML);
+    const html = findRoots(selectors).map(serialize).join("\\n");
+    return limit === null || html.length <= limit ? html : null;
+}
+"""
+)
+
+
+def normalize_selectors(selectors: str | Iterable[str] | None) -> list[str]:
+    if selectors is None:
+        return []
+    if isinstance(selectors, str):
+        return [selectors]
+    return list(selectors)
+
+
+def is_xpath(selector: str) -> bool:
+    return selector.startswith(("xpath=", "/", "("))
+
+
+def select_html(html: str, selectors: list[str]) -> str:
+    """HTML of the elements matching CSS selectors, empty string when nothing matches."""
+    css = ", ".join(selector.removeprefix("css=") for selector in selectors)
+    soup = BeautifulSoup(html, "html.parser")
+    matches = soup.select(css)
+    matched_ids = {id(match) for match in matches}
+    roots = [
+        match
+        for match in matches
+        if not any(id(parent) in matched_ids for parent in match.parents)
+    ]
+    return "\n".join(str(root) for root in roots)
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
+
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSIONS_DIR = Path.home() / ".cache" / "parsera" / "sessions"
+
+
+class SessionStore:
+    def __init__(
+        self,
+        name: str,
+        directory: str | Path = DEFAULT_SESSIONS_DIR,
+        validate: Callable[[Page], Awaitable[bool]] | None = None,
+        max_age: float | None = None,
+        lock_timeout: float = 300,
+    ):
+        """Storage state (cookies and local storage) saved after the initial script
+
+        Sessions started with a valid saved state skip the initial script, so parallel workers
+        and restarted processes share one authenticated state instead of logging in each time.
+
+        Args:
+            name (str): Name of the session, e.g. the account or the website it logs in to.
+            directory (str | Path, optional): Directory to store sessions in.
+                Defaults to ~/.cache/parsera/sessions.
+            validate (Callable[[Page], Awaitable[bool]] | None, optional): Script checking that
+                the page opened with the saved state is still authenticated, when it returns
+                False the initial script is executed again. Defaults to None, which accepts
+                every saved state. Expired cookies are dropped from the state, since short-lived
+                analytics cookies expire long before the login.
+            max_age (float | None, optional): Number of seconds after which the saved state is
+                not used anymore. Defaults to None.
+            lock_timeout (float, optional): Number of seconds after which the lock of a worker
+                executing the initial script is considered abandoned. Defaults to 300.
+        """
+        self.name = name
+        self.directory = Path(directory).expanduser()
+        self.validate = validate
+        self.max_age = max_age
+        self.lock_timeout = lock_timeout
+
+    @property
+    def path(self) -> Path:
+        return self.directory / f"{self.name}.json"
+
+    @property
+    def lock_path(self) -> Path:
+        return self.directory / f"{self.name}.lock"
+
+    def drop_expired(self, state: dict) -> dict:
+        now = time.time()
+        # Session cookies have expires set to -1
+        cookies = [
+            cookie
+            for cookie in state.get("cookies", [])
+            if not 0 <= cookie.get("expires", -1) < now
+        ]
+        return {**state, "cookies": cookies}
+
+    def load(self) -> dict | None:
+        """Saved storage state without expired cookies, or None if it's missing or older than
+        max_age."""
+        try:
+            if self.max_age is not None:
+                if time.time() - self.path.stat().st_mtime > self.max_age:
+                    return None
+            state = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return None
+        return self.drop_expired(state)
+
+    def save(self, state: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            # Storage state contains credentials, so it's readable only by the owner
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, "w") as file:
+                json.dump(state, file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    async def is_valid(self, page: Page) -> bool:
+        if self.validate is None:
+            return True
+        try:
+            return bool(await self.validate(page))
+        except Exception as exc:
+            logger.warning("Session validation failed: %r", exc)
+            return False
+
+    def try_lock(self) -> bool:
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                age = time.time() - self.lock_path.stat().st_mtime
+            except OSError:  # Lock was just released
+                return False
+            if age > self.lock_timeout:
+                self.lock_path.unlink(missing_ok=True)
+            return False
+        os.close(fd)
+        return True
+
+    @asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        """Inter-process lock, so only one worker executes the initial script at a time."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        while not await asyncio.to_thread(self.try_lock):
+            await asyncio.sleep(0.5)
+        try:
+            yield
+        finally:
+            self.lock_path.unlink(missing_ok=True)
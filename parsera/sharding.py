@@ -0,0 +1,321 @@
+import asyncio
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import ForkingPickler
+from typing import Awaitable, Callable, Literal
+
+from playwright.async_api import Page
+
+from parsera.exceptions import ShardCrashedError
+from parsera.page import PageLoader, ProxySettings
+
+
+def run_shard(conn: Connection, loader_kwargs: dict, session_options: dict) -> None:
+    """Entrypoint of the shard process."""
+    asyncio.run(serve_shard(conn, loader_kwargs, session_options))
+
+
+async def serve_shard(
+    conn: Connection, loader_kwargs: dict, session_options: dict
+) -> None:
+    loader = PageLoader(**loader_kwargs)
+    await loader.ensure_session(**session_options)
+    loop = asyncio.get_running_loop()
+    tasks = set()
+
+    def take_blocker_stats() -> dict | None:
+        """Counters of the resource blocker since the previous response, which are added to the
+        blocker of the parent process.
+        """
+        if loader.resource_blocker is None:
+            return None
+        stats = loader.resource_blocker.stats()
+        loader.resource_blocker.reset_stats()
+        return stats
+
+    async def handle(request_id: int, fetch_kwargs: dict) -> None:
+        try:
+            content = await loader.fetch_page(**fetch_kwargs)
+            conn.send((request_id, True, content, take_blocker_stats()))
+        except Exception as exc:
+            stats = take_blocker_stats()
+            try:
+                conn.send((request_id, False, exc, stats))
+            except Exception:  # Exception can't be pickled
+                conn.send((request_id, False, RuntimeError(repr(exc)), stats))
+
+    try:
+        while True:
+            message = await loop.run_in_executor(None, conn.recv)
+            if message is None:  # Graceful shutdown
+                break
+            task = asyncio.create_task(handle(*message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+    finally:
+        await loader.close()
+        conn.close()
+
+
+class Shard:
+    """Browser process with its own page pool, driven by a dedicated event loop."""
+
+    def __init__(self, index: int, loader_kwargs: dict, session_options: dict):
+        self.index = index
+        self.loader_kwargs = loader_kwargs
+        self.session_options = session_options
+        self.process: multiprocessing.Process | None = None
+        self.conn: Connection | None = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.inflight: dict[int, asyncio.Future] = {}
+        self.request_ids = itertools.count()
+        self.started_at = 0.0
+        self.completed = 0
+        self.failed = 0
+        self.restarts = 0
+        self.total_latency = 0.0
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def start(self) -> None:
+        if self.process is not None:  # Restart after a crash
+            self.restarts += 1
+            self.fail_inflight()
+            self.conn.close()
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=run_shard,
+            args=(child_conn, self.loader_kwargs, self.session_options),
+            name=f"parsera-shard-{self.index}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.loop = asyncio.get_running_loop()
+        if not self.started_at:
+            self.started_at = time.monotonic()
+        threading.Thread(
+            target=self.read_responses,
+            args=(self.conn,),
+            name=f"parsera-shard-{self.index}-reader",
+            daemon=True,
+        ).start()
+
+    def read_responses(self, conn: Connection) -> None:
+        try:
+            while True:
+                try:
+                    response = conn.recv()
+                except (EOFError, OSError):
+                    self.loop.call_soon_threadsafe(self.on_exit, conn)
+                    return
+                self.loop.call_soon_threadsafe(self.resolve, *response)
+        except RuntimeError:  # Event loop is already closed
+            return
+
+    def resolve(
+        self, request_id: int, ok: bool, payload, blocker_stats: dict | None = None
+    ) -> None:
+        resource_blocker = self.loader_kwargs.get("resource_blocker")
+        if blocker_stats is not None and resource_blocker is not None:
+            resource_blocker.add_stats(blocker_stats)
+        future = self.inflight.pop(request_id, None)
+        if future is None or future.done():
+            return
+        if ok:
+            future.set_result(payload)
+        else:
+            future.set_exception(payload)
+
+    def on_exit(self, conn: Connection) -> None:
+        if conn is self.conn:  # Otherwise pipe of an already replaced process
+            self.fail_inflight()
+
+    def fail_inflight(self) -> None:
+        inflight, self.inflight = self.inflight, {}
+        for future in inflight.values():
+            if not future.done():
+                future.set_exception(
+                    ShardCrashedError(f"Shard {self.index} exited unexpectedly")
+                )
+
+    async def submit(self, fetch_kwargs: dict) -> str:
+        request_id = next(self.request_ids)
+        try:
+            message = bytes(ForkingPickler.dumps((request_id, fetch_kwargs)))
+        except Exception as exc:
+            raise TypeError(
+                "Fetch arguments can't be sent to the shard process, scripts should be "
+                f"defined on the module level: {exc!r}"
+            ) from exc
+        future = self.loop.create_future()
+        self.inflight[request_id] = future
+        started = time.monotonic()
+        try:
+            self.conn.send_bytes(message)
+        except Exception as exc:
+            self.inflight.pop(request_id, None)
+            # Make sure the shard is seen as dead, so it's restarted on the next pick
+            self.process.kill()
+            await asyncio.to_thread(self.process.join)
+            raise ShardCrashedError(f"Shard {self.index} is not reachable") from exc
+        try:
+            result = await future
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.total_latency += time.monotonic() - started
+        self.completed += 1
+        return result
+
+    async def close(self) -> None:
+        if self.process is None:
+            return
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        await asyncio.to_thread(self.process.join, 30)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+        self.process = None
+
+    def metrics(self) -> dict:
+        uptime = time.monotonic() - self.started_at if self.started_at else 0.0
+        return {
+            "shard": self.index,
+            "pid": self.process.pid if self.process else None,
+            "alive": self.alive,
+            "inflight": len(self.inflight),
+            "completed": self.completed,
+            "failed": self.failed,
+            "restarts": self.restarts,
+            "total_latency": self.total_latency,
+            "pages_per_second": self.completed / uptime if uptime else 0.0,
+        }
+
+
+class ShardedPageLoader:
+    def __init__(
+        self,
+        shards: int | None = None,
+        max_concurrency: int = 4,
+        max_retries: int = 1,
+        max_restarts: int = 5,
+        **loader_kwargs,
+    ):
+        """Page loader distributing fetches across several browser processes
+
+        Implements the same `ensure_session`, `fetch_page` and `close` methods as PageLoader, so
+        it can be passed to Parsera. Scripts and loader arguments are sent to the shard processes,
+        so they should be picklable, e.g. scripts should be defined on the module level.
+
+        Each shard gets its own copy of the loader arguments. Counters of `resource_blocker` are
+        sent back and added to the instance passed here, while the statistics of `load_strategy`
+        are learned by each shard separately and aren't visible in this process.
+
+        Args:
+            shards (int | None, optional): Number of browser processes. Defaults to None, which
+                uses the number of CPU cores.
+            max_concurrency (int, optional): Pages fetched concurrently by each shard.
+                Defaults to 4.
+            max_retries (int, optional): Number of times a fetch is retried on another shard when
+                its shard crashes. Defaults to 1.
+            max_restarts (int, optional): Number of times a crashed shard is restarted.
+                Defaults to 5.
+            **loader_kwargs: Arguments of PageLoader used in each shard, except `browser`.
+
+        Raises:
+            ValueError: `browser` is passed, or `load_strategy` is saved to a file, which the
+                shards would overwrite concurrently.
+        """
+        if "browser" in loader_kwargs:
+            raise ValueError("Browser instance can't be shared between processes")
+        load_strategy = loader_kwargs.get("load_strategy")
+        if load_strategy is not None and load_strategy.path is not None:
+            raise ValueError(
+                "Shards would overwrite each other's statistics in the file of the load "
+                "strategy, use LoadStateStrategy(path=None)"
+            )
+        self.shards_count = shards or os.cpu_count() or 1
+        self.max_retries = max_retries
+        self.max_restarts = max_restarts
+        self.loader_kwargs = {**loader_kwargs, "max_concurrency": max_concurrency}
+        self.content_format = loader_kwargs.get("content_format", "html")
+        self.session_options: dict = {}
+        self.shards: list[Shard] = []
+        self._lock = asyncio.Lock()
+
+    async def ensure_session(
+        self,
+        proxy_settings: ProxySettings | None = None,
+        playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        stealth: bool = True,
+    ) -> None:
+        async with self._lock:
+            if self.shards:
+                return
+            self.session_options = {
+                "proxy_settings": proxy_settings,
+                "playwright_script": playwright_script,
+                "stealth": stealth,
+            }
+            self.shards = [
+                Shard(idx, self.loader_kwargs, self.session_options)
+                for idx in range(self.shards_count)
+            ]
+            for shard in self.shards:
+                shard.start()
+
+    async def pick_shard(self) -> Shard:
+        """Least loaded shard, restarting the crashed ones."""
+        async with self._lock:
+            for shard in self.shards:
+                if not shard.alive and shard.restarts < self.max_restarts:
+                    shard.start()
+            candidates = [shard for shard in self.shards if shard.alive]
+            if not candidates:
+                raise ShardCrashedError("All shards exceeded the number of restarts")
+            return min(candidates, key=lambda shard: len(shard.inflight))
+
+    async def fetch_page(
+        self,
+        url: str,
+        scrolls_limit: int = 0,
+        load_state: Literal["domcontentloaded", "load", "networkidle"] | None = None,
+        playwright_script: Callable[[Page], Awaitable[Page]] | None = None,
+        selectors: str | list[str] | None = None,
+    ) -> str:
+        if not self.shards:
+            await self.ensure_session()
+        fetch_kwargs = {
+            "url": url,
+            "scrolls_limit": scrolls_limit,
+            "load_state": load_state,
+            "playwright_script": playwright_script,
+            "selectors": selectors,
+        }
+        for attempt in range(self.max_retries + 1):
+            shard = await self.pick_shard()
+            try:
+                return await shard.submit(fetch_kwargs)
+            except ShardCrashedError:
+                if attempt == self.max_retries:
+                    raise
+
+    def metrics(self) -> list[dict]:
+        return [shard.metrics() for shard in self.shards]
+
+    async def close(self) -> None:
+        await asyncio.gather(*(shard.close() for shard in self.shards))
+        self.shards = []
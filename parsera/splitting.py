@@ -0,0 +1,174 @@
+from bisect import bisect_left
+from collections import deque
+from functools import cache
+from itertools import accumulate
+from typing import Any
+
+import tiktoken
+from langchain_text_splitters import TextSplitter
+
+from parsera.conversion import DEFAULT_ENCODING
+
+
+@cache
+def token_byte_lengths(encoding: tiktoken.Encoding) -> list[int]:
+    """Length in bytes of each token of the encoding, indexed by the token."""
+    lengths = []
+    for token in range(encoding.max_token_value + 1):
+        try:
+            lengths.append(len(encoding.decode_single_token_bytes(token)))
+        except KeyError:  # Gaps between regular and special tokens
+            lengths.append(0)
+    return lengths
+
+
+class TokenSplitter(TextSplitter):
+    def __init__(
+        self,
+        chunk_size: int,
+        chunk_overlap: int = 0,
+        encoding: tiktoken.Encoding | str = DEFAULT_ENCODING,
+        separators: list[str] | None = None,
+        **kwargs: Any,
+    ):
+        """Splitter with semantics of RecursiveCharacterTextSplitter measuring tokens, which
+        encodes the text only once
+
+        Size of a part of the text is the number of tokens of the whole text starting in it, so
+        sizes of adjacent parts add up and no part is encoded again. Splitting is done on UTF-8
+        bytes, where token offsets are sums of their lengths. Text without separators is split
+        on token boundaries.
+
+        Args:
+            chunk_size (int): Maximum number of tokens in a chunk.
+            chunk_overlap (int, optional): Number of tokens of overlap between chunks.
+                Defaults to 0.
+            encoding (tiktoken.Encoding | str, optional): tiktoken encoding or its name.
+                Defaults to the encoding of gpt-4o models.
+            separators (list[str] | None, optional): Separators tried in order, they are kept at
+                the start of the next part. Defaults to None, using paragraphs, lines and words.
+        """
+        super().__init__(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_function=len,
+            **kwargs,
+        )
+        # Encoding is loaded lazily, so the splitter is cheap to send to worker processes
+        self.encoding = encoding
+        self.separators = separators or ["\n\n", "\n", " ", ""]
+
+    def get_encoding(self) -> tiktoken.Encoding:
+        if isinstance(self.encoding, str):
+            return tiktoken.get_encoding(self.encoding)
+        return self.encoding
+
+    def split_text(self, text: str) -> list[str]:
+        if not text:
+            return []
+        encoding = self.get_encoding()
+        data = text.encode("utf-8")
+        tokens = encoding.encode(text, disallowed_special=())
+        offsets = list(
+            accumulate(map(token_byte_lengths(encoding).__getitem__, tokens), initial=0)
+        )
+        offsets.pop()
+        spans = Spans(data, offsets, self._chunk_size, self._chunk_overlap)
+        separators = [separator.encode("utf-8") for separator in self.separators]
+        chunks = []
+        for start, end in spans.split(0, len(data), separators):
+            chunk = data[start:end].decode("utf-8")
+            if self._strip_whitespace:
+                chunk = chunk.strip()
+            if chunk:
+                chunks.append(chunk)
+        return chunks
+
+
+class Spans:
+    """Recursive splitting of UTF-8 encoded text on (start, end) byte offsets."""
+
+    def __init__(
+        self, data: bytes, offsets: list[int], chunk_size: int, chunk_overlap: int
+    ):
+        self.data = data
+        # Byte offset of each token of the text
+        self.offsets = offsets
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    def length(self, start: int, end: int) -> int:
+        return bisect_left(self.offsets, end) - bisect_left(self.offsets, start)
+
+    def pieces(self, start: int, end: int, separator: bytes) -> list[tuple[int, int]]:
+        if separator == b"":
+            # Token boundaries instead of single characters, skipping the ones inside characters
+            first = bisect_left(self.offsets, start)
+            last = bisect_left(self.offsets, end)
+            bounds = [start]
+            for bound in self.offsets[first:last]:
+                if bound > start and self.data[bound] & 0xC0 != 0x80:
+                    bounds.append(bound)
+            bounds.append(end)
+        else:
+            bounds = [start]
+            position = self.data.find(separator, start, end)
+            while position != -1:
+                bounds.append(position)
+                position = self.data.find(separator, position + len(separator), end)
+            bounds.append(end)
+        return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+    def split(
+        self, start: int, end: int, separators: list[bytes]
+    ) -> list[tuple[int, int]]:
+        """Same as RecursiveCharacterTextSplitter._split_text for the part of the text."""
+        separator = separators[-1]
+        next_separators = []
+        for idx, candidate in enumerate(separators):
+            if candidate == b"":
+                separator = candidate
+                break
+            if self.data.find(candidate, start, end) != -1:
+                separator = candidate
+                next_separators = separators[idx + 1 :]
+                break
+
+        chunks = []
+        good = []
+        for piece in self.pieces(start, end, separator):
+            if self.length(*piece) < self.chunk_size:
+                good.append(piece)
+                continue
+            if good:
+                chunks.extend(self.merge(good))
+                good = []
+            if not next_separators:
+                chunks.append(piece)
+            else:
+                chunks.extend(self.split(*piece, next_separators))
+        if good:
+            chunks.extend(self.merge(good))
+        return chunks
+
+    def merge(self, pieces: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Same as TextSplitter._merge_splits for adjacent pieces."""
+        chunks = []
+        current: deque[tuple[int, int]] = deque()
+        lengths: deque[int] = deque()
+        total = 0
+        for piece in pieces:
+            length = self.length(*piece)
+            if total + length > self.chunk_size and current:
+                chunks.append((current[0][0], current[-1][1]))
+                while total > self.chunk_overlap or (
+                    total + length > self.chunk_size and total > 0
+                ):
+                    total -= lengths.popleft()
+                    current.popleft()
+            current.append(piece)
+            lengths.append(length)
+            total += length
+        if current:
+            chunks.append((current[0][0], current[-1][1]))
+        return chunks
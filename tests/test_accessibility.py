@@ -0,0 +1,60 @@
+from parsera.accessibility import add_link_urls, prune_snapshot
+
+SNAPSHOT = """- navigation:
+  - link "Home"
+  - img
+  - link "Cart":
+    - img "cart"
+  - link "About":
+    - /url: https://example.com/about
+- separator
+- heading "Products" [level=1]"""
+
+LINKS = [
+    ["Home", "https://example.com/"],
+    ["Cart", "https://example.com/cart"],
+    ["About", "https://example.com/about"],
+]
+
+
+def test_links_get_urls():
+    snapshot = add_link_urls(SNAPSHOT, LINKS)
+    assert '  - link "Home":\n    - /url: https://example.com/\n' in snapshot
+    assert (
+        '  - link "Cart":\n    - /url: https://example.com/cart\n    - img "cart"'
+        in snapshot
+    )
+    # Existing URLs are not duplicated
+    assert snapshot.count("/url: https://example.com/about") == 1
+
+
+def test_prune_removes_empty_nodes():
+    snapshot = prune_snapshot(SNAPSHOT)
+    assert "- separator" not in snapshot
+    assert "  - img\n" not in snapshot
+    assert '- img "cart"' in snapshot
+
+
+def test_links_with_same_text_are_paired_in_order():
+    snapshot = '- link "Details"\n- text: Second item\n- link "Details"'
+    links = [["Details", "https://x/a"], ["Details", "https://x/b"]]
+
+    assert add_link_urls(snapshot, links) == (
+        '- link "Details":\n  - /url: https://x/a\n'
+        "- text: Second item\n"
+        '- link "Details":\n  - /url: https://x/b'
+    )
+
+
+def test_ambiguous_links_get_no_url():
+    snapshot = '- link "Details"\n- link "Home"'
+    links = [
+        ["Details", "https://x/a"],
+        ["Details", "https://x/b"],
+        ["Home", "https://x/"],
+        ["Home", "https://x/"],
+    ]
+    # One of the "Details" links is hidden, so it's unknown which one is in the snapshot
+    assert add_link_urls(snapshot, links) == (
+        '- link "Details"\n- link "Home":\n  - /url: https://x/'
+    )
@@ -0,0 +1,75 @@
+import pytest
+
+from parsera.blocking import (
+    DEFAULT_ESTIMATED_SIZE,
+    ESTIMATED_RESOURCE_SIZES,
+    ResourceBlocker,
+)
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, url: str, resource_type: str):
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    async def abort(self, error_code: str) -> None:
+        self.outcome = error_code
+
+    async def continue_(self) -> None:
+        self.outcome = "continued"
+
+
+def test_documents_are_never_blocked():
+    blocker = ResourceBlocker(resource_types=["document"], url_patterns=[r"example"])
+    assert not blocker.should_block("https://example.com/", "document")
+
+
+def test_allowed_patterns_take_precedence():
+    blocker = ResourceBlocker(allowed_url_patterns=[r"cdn\.example\.com/product"])
+
+    assert not blocker.should_block("https://cdn.example.com/product.jpg", "image")
+    assert blocker.should_block("https://cdn.example.com/banner.jpg", "image")
+    assert not blocker.should_block("https://example.com/app.js", "script")
+    assert blocker.should_block("https://www.google-analytics.com/g/collect", "xhr")
+
+
+@pytest.mark.asyncio
+async def test_blocked_requests_update_counters():
+    blocker = ResourceBlocker()
+    routes = [
+        FakeRoute("https://example.com/photo.jpg", "image"),
+        FakeRoute("https://example.com/font.woff2", "font"),
+        FakeRoute("https://www.googletagmanager.com/gtm.js", "script"),
+        FakeRoute("https://connect.facebook.net/events", "fetch"),
+        FakeRoute("https://example.com/", "document"),
+        FakeRoute("https://example.com/app.js", "script"),
+    ]
+    for route in routes:
+        await blocker.handle_route(route)
+
+    assert [route.outcome for route in routes] == [
+        "blockedbyclient",
+        "blockedbyclient",
+        "blockedbyclient",
+        "blockedbyclient",
+        "continued",
+        "continued",
+    ]
+    assert blocker.blocked_requests == 4
+    assert blocker.blocked_by_type == {"image": 1, "font": 1, "script": 1, "fetch": 1}
+    assert blocker.estimated_bytes_saved == (
+        ESTIMATED_RESOURCE_SIZES["image"]
+        + ESTIMATED_RESOURCE_SIZES["font"]
+        + ESTIMATED_RESOURCE_SIZES["script"]
+        + DEFAULT_ESTIMATED_SIZE
+    )
+
+    blocker.reset_stats()
+    assert blocker.blocked_requests == 0
+    assert blocker.estimated_bytes_saved == 0
@@ -0,0 +1,95 @@
+import pytest
+
+from parsera.boilerplate import BoilerplateRemover
+from parsera.pruning import DEFAULT_KEPT_ATTRIBUTES
+
+NAV = """
+<nav><ul><li><a href="/">Home</a></li><li><a href="/shop">Shop</a></li>
+<li><a href="/about">About us</a></li></ul></nav>
+"""
+COOKIES = '<div class="cookie-banner"><p>We use cookies</p><button>OK</button></div>'
+FOOTER = '<div class="site-info">Copyright 2024 Example shop, all rights reserved</div>'
+
+
+def page(products: str) -> str:
+    return f"<html><body>{NAV}{COOKIES}<main>{products}</main>{FOOTER}</body></html>"
+
+
+def products(offset: int) -> str:
+    return (
+        "<ul>"
+        + "".join(
+            f'<li><a href="/p/{idx}">Product {idx}</a> <span>${idx * 10}</span></li>'
+            for idx in range(offset, offset + 10)
+        )
+        + "</ul>"
+    )
+
+
+def test_removes_hinted_blocks():
+    remover = BoilerplateRemover(token_counter=len)
+    html = remover.remove(page(products(0)), url="https://shop.example/1")
+    assert "About us" not in html
+    assert "We use cookies" not in html
+    assert "Product 9" in html
+    assert remover.reports[-1]["removed_blocks"] == 2
+    assert remover.tokens_removed > 0
+
+
+def test_removes_blocks_repeated_across_pages():
+    remover = BoilerplateRemover(token_counter=len, repeated_pages=2)
+    for idx in range(3):
+        html = remover.remove(
+            page(products(idx * 10)), url=f"https://shop.example/{idx}"
+        )
+    assert "Copyright" not in html
+    assert "Product 29" in html
+    # The same page loaded again isn't counted as a repetition
+    again = BoilerplateRemover(token_counter=len)
+    for _ in range(3):
+        html = again.remove(page(products(0)), url="https://shop.example/1")
+    assert "Copyright" in html
+
+
+def test_keep_selectors():
+    remover = BoilerplateRemover(token_counter=len, keep_selectors=["nav"])
+    html = remover.remove(page(products(0)), url="https://shop.example/1")
+    assert "About us" in html
+    assert "We use cookies" not in html
+
+
+def test_link_heavy_listing_is_kept():
+    listing = (
+        "<div>"
+        + "".join(f'<a href="/{idx}">Item {idx}</a>' for idx in range(20))
+        + "</div>"
+    )
+    html = BoilerplateRemover(token_counter=len).remove(
+        f"<body>{listing}{FOOTER}</body>", url="https://shop.example/"
+    )
+    assert "Item 19" in html
+
+
+def test_tracked_blocks_are_bounded():
+    remover = BoilerplateRemover(token_counter=len, max_tracked_blocks=5)
+    for idx in range(10):
+        remover.remove(
+            f"<div><p>Unique paragraph number {idx} of the page</p></div>",
+            url=f"https://example.com/{idx}",
+        )
+
+    assert len(remover.seen_blocks["example.com"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_aremove_runs_in_thread():
+    remover = BoilerplateRemover(token_counter=len)
+    html = "<main><p>Content of the page long enough</p></main><nav><a>Home</a></nav>"
+
+    assert await remover.aremove(html, url="https://example.com") == remover.remove(
+        html, url="https://example.com/other"
+    )
+
+
+def test_pruner_keeps_boilerplate_hints():
+    assert {"class", "id", "role", "aria-modal"} <= set(DEFAULT_KEPT_ATTRIBUTES)
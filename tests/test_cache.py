@@ -0,0 +1,98 @@
+import os
+import time
+
+from parsera.cache import PageCache
+from parsera.frames import IframePolicy
+from parsera.pruning import DomPruner
+
+
+async def script(page):
+    return page
+
+
+async def other_script(page):
+    await page.wait_for_timeout(1000)
+    return page
+
+
+def test_key_depends_on_fetch_options(tmp_path):
+    cache = PageCache(directory=tmp_path)
+    url = "https://example.com"
+    key = cache.key(url=url, load_state="networkidle")
+
+    assert key == cache.key(url=url, load_state="networkidle")
+    assert key != cache.key(url=url, load_state="load")
+    assert key != cache.key(url=url, load_state="networkidle", scrolls_limit=5)
+    assert cache.key(url=url, playwright_script=script) != cache.key(
+        url=url, playwright_script=other_script
+    )
+
+
+def test_key_depends_on_content_settings(tmp_path):
+    cache = PageCache(directory=tmp_path)
+    url = "https://example.com"
+    key = cache.key(url=url)
+
+    assert key != cache.key(url=url, dom_pruner=DomPruner().options())
+    assert cache.key(url=url, dom_pruner=DomPruner().options()) != cache.key(
+        url=url, dom_pruner=DomPruner(remove_hidden=False).options()
+    )
+    assert key != cache.key(
+        url=url, iframe_policy=IframePolicy(max_total_size=1000).options()
+    )
+
+
+def test_key_depends_on_session_identity(tmp_path):
+    cache = PageCache(directory=tmp_path)
+    url = "https://example.com"
+    cookies = [{"name": "sid", "value": "1", "domain": "example.com", "path": "/"}]
+    keys = {
+        cache.key(url=url),
+        cache.key(url=url, initial_script=script),
+        cache.key(url=url, session_name="account"),
+        cache.key(url=url, cookies=cookies),
+        cache.key(url=url, http_fast_path=True),
+    }
+
+    assert len(keys) == 5
+    assert cache.key(url=url, cookies=[]) == cache.key(url=url)
+
+
+def test_put_and_get(tmp_path):
+    cache = PageCache(directory=tmp_path, ttl=60)
+    key = cache.key(url="https://example.com")
+    assert cache.get(key) is None
+
+    cache.put(key, "https://example.com", "<html>ok</html>", {"etag": '"abc"'})
+    entry = cache.get(key)
+
+    assert entry.read() == "<html>ok</html>"
+    assert entry.etag == '"abc"'
+    assert cache.is_fresh(entry)
+
+
+def test_expired_entry_served_offline(tmp_path):
+    cache = PageCache(directory=tmp_path, ttl=0)
+    key = cache.key(url="https://example.com")
+    cache.put(key, "https://example.com", "<html></html>")
+
+    assert not cache.is_fresh(cache.get(key))
+    cache.offline = True
+    assert cache.is_fresh(cache.get(key))
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = PageCache(directory=tmp_path, max_size=10**9)
+    keys = [cache.key(url=f"https://example.com/{i}") for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, f"https://example.com/{i}", os.urandom(1000).hex())
+        past = time.time() - 100 + i
+        os.utime(cache.content_path(key), (past, past))
+    cache.get(keys[0])
+
+    cache.max_size = 2 * cache.get(keys[0]).meta["size"] + 100
+    cache.evict()
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
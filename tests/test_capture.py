@@ -0,0 +1,47 @@
+from parsera.cache import PageCache
+from parsera.capture import ResponseCapture
+
+PAYLOADS = [
+    {"url": "https://example.com/api?a=1&b=2", "status": 200, "data": {"name": "<b>"}}
+]
+
+
+def test_matches_json_api_responses():
+    capture = ResponseCapture(url_patterns=[r"/api"])
+    assert capture.matches("https://example.com/api", "fetch", "application/json")
+    assert not capture.matches("https://example.com/api", "script", "application/json")
+    assert not capture.matches("https://example.com/other", "xhr", "application/json")
+    assert not capture.matches("https://example.com/api", "xhr", "text/html")
+
+
+def test_combines_payloads_with_content():
+    html = "<html><body>Page</body></html>"
+    appended = ResponseCapture().combine(html, PAYLOADS)
+    assert appended.startswith(html)
+    assert '<pre>{"name":"&lt;b&gt;"}</pre>' in appended
+    assert "https://example.com/api?a=1&amp;b=2" in appended
+
+    replaced = ResponseCapture(mode="replace").combine(html, PAYLOADS)
+    assert html not in replaced
+    # Pages without captured responses keep their HTML
+    assert ResponseCapture(mode="replace").combine(html, []) == html
+
+
+def test_cache_key_depends_on_capture_settings(tmp_path):
+    cache = PageCache(directory=tmp_path)
+    url = "https://example.com"
+    append = ResponseCapture().options()
+    replace = ResponseCapture(mode="replace").options()
+    filtered = ResponseCapture(mode="replace", url_patterns=[r"/api/"]).options()
+
+    keys = {
+        cache.key(url=url),
+        cache.key(url=url, response_capture=append),
+        cache.key(url=url, response_capture=replace),
+        cache.key(url=url, response_capture=filtered),
+    }
+
+    assert len(keys) == 4
+    assert cache.key(url=url, response_capture=replace) == cache.key(
+        url=url, response_capture=ResponseCapture(mode="replace").options()
+    )
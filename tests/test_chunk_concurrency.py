@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from parsera.engine.chunks_extractor import ChunksTabularExtractor
+
+HTML = "".join(f"<p>Item {idx} costs {idx * 10}</p>" for idx in range(40))
+
+
+class FakeModel:
+    """Returns the items of the chunk, keeping track of concurrent calls."""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        text = messages[-1].content
+        if "All jsons from different parts of the page" in text:
+            return AIMessage(json.dumps([{"merged": True}]))
+        items = [
+            {"name": line} for line in text.splitlines() if line.startswith("Item")
+        ]
+        return AIMessage(json.dumps(items))
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_extracted_concurrently():
+    model = FakeModel()
+    extractor = ChunksTabularExtractor(
+        model=model, chunk_size=200, token_counter=len, chunk_concurrency=3
+    )
+    result = await extractor.run(HTML, attributes={"name": "item name"})
+
+    assert result == [{"merged": True}]
+    chunks = len(extractor.chunks_data)
+    assert chunks > 3
+    assert model.calls == chunks + 1
+    assert model.max_running == 3
+    # Chunks keep the page order
+    assert extractor.chunks_data[0][0]["name"].startswith("Item 1 ")
+    assert any("Item 39 " in row["name"] for row in extractor.chunks_data[-1])
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        ChunksTabularExtractor(
+            model=FakeModel(), token_counter=len, chunk_concurrency=0
+        )
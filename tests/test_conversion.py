@@ -0,0 +1,36 @@
+import pytest
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from markdownify import MarkdownConverter
+
+from parsera.conversion import ConversionPool
+
+HTML = "".join(f"<h2>Item {idx}</h2><p>Price: {idx * 10}</p>" for idx in range(50))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["process", "thread"])
+async def test_pool_matches_inline_conversion(kind):
+    converter = MarkdownConverter()
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=200, chunk_overlap=50, length_function=len
+    )
+    markdown = converter.convert(HTML)
+    with ConversionPool(kind=kind, max_workers=2) as pool:
+        assert await pool.run(HTML, converter=converter) == markdown
+        chunks = await pool.run(HTML, converter=converter, text_splitter=splitter)
+        # Splitter different from the one workers were started with is sent with the page
+        other_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=100, chunk_overlap=0, length_function=len
+        )
+        other_chunks = await pool.run(
+            HTML, converter=converter, text_splitter=other_splitter
+        )
+        assert await pool.run("# Title", content_format="accessibility") == "# Title"
+
+    assert chunks == splitter.create_documents([markdown])
+    assert other_chunks == other_splitter.create_documents([markdown])
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        ConversionPool(kind="fiber")
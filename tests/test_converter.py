@@ -0,0 +1,25 @@
+import pytest
+from markdownify import MarkdownConverter
+
+from parsera.engine.converter import FastMarkdownConverter
+
+pytest.importorskip("lxml")
+
+PAGES = [
+    "<h1>Title <b>bold</b></h1><p>Some   text with *stars* and <a href='/x'>a link</a></p>",
+    "<ul>\n  <li>One</li>\n  <li>Two\n    <ol><li>Nested</li></ol>\n  </li>\n</ul>",
+    "<table><tr><th>Name</th><th>Price</th></tr><tr><td>A</td><td>100</td></tr></table>",
+    "<pre>  line 1\n  line 2</pre><p>after <code>x_y</code></p><!-- comment -->",
+    "<blockquote>Quote<br>next</blockquote><hr><img src='a.png' alt='image'>",
+    "<div><p>x</p>\n\n<p>y</p></div>",
+    "<p>a</p> \t <p>b</p>\r\n\r\n<pre>\n\n</pre><textarea>\n\n</textarea>",
+]
+
+
+@pytest.mark.parametrize("html", PAGES)
+def test_matches_markdownify(html):
+    assert FastMarkdownConverter().convert(html) == MarkdownConverter().convert(html)
+
+
+def test_empty_document():
+    assert FastMarkdownConverter().convert("") == ""
@@ -0,0 +1,86 @@
+import pytest
+
+from parsera.load_strategy import LoadStateStrategy
+
+URL = "https://example.com/listing"
+TIMINGS = {"domcontentloaded": 0.3, "load": 1.2, "networkidle": 30.0}
+
+
+def test_explores_until_enough_samples():
+    strategy = LoadStateStrategy(path=None, min_samples=3)
+    assert strategy.needs_exploration(URL)
+    assert strategy.choose(URL) == "networkidle"
+
+
+def test_picks_cheapest_complete_state(tmp_path):
+    path = tmp_path / "stats.json"
+    strategy = LoadStateStrategy(path=path, min_samples=3)
+    for _ in range(3):
+        sizes = {"domcontentloaded": 500, "load": 1000, "networkidle": 1000}
+        strategy.record(URL, timings=TIMINGS, sizes=sizes)
+    strategy.save()
+
+    assert strategy.choose(URL) == "load"
+    assert not strategy.needs_exploration(URL)
+    # Statistics are persisted between runs
+    assert LoadStateStrategy(path=path, min_samples=3).choose(URL) == "load"
+
+
+def test_upgrade_marks_cheaper_state_incomplete():
+    strategy = LoadStateStrategy(path=None, min_samples=3, success_rate=0.9)
+    for _ in range(3):
+        sizes = {"domcontentloaded": 1000, "load": 1000, "networkidle": 1000}
+        strategy.record(URL, timings=TIMINGS, sizes=sizes)
+    assert strategy.choose(URL) == "domcontentloaded"
+    assert not strategy.looks_complete(URL, 100)
+
+    strategy.record(
+        URL,
+        timings=TIMINGS,
+        sizes={"domcontentloaded": 100, "load": 1000},
+    )
+
+    assert strategy.choose(URL) == "load"
+
+
+def test_target_fetch_marks_full_cheaper_state_complete():
+    strategy = LoadStateStrategy(path=None, min_samples=3, success_rate=0.9)
+    for _ in range(3):
+        sizes = {"domcontentloaded": 1000, "load": 1000}
+        strategy.record(URL, timings=TIMINGS, sizes=sizes)
+
+    assert (
+        strategy.domain_stats(URL)["states"]["domcontentloaded"]["complete"]
+        == [True] * 3
+    )
+
+
+@pytest.mark.asyncio
+async def test_asave_persists_statistics(tmp_path):
+    path = tmp_path / "stats.json"
+    strategy = LoadStateStrategy(path=path)
+    strategy.record(URL, timings=TIMINGS, sizes={"networkidle": 1000})
+    await strategy.asave()
+
+    assert LoadStateStrategy(path=path).stats == strategy.stats
+
+
+def test_completeness_is_judged_per_path_pattern():
+    strategy = LoadStateStrategy(path=None)
+    listing = "https://example.com/products?page=1"
+    product = "https://example.com/products/42"
+    strategy.record(listing, timings=TIMINGS, sizes={"networkidle": 10000})
+    strategy.record(product, timings=TIMINGS, sizes={"networkidle": 500})
+
+    assert strategy.looks_complete("https://example.com/products/7", 500)
+    assert not strategy.looks_complete("https://example.com/products?page=2", 500)
+
+
+def test_fetches_stopped_early_dont_set_baseline():
+    strategy = LoadStateStrategy(path=None)
+    strategy.record(URL, timings=TIMINGS, sizes={"domcontentloaded": 100})
+
+    assert strategy.final_sizes(URL) == []
+    # Without a baseline content is complete once it stops growing
+    assert strategy.looks_complete(URL, 1000, previous_size=1000)
+    assert not strategy.looks_complete(URL, 1000, previous_size=100)
@@ -0,0 +1,70 @@
+import pytest
+
+from parsera.merge import merge_chunks
+
+
+def test_conflicting_values_are_taken_further_from_border():
+    first = [
+        {"name": "zero element", "price": "123"},
+        {"name": "first element", "price": "100"},
+        {"name": "second element", "price": "200"},
+        {"name": "third element", "price": "999"},
+    ]
+    second = [
+        {"name": "second element", "price": "123"},
+        {"name": "third element", "price": "400"},
+    ]
+    assert merge_chunks([first, second]) == [
+        {"name": "zero element", "price": "123"},
+        {"name": "first element", "price": "100"},
+        {"name": "second element", "price": "200"},
+        {"name": "third element", "price": "400"},
+    ]
+
+
+def test_missing_and_truncated_values_are_fixed():
+    first = [
+        {"name": "first element", "price": "100"},
+        {"name": "second element", "price": "200"},
+        {"name": "third", "price": None},
+    ]
+    second = [
+        {"name": "third element", "price": "400"},
+        {"name": "fourth element", "price": "350"},
+    ]
+    third = [
+        {"name": "fourth element", "price": None},
+        {"name": "fifth element", "price": "500"},
+    ]
+    assert merge_chunks([first, [], second, third]) == [
+        {"name": "first element", "price": "100"},
+        {"name": "second element", "price": "200"},
+        {"name": "third element", "price": "400"},
+        {"name": "fourth element", "price": "350"},
+        {"name": "fifth element", "price": "500"},
+    ]
+
+
+def test_similar_records_are_kept():
+    first = [{"name": f"Product {idx}", "price": "10"} for idx in range(1, 12)]
+    second = [{"name": f"Product {idx}", "price": "10"} for idx in range(10, 15)]
+    names = [row["name"] for row in merge_chunks([first, second])]
+    assert names == [f"Product {idx}" for idx in range(1, 15)]
+
+
+def test_only_rows_are_merged():
+    with pytest.raises(ValueError):
+        merge_chunks([{"name": ["a", "b"]}, {"name": ["c"]}])
+
+
+def test_only_overlap_is_aligned():
+    rows = [{"name": f"Record {chr(65 + idx % 26)}{idx}"} for idx in range(60)]
+    # Same record at both ends of the page is kept, since it's out of the overlap
+    first = [{"name": "Summary"}, *rows[:30]]
+    second = [*rows[20:], {"name": "Summary"}]
+
+    assert merge_chunks([first, second]) == [
+        {"name": "Summary"},
+        *rows,
+        {"name": "Summary"},
+    ]
@@ -0,0 +1,46 @@
+import pytest
+
+from parsera.page import PageLoader
+
+
+class Closeable:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    async def stop(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_close_resets_launched_browser():
+    loader = PageLoader()
+    browser, playwright, fetcher = Closeable(), Closeable(), Closeable()
+    loader.browser, loader.playwright, loader.http_fetcher = (
+        browser,
+        playwright,
+        fetcher,
+    )
+    loader.session_options = {"stealth": True}
+
+    await loader.close()
+
+    assert browser.closed and playwright.closed and fetcher.closed
+    # The next session launches a new browser instead of using the closed one
+    assert loader.browser is None
+    assert loader.playwright is None
+    assert loader.http_fetcher is None
+    assert loader.session_options == {}
+
+
+@pytest.mark.asyncio
+async def test_close_keeps_passed_browser():
+    browser = Closeable()
+    loader = PageLoader(browser=browser)
+
+    await loader.close()
+
+    assert loader.browser is browser
+    assert not browser.closed
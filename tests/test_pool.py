@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from parsera.pool import PagePool, PageSlot
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class Factory:
+    def __init__(self, failures: int = 0):
+        self.created = 0
+        self.failures = failures
+
+    async def __call__(self) -> PageSlot:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("Browser context can't be created")
+        self.created += 1
+        return PageSlot(FakeContext(), page=None)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_by_max_size():
+    factory = Factory()
+    pool = PagePool(factory, max_size=2)
+    active = peak = 0
+
+    async def fetch():
+        nonlocal active, peak
+        async with pool.page():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(fetch() for _ in range(6)))
+
+    assert peak == 2
+    assert factory.created == 2
+    assert len(pool.slots) == 2
+
+
+@pytest.mark.asyncio
+async def test_slots_are_reused():
+    factory = Factory()
+    pool = PagePool(factory, max_size=3)
+
+    async with pool.page() as first:
+        pass
+    async with pool.page() as second:
+        pass
+
+    assert first is second
+    assert factory.created == 1
+
+    await pool.close()
+    assert first.context.closed
+    assert pool.slots == []
+
+
+@pytest.mark.asyncio
+async def test_factory_error_releases_semaphore():
+    factory = Factory(failures=1)
+    pool = PagePool(factory, max_size=1)
+
+    with pytest.raises(RuntimeError):
+        async with pool.page():
+            pass
+    # The only place in the pool is free again
+    slot = await asyncio.wait_for(pool.checkout(), timeout=1)
+    assert slot in pool.slots
+    pool.checkin(slot)
+
+
+def test_max_size_validation():
+    with pytest.raises(ValueError):
+        PagePool(Factory(), max_size=0)
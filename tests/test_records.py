@@ -0,0 +1,49 @@
+from bs4 import BeautifulSoup
+
+from parsera.records import (
+    RECORD_SEPARATOR,
+    RecordMarkingConverter,
+    RecordTextSplitter,
+    find_records,
+)
+
+
+def listing(sections: int, per_section: int) -> str:
+    cards = []
+    for section in range(sections):
+        items = "".join(
+            f'<div class="card"><a href="/{section}/{idx}">Product {section}-{idx}</a>'
+            f'<span class="price">${idx}</span></div>'
+            for idx in range(per_section)
+        )
+        cards.append(f'<section class="group">{items}</section>')
+    return f"<h1>Shop</h1><nav><a href='/'>Home</a></nav>{''.join(cards)}"
+
+
+def test_finds_records_split_between_containers():
+    records = find_records(BeautifulSoup(listing(3, 5), "html.parser"))
+    assert len(records) == 15
+    assert all(record["class"] == ["card"] for record in records)
+
+
+def test_no_records():
+    soup = BeautifulSoup("<p>Just a paragraph</p><p>And another</p>", "html.parser")
+    assert find_records(soup) == []
+
+
+def test_chunks_contain_whole_records():
+    markdown = RecordMarkingConverter().convert(listing(2, 10))
+    assert markdown.count(RECORD_SEPARATOR) == 19
+    chunks = RecordTextSplitter(chunk_size=100).split_text(markdown)
+    assert len(chunks) > 1
+    records = [
+        line for chunk in chunks for line in chunk.splitlines() if "Product" in line
+    ]
+    assert len(records) == 20
+    assert all(RECORD_SEPARATOR not in chunk for chunk in chunks)
+    assert all(len(chunk) <= 100 for chunk in chunks)
+
+
+def test_text_without_records_uses_fallback():
+    text = " ".join(f"word{idx}" for idx in range(100))
+    assert len(RecordTextSplitter(chunk_size=100).split_text(text)) > 1
@@ -0,0 +1,16 @@
+from parsera.recycling import RecyclePolicy
+
+
+def test_recycles_after_navigations_and_errors():
+    policy = RecyclePolicy(max_navigations=3)
+    assert policy.reason(navigations=2) is None
+    assert policy.reason(navigations=3) == "navigations: 3"
+    assert policy.reason(navigations=1, error=TimeoutError()) == "error: TimeoutError"
+    assert RecyclePolicy(recycle_on_error=False).reason(1, error=ValueError()) is None
+
+
+def test_memory_limit_ignored_without_measurement():
+    policy = RecyclePolicy(max_navigations=None, max_memory=100)
+    assert policy.reason(navigations=10_000) is None
+    assert policy.reason(navigations=1, memory=None) is None
+    assert policy.reason(navigations=1, memory=150) == "memory: 150"
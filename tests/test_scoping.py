@@ -0,0 +1,32 @@
+from parsera.scoping import is_xpath, normalize_selectors, select_html
+
+HTML = """
+<html><body>
+<header><a href="/">Home</a></header>
+<div id="results">
+  <div class="item">First <span class="item">nested</span></div>
+  <div class="item">Second</div>
+</div>
+<table class="prices"><tr><td>10</td></tr></table>
+<footer>Footer</footer>
+</body></html>
+"""
+
+
+def test_selects_outermost_matches_in_document_order():
+    html = select_html(HTML, ["table.prices", ".item"])
+    assert "Home" not in html and "Footer" not in html
+    assert html.index("First") < html.index("Second") < html.index("10")
+    assert html.count('class="item"') == 3  # Nested match is not repeated
+
+
+def test_no_match_returns_empty_string():
+    assert select_html(HTML, ["#missing"]) == ""
+
+
+def test_selector_kinds():
+    assert normalize_selectors("#results") == ["#results"]
+    assert normalize_selectors(None) == []
+    assert is_xpath("//div[@id='results']")
+    assert is_xpath("xpath=//table")
+    assert not is_xpath("css=#results")
@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+import pytest
+
+from parsera.sessions import SessionStore
+
+STATE = {
+    "cookies": [{"name": "sid", "value": "1", "domain": "example.com", "expires": -1}],
+    "origins": [],
+}
+
+
+def test_saved_state_is_loaded(tmp_path):
+    store = SessionStore("example", directory=tmp_path)
+    assert store.load() is None
+    store.save(STATE)
+    assert SessionStore("example", directory=tmp_path).load() == STATE
+
+
+def test_expired_cookies_are_dropped(tmp_path):
+    store = SessionStore("example", directory=tmp_path)
+    analytics_cookie = {
+        "name": "_gat",
+        "value": "1",
+        "domain": "example.com",
+        "expires": time.time() - 60,
+    }
+    store.save({**STATE, "cookies": [*STATE["cookies"], analytics_cookie]})
+    assert store.load() == STATE
+
+
+def test_old_state_is_ignored(tmp_path):
+    store = SessionStore("example", directory=tmp_path)
+    store.save(STATE)
+    assert SessionStore("example", directory=tmp_path, max_age=-1).load() is None
+
+
+@pytest.mark.asyncio
+async def test_lock_is_exclusive(tmp_path):
+    store = SessionStore("example", directory=tmp_path)
+    events = []
+
+    async def login(idx: int):
+        async with store.lock():
+            events.append(("start", idx))
+            await asyncio.sleep(0.1)
+            events.append(("end", idx))
+
+    await asyncio.gather(login(0), login(1))
+    assert [event for event, _ in events] == ["start", "end", "start", "end"]
+    assert not store.lock_path.exists()
@@ -0,0 +1,128 @@
+import asyncio
+import multiprocessing
+
+import pytest
+
+from parsera.blocking import ResourceBlocker
+from parsera.exceptions import ShardCrashedError
+from parsera.load_strategy import LoadStateStrategy
+from parsera.sharding import Shard, ShardedPageLoader
+
+
+class FakeShard:
+    def __init__(self, alive: bool = True, inflight: int = 0, restarts: int = 0):
+        self.alive = alive
+        self.inflight = {idx: None for idx in range(inflight)}
+        self.restarts = restarts
+        self.started = 0
+
+    def start(self) -> None:
+        self.started += 1
+        self.restarts += 1
+        self.alive = True
+
+
+def new_shard() -> Shard:
+    shard = Shard(0, loader_kwargs={}, session_options={})
+    shard.loop = asyncio.get_running_loop()
+    return shard
+
+
+@pytest.mark.asyncio
+async def test_resolve_sets_result_and_exception():
+    shard = new_shard()
+    done, failed = shard.loop.create_future(), shard.loop.create_future()
+    shard.inflight = {0: done, 1: failed}
+
+    shard.resolve(0, True, "<html></html>")
+    shard.resolve(1, False, ValueError("broken"))
+    # Responses to unknown requests are ignored
+    shard.resolve(2, True, "late")
+
+    assert done.result() == "<html></html>"
+    with pytest.raises(ValueError):
+        failed.result()
+    assert shard.inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_fail_inflight():
+    shard = new_shard()
+    futures = [shard.loop.create_future() for _ in range(2)]
+    shard.inflight = dict(enumerate(futures))
+
+    shard.fail_inflight()
+
+    assert shard.inflight == {}
+    for future in futures:
+        with pytest.raises(ShardCrashedError):
+            future.result()
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_unpicklable_arguments():
+    shard = new_shard()
+    shard.conn, _ = multiprocessing.Pipe()
+
+    def local_script(page):
+        return page
+
+    with pytest.raises(TypeError):
+        await shard.submit(
+            {"url": "https://example.com", "playwright_script": local_script}
+        )
+    assert shard.inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_pick_shard_least_loaded_and_restarts():
+    loader = ShardedPageLoader(shards=3, max_restarts=1)
+    busy, idle, crashed = (
+        FakeShard(inflight=3),
+        FakeShard(inflight=1),
+        FakeShard(alive=False, inflight=0),
+    )
+    loader.shards = [busy, idle, crashed]
+
+    assert await loader.pick_shard() is crashed
+    assert crashed.started == 1
+
+    crashed.alive = False
+    assert await loader.pick_shard() is idle
+    assert crashed.started == 1
+
+    busy.alive = idle.alive = False
+    busy.restarts = idle.restarts = 1
+    with pytest.raises(ShardCrashedError):
+        await loader.pick_shard()
+
+
+@pytest.mark.asyncio
+async def test_resolve_adds_blocker_stats_to_parent():
+    blocker = ResourceBlocker()
+    shard = Shard(0, loader_kwargs={"resource_blocker": blocker}, session_options={})
+    shard.loop = asyncio.get_running_loop()
+    future = shard.loop.create_future()
+    shard.inflight = {0: future}
+    stats = {
+        "blocked_requests": 3,
+        "blocked_by_type": {"image": 2, "font": 1},
+        "estimated_bytes_saved": 100_000,
+    }
+
+    shard.resolve(0, True, "<html></html>", stats)
+    # Counters of failed and late responses are counted too
+    shard.resolve(1, False, ValueError("broken"), stats)
+
+    assert future.result() == "<html></html>"
+    assert blocker.blocked_requests == 6
+    assert blocker.blocked_by_type == {"image": 4, "font": 2}
+    assert blocker.estimated_bytes_saved == 200_000
+
+
+def test_rejects_load_strategy_saved_to_file(tmp_path):
+    with pytest.raises(ValueError):
+        ShardedPageLoader(
+            shards=2, load_strategy=LoadStateStrategy(path=tmp_path / "stats.json")
+        )
+    ShardedPageLoader(shards=2, load_strategy=LoadStateStrategy(path=None))
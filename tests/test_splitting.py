@@ -0,0 +1,60 @@
+import random
+
+import pytest
+import tiktoken
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from parsera.splitting import TokenSplitter
+
+# Encoding without merges, each byte is a token
+BYTES_ENCODING = tiktoken.Encoding(
+    name="bytes",
+    pat_str=r"\S+|\s+",
+    mergeable_ranks={bytes([idx]): idx for idx in range(256)},
+    special_tokens={},
+)
+
+
+def markdown(seed: int) -> str:
+    rng = random.Random(seed)
+    words = ["price", "item", "[link](/x)", "|", "**bold**", "supercalifragilistic" * 3]
+    paragraphs = []
+    for _ in range(40):
+        lines = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(1, 15)))
+            for _ in range(rng.randint(1, 6))
+        ]
+        paragraphs.append("\n".join(lines))
+    return "\n\n".join(paragraphs)
+
+
+@pytest.mark.parametrize("chunk_size,chunk_overlap", [(50, 0), (200, 66), (1000, 333)])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_matches_recursive_splitter(seed, chunk_size, chunk_overlap):
+    text = markdown(seed)
+    expected = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size, chunk_overlap=chunk_overlap, length_function=len
+    ).split_text(text)
+    splitter = TokenSplitter(
+        chunk_size=chunk_size, chunk_overlap=chunk_overlap, encoding=BYTES_ENCODING
+    )
+    assert splitter.split_text(text) == expected
+
+
+def test_create_documents():
+    splitter = TokenSplitter(chunk_size=20, encoding=BYTES_ENCODING)
+    documents = splitter.create_documents(["first paragraph\n\nsecond paragraph"])
+    assert [document.page_content for document in documents] == [
+        "first paragraph",
+        "second paragraph",
+    ]
+    assert splitter.split_text("") == []
+
+
+def test_multibyte_text_without_separators():
+    text = "цена€" * 50 + " " + "😀" * 40
+    expected = RecursiveCharacterTextSplitter(
+        chunk_size=30, chunk_overlap=10, length_function=lambda t: len(t.encode())
+    ).split_text(text)
+    splitter = TokenSplitter(chunk_size=30, chunk_overlap=10, encoding=BYTES_ENCODING)
+    assert splitter.split_text(text) == expected
@@ -0,0 +1,131 @@
+import json
+import re
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from parsera import Parsera
+from parsera.engine.chunks_extractor import ChunksTabularExtractor
+
+HTML = "".join(f"<p>Item {idx:02d} costs {idx * 10}</p>" for idx in range(40))
+
+
+class FakeModel:
+    def __init__(self, broken_item: str | None = None):
+        # Chunk with this item returns an object instead of a list of rows
+        self.broken_item = broken_item
+        self.merges = 0
+
+    async def ainvoke(self, messages):
+        if messages[0].content == ChunksTabularExtractor.system_merge_prompt:
+            self.merges += 1
+            names = dict.fromkeys(re.findall(r"Item \d\d", messages[-1].content))
+            return AIMessage(json.dumps([{"name": name} for name in names]))
+        # Items of the page chunk, ignoring previous data in the prompt
+        names = re.findall(r"Item \d\d(?= costs)", messages[-1].content)
+        if self.broken_item in names:
+            return AIMessage(json.dumps({"name": names}))
+        return AIMessage(json.dumps([{"name": name} for name in names]))
+
+
+async def collect(extractor: ChunksTabularExtractor) -> list[dict]:
+    return [
+        event async for event in extractor.stream(HTML, attributes={"name": "name"})
+    ]
+
+
+class FakeLoader:
+    content_format = "html"
+
+    async def ensure_session(self, **kwargs):
+        pass
+
+    async def fetch_page(self, **kwargs):
+        return HTML
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_concurrency", [None, 4])
+async def test_stream_yields_final_rows(chunk_concurrency):
+    extractor = ChunksTabularExtractor(
+        model=FakeModel(),
+        chunk_size=200,
+        token_counter=len,
+        chunk_concurrency=chunk_concurrency,
+        merge_strategy="local",
+    )
+    events = await collect(extractor)
+
+    *rows_events, end = events
+    assert end["type"] == "end"
+    assert len(rows_events) == end["chunks"] > 1
+    assert [event["chunk"] for event in rows_events] == list(range(end["chunks"]))
+    names = [row["name"] for event in rows_events for row in event["rows"]]
+    assert names == [f"Item {idx:02d}" for idx in range(40)]
+    assert end["rows"] == 40
+
+
+@pytest.mark.asyncio
+async def test_parsera_astream():
+    extractor = ChunksTabularExtractor(
+        model=FakeModel(), chunk_size=200, token_counter=len, merge_strategy="local"
+    )
+    scraper = Parsera(extractor=extractor, loader=FakeLoader())
+    events = [
+        event
+        async for event in scraper.astream(
+            url="https://example.com", elements={"name": "name"}
+        )
+    ]
+    assert events[-1] == {"type": "end", "chunks": len(events) - 1, "rows": 40}
+
+
+@pytest.mark.asyncio
+async def test_llm_merge_yields_page_at_once():
+    model = FakeModel()
+    extractor = ChunksTabularExtractor(model=model, chunk_size=200, token_counter=len)
+    rows, end = await collect(extractor)
+
+    assert model.merges == 1
+    assert rows["chunk"] == end["chunks"] - 1
+    assert [row["name"] for row in rows["rows"]] == [
+        f"Item {idx:02d}" for idx in range(40)
+    ]
+    assert end["rows"] == 40
+
+
+@pytest.mark.asyncio
+async def test_local_merge_falls_back_before_rows_are_yielded():
+    model = FakeModel(broken_item="Item 00")
+    # Sequential extraction would pass the object to the next chunk as previous data
+    extractor = ChunksTabularExtractor(
+        model=model,
+        chunk_size=200,
+        token_counter=len,
+        chunk_concurrency=2,
+        merge_strategy="local",
+    )
+    *_, rows, end = await collect(extractor)
+
+    assert model.merges == 1
+    assert rows["chunk"] == end["chunks"] - 1
+    assert end["type"] == "end"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("broken_item", "merge_fallback"), [("Item 00", False), ("Item 39", True)]
+)
+async def test_local_merge_error_ends_stream(broken_item, merge_fallback):
+    extractor = ChunksTabularExtractor(
+        model=FakeModel(broken_item=broken_item),
+        chunk_size=200,
+        token_counter=len,
+        merge_strategy="local",
+        merge_fallback=merge_fallback,
+    )
+    events = await collect(extractor)
+
+    assert events[-1]["type"] == "error"
+    last_chunk = events[-1]["chunks"] - 1
+    assert events[-1]["chunk"] == (last_chunk if merge_fallback else 0)